@@ -32,15 +32,28 @@ class Adding5Params:
     repeat = 8
 
     # These are the parameters of this benchmark: n_values to write per
-    # add_results call, n_times to call add_results
+    # add_results call, n_times to call add_results, and whether the rows are
+    # inserted with executemany or with multi-row INSERT statements
     # Dictionary of values is used instead of tuple of lists, because in the
     # latter case asv will run the benchmark for all the combinations of the
     # values
     params = [
-        {'n_values': 10000, 'n_times': 2, 'paramtype': 'array'},
-        {'n_values': 100, 'n_times': 200, 'paramtype': 'array'},
-        {'n_values': 10000, 'n_times': 2, 'paramtype': 'numeric'},
-        {'n_values': 100, 'n_times': 200, 'paramtype': 'numeric'},
+        {'n_values': 10000, 'n_times': 2, 'paramtype': 'array',
+         'use_executemany': False},
+        {'n_values': 100, 'n_times': 200, 'paramtype': 'array',
+         'use_executemany': False},
+        {'n_values': 10000, 'n_times': 2, 'paramtype': 'numeric',
+         'use_executemany': False},
+        {'n_values': 100, 'n_times': 200, 'paramtype': 'numeric',
+         'use_executemany': False},
+        {'n_values': 10000, 'n_times': 2, 'paramtype': 'array',
+         'use_executemany': True},
+        {'n_values': 100, 'n_times': 200, 'paramtype': 'array',
+         'use_executemany': True},
+        {'n_values': 10000, 'n_times': 2, 'paramtype': 'numeric',
+         'use_executemany': True},
+        {'n_values': 100, 'n_times': 200, 'paramtype': 'numeric',
+         'use_executemany': True},
     ]
     # we are less interested in the cpu time used and more interested in
     # the wall clock time used to insert the data so use a timer that measures
@@ -61,6 +74,8 @@ class Adding5Params:
         qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir,
                                                             'temp.db')
         qcodes.config["core"]["db_debug"] = False
+        qcodes.config["core"]["db_use_executemany"] = \
+            bench_param['use_executemany']
         initialise_database()
 
         # Create experiment
@@ -115,9 +130,9 @@ class Adding5Params:
 
         self.parameters = list()
         self.values = list()
+        qcodes.config["core"]["db_use_executemany"] = False
 
-    def time_test(self, bench_param):
-        """Adding data for 5 parameters"""
+    def _add_results(self, bench_param):
         for _ in range(bench_param['n_times']):
             self.datasaver.add_result(
                 (self.parameters[0], self.values[0]),
@@ -129,3 +144,106 @@ class Adding5Params:
         # force writing to database so that it is written before we exit
         # the datasaver context manager
         self.datasaver.flush_data_to_database()
+
+    def time_test(self, bench_param):
+        """Adding data for 5 parameters"""
+        self._add_results(bench_param)
+
+    def track_rows_per_second(self, bench_param):
+        """Number of rows inserted per second when adding data for 5
+        parameters"""
+        if bench_param['paramtype'] == 'array':
+            n_rows = bench_param['n_times']
+        else:
+            n_rows = bench_param['n_times'] * bench_param['n_values']
+        t_start = self.timer()
+        self._add_results(bench_param)
+        return n_rows / (self.timer() - t_start)
+
+    track_rows_per_second.unit = "rows/s"
+
+
+class AddingSweepBlock:
+    """
+    This benchmark measures how much time it takes to add a line of a sweep,
+    computed in one go, to a dataset: either point by point with
+    ``add_result`` or all at once with ``add_results_block``. The results
+    are written to the database before the timing stops.
+    """
+
+    number = 1
+    repeat = 8
+
+    params = ([100, 10000], ['add_result', 'add_results_block'])
+    param_names = ['n_points', 'method']
+
+    timer = time.perf_counter
+
+    def __init__(self):
+        self.parameters = list()
+        self.values = list()
+        self.experiment = None
+        self.runner = None
+        self.datasaver = None
+        self.tmpdir = None
+
+    def setup(self, n_points, method):
+        self.tmpdir = tempfile.mkdtemp()
+        qcodes.config["core"]["db_location"] = os.path.join(self.tmpdir,
+                                                            'temp.db')
+        qcodes.config["core"]["db_debug"] = False
+        initialise_database()
+
+        self.experiment = new_experiment("test-experiment",
+                                         sample_name="test-sample")
+        meas = Measurement(self.experiment)
+
+        x1 = ManualParameter('x1')
+        x2 = ManualParameter('x2')
+        y1 = ManualParameter('y1')
+        y2 = ManualParameter('y2')
+
+        meas.register_parameter(x1)
+        meas.register_parameter(x2)
+        meas.register_parameter(y1, setpoints=[x1, x2])
+        meas.register_parameter(y2, setpoints=[x1, x2])
+
+        self.parameters = [x1, x2, y1, y2]
+        self.values = [np.float64(0.5)] + [np.random.rand(n_points)
+                                           for _ in range(3)]
+
+        # a write period longer than the benchmark such that the results
+        # are only written by the final flush
+        meas.write_period = 1000
+        self.runner = meas.run()
+        self.datasaver = self.runner.__enter__()
+
+    def teardown(self, n_points, method):
+        if self.runner:
+            self.runner.__exit__(None, None, None)
+            self.runner = None
+            self.datasaver = None
+
+        if self.experiment:
+            self.experiment.conn.close()
+            self.experiment = None
+
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir)
+            self.tmpdir = None
+
+        self.parameters = list()
+        self.values = list()
+
+    def time_add_sweep_line(self, n_points, method):
+        x1, x2, y1, y2 = self.parameters
+        x1_value, x2_values, y1_values, y2_values = self.values
+        if method == 'add_result':
+            for x2_value, y1_value, y2_value in zip(x2_values, y1_values,
+                                                    y2_values):
+                self.datasaver.add_result((x1, x1_value), (x2, x2_value),
+                                          (y1, y1_value), (y2, y2_value))
+        else:
+            self.datasaver.add_results_block((x1, x1_value), (x2, x2_values),
+                                             (y1, y1_values), (y2, y2_values))
+        self.datasaver.flush_data_to_database()
@@ -0,0 +1,78 @@
+"""
+This module contains code used for benchmarking the overhead of getting and
+setting software parameters, i.e. the time spent in QCoDeS itself rather
+than in communicating with instruments.
+"""
+import time
+
+from qcodes import DelegateParameter, Parameter, ScaledParameter
+
+
+class ParameterGetSet:
+    """
+    This benchmark measures the time it takes to get and set a parameter
+    without an instrument. Parametrization is used to measure plain
+    parameters as well as parameters with conversions (scale and offset, and
+    val_mapping) and the ``DelegateParameter`` and ``ScaledParameter``
+    wrappers.
+    """
+
+    # each timing consists of many gets or sets, such that the time per
+    # call is in the range of what asv can measure reliably
+    n_calls = 10000
+
+    params = ['plain', 'scale_offset', 'val_mapping', 'delegate', 'scaled']
+    param_names = ['kind']
+
+    def setup(self, kind):
+        if kind == 'plain':
+            self.parameter = Parameter('p', set_cmd=None, get_cmd=None,
+                                       initial_value=1)
+        elif kind == 'scale_offset':
+            self.parameter = Parameter('p', set_cmd=None, get_cmd=None,
+                                       scale=2, offset=0.5, initial_value=1)
+        elif kind == 'val_mapping':
+            self.parameter = Parameter('p', set_cmd=None, get_cmd=None,
+                                       val_mapping={0: 'OFF', 1: 'ON'},
+                                       initial_value=1)
+        elif kind == 'delegate':
+            source = Parameter('source', set_cmd=None, get_cmd=None,
+                               initial_value=1)
+            self.parameter = DelegateParameter('p', source=source)
+        elif kind == 'scaled':
+            source = Parameter('source', set_cmd=None, get_cmd=None,
+                               initial_value=1)
+            self.parameter = ScaledParameter(source, gain=2)
+        else:
+            raise ValueError(f'Unknown parameter kind {kind}')
+
+    def time_get(self, kind):
+        get = self.parameter.get
+        for _ in range(self.n_calls):
+            get()
+
+    def time_set(self, kind):
+        set_ = self.parameter.set
+        for _ in range(self.n_calls):
+            set_(1)
+
+    def time_cache_get(self, kind):
+        cache_get = self.parameter.cache.get
+        for _ in range(self.n_calls):
+            cache_get()
+
+    def track_gets_per_second(self, kind):
+        return self._calls_per_second(self.parameter.get)
+
+    track_gets_per_second.unit = "gets/s"
+
+    def track_sets_per_second(self, kind):
+        return self._calls_per_second(lambda: self.parameter.set(1))
+
+    track_sets_per_second.unit = "sets/s"
+
+    def _calls_per_second(self, function):
+        t_start = time.perf_counter()
+        for _ in range(self.n_calls):
+            function()
+        return self.n_calls / (time.perf_counter() - t_start)
@@ -0,0 +1,53 @@
+"""
+This module contains code used for benchmarking the serialization of
+snapshots to JSON, in particular of snapshots that contain large
+array-valued parameters.
+"""
+import json
+
+import numpy as np
+
+from qcodes.utils.helpers import NumpyJSONEncoder, SnapshotJSONEncoder
+
+
+class SnapshotToJSON:
+    """
+    This benchmark measures the time it takes to serialize a snapshot of an
+    instrument with many scalar parameters and a few real and complex
+    array-valued parameters. Parametrization is used to alter the size of the
+    arrays and the encoder: the existing ``NumpyJSONEncoder``, the
+    ``SnapshotJSONEncoder`` that serializes arrays in full and the
+    ``SnapshotJSONEncoder`` that summarizes arrays larger than 1000 elements.
+    """
+
+    params = ([100, 10000, 1000000],
+              ['numpy', 'snapshot', 'snapshot_summarized'])
+    param_names = ['array_size', 'encoder']
+
+    def setup(self, array_size, encoder):
+        parameters = {f'p{i}': {'value': np.float32(i), 'unit': 'V',
+                                'label': f'Parameter {i}'}
+                      for i in range(200)}
+        parameters['trace'] = {'value': np.linspace(0, 1, array_size)}
+        parameters['waveform'] = {
+            'value': np.exp(1j * np.linspace(0, 1, array_size))}
+        self.snapshot = {'station': {'instruments': {
+            'instrument': {'parameters': parameters}}}}
+
+        if encoder == 'numpy':
+            self.kwargs = {'cls': NumpyJSONEncoder}
+        elif encoder == 'snapshot':
+            self.kwargs = {'cls': SnapshotJSONEncoder}
+        elif encoder == 'snapshot_summarized':
+            self.kwargs = {'cls': SnapshotJSONEncoder,
+                           'max_array_size': 1000}
+        else:
+            raise ValueError(f'Unknown encoder {encoder}')
+
+    def time_dumps(self, array_size, encoder):
+        json.dumps(self.snapshot, **self.kwargs)
+
+    def track_json_size(self, array_size, encoder):
+        return len(json.dumps(self.snapshot, **self.kwargs))
+
+    track_json_size.unit = "characters"
@@ -61,7 +61,7 @@ if haswebsockets:
 
 
 from qcodes.instrument.base import Instrument, find_or_create_instrument
-from qcodes.instrument.ip import IPInstrument
+from qcodes.instrument.ip import IPConnectionPool, IPInstrument
 from qcodes.instrument.visa import VisaInstrument
 from qcodes.instrument.channel import InstrumentChannel, ChannelList
 from qcodes.instrument.function import Function
@@ -74,7 +74,8 @@ from qcodes.instrument.parameter import (
     ManualParameter,
     ScaledParameter,
     combine,
-    CombinedParameter)
+    CombinedParameter,
+    deferred_post_delays)
 from qcodes.instrument.sweep_values import SweepFixedValues, SweepValues
 
 from qcodes.utils import validators
@@ -0,0 +1,334 @@
+"""
+This module contains an exporter that writes the data of a
+:class:`.DataSet` to a chunked binary store on disk and a loader that maps
+such a store back lazily, such that runs larger than the available memory
+can be analyzed.
+
+The store is a directory holding a ``meta.json`` file with the run
+description, snapshot and the layout of the data, and one directory per
+parameter tree with one directory per parameter that contains the chunks of
+the data of that parameter as ``.npy`` files. Optionally the chunks are
+compressed with zlib. Uncompressed chunks are memory mapped when loaded,
+compressed chunks are decompressed when they are accessed.
+"""
+import io
+import json
+import os
+import zlib
+from typing import (TYPE_CHECKING, Any, Dict, List, Optional, Sequence,
+                    Tuple)
+
+import numpy as np
+
+from qcodes.dataset.descriptions.rundescriber import RunDescriber
+from qcodes.dataset.descriptions.versioning import serialization as serial
+from qcodes.dataset.sqlite.queries import \
+    iter_parameter_data_chunks_for_one_paramtree
+
+if TYPE_CHECKING:
+    from .data_set import DataSet
+
+STORE_FORMAT = 'qcodes_chunked_store'
+STORE_VERSION = 1
+_META_FILE = 'meta.json'
+
+
+class ChunkedArray:
+    """
+    A read only array whose data is stored in chunks along the first axis
+    in a chunked store on disk. Chunks are only read when the data in them
+    is accessed. Indexing returns numpy arrays (memory mapped views if the
+    selection lies within one uncompressed chunk) and ``np.asarray`` loads
+    the whole array into memory.
+
+    Args:
+        chunk_paths: paths to the files holding the chunks in order
+        chunk_lengths: number of rows in each chunk
+        dtype: the dtype of the array
+        inner_shape: the shape of the array except for the first axis
+        compressed: whether the chunks are compressed with zlib
+    """
+
+    def __init__(self,
+                 chunk_paths: Sequence[str],
+                 chunk_lengths: Sequence[int],
+                 dtype: np.dtype,
+                 inner_shape: Tuple[int, ...],
+                 compressed: bool):
+        self._chunk_paths = list(chunk_paths)
+        self._chunk_starts = np.cumsum([0] + list(chunk_lengths))
+        self._compressed = compressed
+        self._cached_chunk: Optional[Tuple[int, np.ndarray]] = None
+        self.dtype = np.dtype(dtype)
+        self.shape = (int(self._chunk_starts[-1]),) + tuple(inner_shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def n_chunks(self) -> int:
+        return len(self._chunk_paths)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (f"ChunkedArray(shape={self.shape}, dtype={self.dtype}, "
+                f"n_chunks={self.n_chunks})")
+
+    def chunk(self, index: int) -> np.ndarray:
+        """
+        Get the data of one chunk.
+        """
+        if self._cached_chunk is not None and \
+                self._cached_chunk[0] == index:
+            return self._cached_chunk[1]
+        path = self._chunk_paths[index]
+        if self._compressed:
+            with open(path, 'rb') as f:
+                raw = zlib.decompress(f.read())
+            data = np.load(io.BytesIO(raw), allow_pickle=False)
+            # keep the last decompressed chunk around since consecutive
+            # accesses typically hit the same chunk
+            self._cached_chunk = (index, data)
+        else:
+            data = np.load(path, mmap_mode='r', allow_pickle=False)
+        return data
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if isinstance(key, tuple):
+            first, rest = (key[0], key[1:]) if len(key) else (slice(None), ())
+        else:
+            first, rest = key, ()
+
+        if isinstance(first, (int, np.integer)):
+            index = int(first)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"index {first} is out of bounds for axis 0 "
+                                 f"with size {len(self)}")
+            chunk_index = int(np.searchsorted(self._chunk_starts, index,
+                                              side='right')) - 1
+            row = self.chunk(chunk_index)[
+                index - self._chunk_starts[chunk_index]]
+            return row[rest] if rest else row
+
+        if isinstance(first, slice):
+            start, stop, step = first.indices(len(self))
+            if step != 1:
+                return self[start:stop][(slice(None, None, step),) + rest]
+            parts = []
+            for chunk_index in range(self.n_chunks):
+                chunk_start = self._chunk_starts[chunk_index]
+                chunk_stop = self._chunk_starts[chunk_index + 1]
+                if chunk_stop <= start or chunk_start >= stop:
+                    continue
+                parts.append(self.chunk(chunk_index)[
+                    max(start - chunk_start, 0):
+                    min(stop, chunk_stop) - chunk_start])
+            if len(parts) == 0:
+                data = np.empty((0,) + self.shape[1:], dtype=self.dtype)
+            elif len(parts) == 1:
+                data = parts[0]
+            else:
+                data = np.concatenate(parts)
+            return data[(slice(None),) + rest] if rest else data
+
+        # fancy indexing along the first axis
+        return np.asarray(self)[(first,) + rest]
+
+    def __array__(self, dtype: Optional[np.dtype] = None) -> np.ndarray:
+        data = np.asarray(self[:])
+        return data if dtype is None else data.astype(dtype)
+
+
+class ChunkedStore:
+    """
+    A run loaded lazily from a chunked store, see
+    :func:`load_from_chunked_store`.
+
+    Attributes:
+        description: The :class:`.RunDescriber` of the run.
+        snapshot_raw: The snapshot of the run as a JSON string, None if the
+            run has no snapshot.
+        data: Dictionary from the dependent parameters to dictionaries
+            from the names of the parameters of that parameter tree to
+            :class:`ChunkedArray` s, in the same layout as
+            :meth:`.DataSet.get_parameter_data`.
+    """
+
+    def __init__(self,
+                 path: str,
+                 meta: Dict[str, Any],
+                 data: Dict[str, Dict[str, ChunkedArray]]):
+        self.path = path
+        self.run_id: int = meta['run_id']
+        self.guid: str = meta['guid']
+        self.description: RunDescriber = serial.from_json_to_current(
+            meta['description'])
+        self.snapshot_raw: Optional[str] = meta['snapshot']
+        self.data = data
+
+    @property
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        The snapshot of the run as a dictionary, None if it has none.
+        """
+        if self.snapshot_raw is None:
+            return None
+        return json.loads(self.snapshot_raw)
+
+    def __repr__(self) -> str:
+        return (f"ChunkedStore(path={self.path!r}, run_id={self.run_id}, "
+                f"guid={self.guid!r})")
+
+
+def export_to_chunked_store(dataset: 'DataSet',
+                            path: str,
+                            chunk_size: int = 10000,
+                            compress: bool = False) -> None:
+    """
+    Write the data of a dataset to a chunked store in a new directory. The
+    data is read from the database one chunk at a time, such that runs
+    larger than the available memory can be exported.
+
+    Args:
+        dataset: The dataset to export.
+        path: Path of the directory to create.
+        chunk_size: Number of rows (results) per chunk.
+        compress: Compress the chunks with zlib. Compressed chunks can not be
+            memory mapped when loading the store.
+
+    Raises:
+        FileExistsError: If the directory already exists.
+        ValueError: If the data of a parameter can not be stored in a
+            regular array, e.g. arrays of varying length or arrays whose
+            shape or dtype changes during the run.
+    """
+    os.makedirs(path, exist_ok=False)
+    description = dataset.description
+    extension = '.npy.zlib' if compress else '.npy'
+
+    layout: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for tree in description.interdeps.non_dependencies:
+        chunk_lengths: List[int] = []
+        tree_layout: Dict[str, Dict[str, Any]] = {}
+        chunks = iter_parameter_data_chunks_for_one_paramtree(
+            dataset.conn, dataset.table_name, description, tree.name,
+            chunk_size)
+        for chunk_index, chunk in enumerate(chunks):
+            chunk_lengths.append(_n_rows(chunk))
+            for name, values in chunk.items():
+                if values.dtype == np.dtype('O'):
+                    raise ValueError(f"Cannot export {name} of {tree.name} "
+                                     f"to a chunked store, its values do not "
+                                     f"form a regular array.")
+                param_dir = os.path.join(path, tree.name, name)
+                if chunk_index == 0:
+                    os.makedirs(param_dir)
+                    tree_layout[name] = {'dtype': values.dtype.str,
+                                         'inner_shape': values.shape[1:]}
+                else:
+                    tree_layout[name]['dtype'] = _check_chunk_layout(
+                        tree.name, name, tree_layout[name], values).str
+                chunk_path = os.path.join(
+                    param_dir, f'chunk_{chunk_index:06d}{extension}')
+                _write_chunk(chunk_path, values, compress)
+        for param_layout in tree_layout.values():
+            param_layout['chunk_lengths'] = chunk_lengths
+        layout[tree.name] = tree_layout
+
+    meta = {'format': STORE_FORMAT,
+            'version': STORE_VERSION,
+            'run_id': dataset.run_id,
+            'guid': dataset.guid,
+            'description': serial.to_json_for_storage(description),
+            'snapshot': dataset.snapshot_raw,
+            'compressed': compress,
+            'extension': extension,
+            'parameters': layout}
+    # the meta file is written last such that an interrupted export is not
+    # mistaken for a complete one
+    with open(os.path.join(path, _META_FILE), 'w') as f:
+        json.dump(meta, f)
+
+
+def load_from_chunked_store(path: str) -> ChunkedStore:
+    """
+    Load a run from a chunked store written by
+    :func:`export_to_chunked_store`. No data is read until it is accessed.
+
+    Args:
+        path: Path of the directory of the store.
+
+    Raises:
+        ValueError: If the directory does not hold a complete chunked store.
+    """
+    meta_path = os.path.join(path, _META_FILE)
+    if not os.path.isfile(meta_path):
+        raise ValueError(f"{path} does not contain a complete chunked store.")
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta.get('format') != STORE_FORMAT:
+        raise ValueError(f"{path} does not contain a chunked store.")
+    if meta['version'] > STORE_VERSION:
+        raise ValueError(f"Cannot load chunked store of version "
+                         f"{meta['version']}, the newest supported version "
+                         f"is {STORE_VERSION}.")
+
+    data: Dict[str, Dict[str, ChunkedArray]] = {}
+    for tree_name, tree_layout in meta['parameters'].items():
+        data[tree_name] = {}
+        for name, param_layout in tree_layout.items():
+            chunk_lengths = param_layout['chunk_lengths']
+            chunk_paths = [
+                os.path.join(path, tree_name, name,
+                             f"chunk_{i:06d}{meta['extension']}")
+                for i in range(len(chunk_lengths))]
+            data[tree_name][name] = ChunkedArray(
+                chunk_paths, chunk_lengths,
+                np.dtype(param_layout['dtype']),
+                tuple(param_layout['inner_shape']),
+                meta['compressed'])
+    return ChunkedStore(path, meta, data)
+
+
+def _check_chunk_layout(tree_name: str, name: str,
+                        param_layout: Dict[str, Any],
+                        values: np.ndarray) -> np.dtype:
+    """
+    Check that a chunk of the values of a parameter matches the shape and
+    dtype of the previous chunks and return the dtype of all chunks. Only
+    strings may differ in length between chunks, the longest length is
+    used for all chunks then.
+    """
+    inner_shape = tuple(param_layout['inner_shape'])
+    if values.shape[1:] != inner_shape:
+        raise ValueError(f"Cannot export {name} of {tree_name} to a chunked "
+                         f"store, the shape of its values changes from "
+                         f"{inner_shape} to {values.shape[1:]} during the "
+                         f"run.")
+    dtype = np.dtype(param_layout['dtype'])
+    if values.dtype == dtype:
+        return dtype
+    if dtype.kind == values.dtype.kind and dtype.kind in 'SU':
+        return np.result_type(dtype, values.dtype)
+    raise ValueError(f"Cannot export {name} of {tree_name} to a chunked "
+                     f"store, the dtype of its values changes from {dtype} "
+                     f"to {values.dtype} during the run.")
+
+
+def _n_rows(chunk: Dict[str, np.ndarray]) -> int:
+    return len(next(iter(chunk.values())))
+
+
+def _write_chunk(path: str, values: np.ndarray, compress: bool) -> None:
+    if compress:
+        buffer = io.BytesIO()
+        np.save(buffer, values, allow_pickle=False)
+        with open(path, 'wb') as f:
+            f.write(zlib.compress(buffer.getvalue()))
+    else:
+        np.save(path, values, allow_pickle=False)
@@ -7,7 +7,7 @@ import time
 import uuid
 from dataclasses import dataclass
 from queue import Empty, Queue
-from threading import Thread
+from threading import Event, Thread
 from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Mapping,
                     Optional, Sequence, Set, Sized, Tuple, Union)
 
@@ -28,10 +28,12 @@ from qcodes.dataset.linked_datasets.links import (Link, links_to_str,
                                                   str_to_links)
 from qcodes.dataset.sqlite.connection import (ConnectionPlus, atomic,
                                               atomic_transaction, transaction)
-from qcodes.dataset.sqlite.database import (conn_from_dbpath_or_conn, connect,
+from qcodes.dataset.sqlite.database import (adapt_arrays_to_format,
+                                            conn_from_dbpath_or_conn, connect,
                                             get_DB_location)
 from qcodes.dataset.sqlite.queries import (
-    add_meta_data, add_parameter, completed, create_run,
+    SetpointRanges, add_meta_data, add_parameter, column_values_to_array,
+    completed, create_run, create_setpoint_indices,
     get_completed_timestamp_from_run_id,
     get_experiment_name_from_experiment_id, get_guid_from_run_id,
     get_guids_from_run_spec, get_last_experiment, get_metadata,
@@ -44,6 +46,8 @@ from qcodes.dataset.sqlite.query_helpers import (VALUE, VALUES,
                                                  insert_many_values,
                                                  insert_values, length, one,
                                                  select_one_where)
+from qcodes.dataset.sqlite.snapshot_store import (resolve_snapshot_raw,
+                                                  store_snapshot)
 from qcodes.instrument.parameter import _BaseParameter
 from qcodes.utils.deprecate import deprecate
 
@@ -99,15 +103,13 @@ class DataPathException(Exception):
     pass
 
 
-class _Subscriber(Thread):
+class _BaseSubscriber(Thread):
     """
-    Class to add a subscriber to a :class:`.DataSet`. The subscriber gets called every
-    time an insert is made to the results_table.
-
-    The _Subscriber is not meant to be instantiated directly, but rather used
-    via the 'subscribe' method of the :class:`.DataSet`.
-
-    NOTE: A subscriber should be added *after* all parameters have been added.
+    Base class of the subscribers of a :class:`.DataSet`. Subclasses put the
+    data they are notified of in the ``data_queue`` via :meth:`_enqueue`.
+    The thread of the subscriber calls the callback with the queued data
+    whenever at least ``min_queue_length`` results are queued, and a last
+    time when the :class:`.DataSet` is completed.
 
     NOTE: Special care shall be taken when using the *state* object: it is the
     user's responsibility to operate with it in a thread-safe way.
@@ -143,29 +145,12 @@ class _Subscriber(Thread):
         else:
             self.callback = functools.partial(callback, **callback_kwargs)
 
-        self.callback_id = f"callback{self._id}"
-        self.trigger_id = f"sub{self._id}"
-
-        conn = dataSet.conn
-
-        conn.create_function(self.callback_id, -1, self._cache_data_to_queue)
+        self.log = logging.getLogger(f"{type(self).__name__} {self._id}")
 
-        parameters = dataSet.get_parameters()
-        sql_param_list = ",".join([f"NEW.{p.name}" for p in parameters])
-        sql_create_trigger_for_callback = f"""
-        CREATE TRIGGER {self.trigger_id}
-            AFTER INSERT ON '{self.table_name}'
-        BEGIN
-            SELECT {self.callback_id}({sql_param_list});
-        END;"""
-        atomic_transaction(conn, sql_create_trigger_for_callback)
-
-        self.log = logging.getLogger(f"_Subscriber {self._id}")
-
-    def _cache_data_to_queue(self, *args: Any) -> None:
-        self.data_queue.put(args)
-        self._data_set_len += 1
-        self._queue_length += 1
+    def _enqueue(self, data: Any, n_results: int) -> None:
+        self.data_queue.put(data)
+        self._data_set_len += n_results
+        self._queue_length += n_results
 
     def run(self) -> None:
         self.log.debug("Starting subscriber")
@@ -181,9 +166,21 @@ class _Subscriber(Thread):
                 break
         return result_list
 
+    def _callback_data(self, result_list: List) -> Any:
+        """
+        Convert the data taken from the queue into the first argument of
+        the callback.
+        """
+        return result_list
+
     def _call_callback_on_queue_data(self) -> None:
         result_list = self._exhaust_queue(self.data_queue)
-        self.callback(result_list, self._data_set_len, self.state)
+        self._queue_length = 0
+        self.callback(self._callback_data(result_list), self._data_set_len,
+                      self.state)
+
+    def _wait_for_data(self) -> None:
+        time.sleep(self._loop_sleep_time)
 
     def _loop(self) -> None:
         while True:
@@ -193,9 +190,8 @@ class _Subscriber(Thread):
 
             if self._queue_length >= self.min_queue_length:
                 self._call_callback_on_queue_data()
-                self._queue_length = 0
 
-            time.sleep(self._loop_sleep_time)
+            self._wait_for_data()
 
             if self.dataSet.completed:
                 self._call_callback_on_queue_data()
@@ -213,16 +209,239 @@ class _Subscriber(Thread):
         self.log.debug("Stopped subscriber")
 
 
+class _Subscriber(_BaseSubscriber):
+    """
+    Class to add a subscriber to a :class:`.DataSet`. The subscriber gets called every
+    time an insert is made to the results_table.
+
+    The _Subscriber is not meant to be instantiated directly, but rather used
+    via the 'subscribe' method of the :class:`.DataSet`.
+
+    NOTE: A subscriber should be added *after* all parameters have been added.
+
+    NOTE: Special care shall be taken when using the *state* object: it is the
+    user's responsibility to operate with it in a thread-safe way.
+    """
+    def __init__(self,
+                 dataSet: 'DataSet',
+                 id_: str,
+                 callback: Callable[..., None],
+                 state: Optional[Any] = None,
+                 loop_sleep_time: int = 0,  # in milliseconds
+                 min_queue_length: int = 1,
+                 callback_kwargs: Optional[Mapping[str, Any]] = None
+                 ) -> None:
+        super().__init__(dataSet, id_, callback, state, loop_sleep_time,
+                         min_queue_length, callback_kwargs)
+
+        self.callback_id = f"callback{self._id}"
+        self.trigger_id = f"sub{self._id}"
+
+        conn = dataSet.conn
+
+        conn.create_function(self.callback_id, -1, self._cache_data_to_queue)
+
+        parameters = dataSet.get_parameters()
+        sql_param_list = ",".join([f"NEW.{p.name}" for p in parameters])
+        sql_create_trigger_for_callback = f"""
+        CREATE TRIGGER {self.trigger_id}
+            AFTER INSERT ON '{self.table_name}'
+        BEGIN
+            SELECT {self.callback_id}({sql_param_list});
+        END;"""
+        atomic_transaction(conn, sql_create_trigger_for_callback)
+
+    def _cache_data_to_queue(self, *args: Any) -> None:
+        self._enqueue(args, 1)
+
+
+class _InProcessSubscriber(_BaseSubscriber):
+    """
+    Class to add an in-process subscriber to a :class:`.DataSet`. Rather than
+    being notified by a database trigger for every inserted row, the
+    subscriber receives each block of results passed to
+    :meth:`.DataSet.add_results` directly, before it is written to the
+    database.
+
+    The callback is called as ``callback(columns, length, state)`` where
+    ``columns`` is a dict from parameter names to numpy arrays holding the
+    values of all results received since the previous call (one row per
+    result) and ``length`` is the total number of results received.
+
+    The _InProcessSubscriber is not meant to be instantiated directly, but
+    rather used via the 'subscribe' method of the :class:`.DataSet` with
+    ``in_process=True``. Since no trigger is involved it only receives the
+    results added via this :class:`.DataSet` object, use a regular subscriber
+    to follow inserts made through other connections.
+
+    Rather than polling, the thread of the subscriber sleeps until results
+    are published. The pending results are delivered when the subscriber is
+    stopped.
+
+    NOTE: Special care shall be taken when using the *state* object: it is the
+    user's responsibility to operate with it in a thread-safe way.
+    """
+    def __init__(self,
+                 dataSet: 'DataSet',
+                 id_: str,
+                 callback: Callable[..., None],
+                 state: Optional[Any] = None,
+                 loop_sleep_time: int = 0,  # in milliseconds
+                 min_queue_length: int = 1,
+                 callback_kwargs: Optional[Mapping[str, Any]] = None
+                 ) -> None:
+        super().__init__(dataSet, id_, callback, state, loop_sleep_time,
+                         min_queue_length, callback_kwargs)
+        self._wake_up = Event()
+
+    def publish(self, columns: Dict[str, numpy.ndarray], n_rows: int) -> None:
+        """
+        Hand a block of ``n_rows`` results given as column arrays over to
+        the subscriber.
+        """
+        self._enqueue(columns, n_rows)
+        self._wake_up.set()
+
+    def _wait_for_data(self) -> None:
+        self._wake_up.wait()
+        self._wake_up.clear()
+        time.sleep(self._loop_sleep_time)
+
+    def _callback_data(self, result_list: List) -> Dict[str, numpy.ndarray]:
+        if len(result_list) == 1:
+            return result_list[0]
+        return _concatenate_columns(result_list)
+
+    def _call_callback_on_queue_data(self) -> None:
+        if not self.data_queue.empty():
+            super()._call_callback_on_queue_data()
+
+    def done_callback(self) -> None:
+        """
+        Deliver all pending results to the callback and stop the subscriber.
+        """
+        self.schedule_stop()
+        self.join()
+
+    def schedule_stop(self) -> None:
+        super().schedule_stop()
+        self._wake_up.set()
+
+    def _clean_up(self) -> None:
+        self._call_callback_on_queue_data()
+        super()._clean_up()
+
+
+def _results_to_columns(keys: Sequence[str],
+                        values: Sequence[Sequence[Any]]
+                        ) -> Dict[str, numpy.ndarray]:
+    """
+    Convert rows of results to a dict from the names of the parameters in
+    ``keys`` to numpy arrays of their values.
+    """
+    return {key: column_values_to_array([row[i] for row in values], None)
+            for i, key in enumerate(keys)}
+
+
+def _column_to_list(column: numpy.ndarray) -> List[Any]:
+    """
+    The values of a column array as a list with one element per row. One
+    dimensional columns are converted to python scalars in bulk, the rows of
+    higher dimensional (array valued) columns are kept as numpy arrays.
+    """
+    if column.ndim == 1:
+        return column.tolist()
+    return list(column)
+
+
+def _concatenate_columns(blocks: Sequence[Mapping[str, numpy.ndarray]]
+                         ) -> Dict[str, numpy.ndarray]:
+    """
+    Concatenate blocks of column arrays, filling in ``None`` for the rows of
+    blocks that do not contain a given parameter.
+    """
+    names: Dict[str, None] = {}
+    for block in blocks:
+        names.update(dict.fromkeys(block))
+    columns = {}
+    for name in names:
+        parts = []
+        for block in blocks:
+            if name in block:
+                parts.append(block[name])
+            else:
+                n_rows = len(next(iter(block.values())))
+                parts.append(numpy.full(n_rows, None, dtype=object))
+        try:
+            columns[name] = numpy.concatenate(parts)
+        except ValueError:
+            # the shapes of array valued results differ between blocks
+            rows = [row for part in parts for row in part]
+            column = numpy.empty(len(rows), dtype=object)
+            for i, row in enumerate(rows):
+                column[i] = row
+            columns[name] = column
+    return columns
+
+
+@dataclass
+class _BackgroundWriterMetrics:
+    """
+    Metrics of the commits performed by a :class:`_BackgroundWriter`.
+    Latencies are given in seconds.
+    """
+    batches_committed: int = 0
+    items_written: int = 0
+    items_failed: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_commit_latency: float = 0.0
+    max_commit_latency: float = 0.0
+    total_commit_time: float = 0.0
+
+
 class _BackgroundWriter(Thread):
     """
     Write the results from the DataSet's dataqueue in a new thread
+
+    All items pending in the queue are drained and the results are written,
+    grouped per table, in a single transaction. After having received an
+    item the writer waits at most ``max_latency`` seconds for more items to
+    arrive and puts at most ``max_batch_size`` items in one transaction.
+    Both default to the values of ``core.db_writer_max_latency`` and
+    ``core.db_writer_max_batch_size`` in the config.
+
+    If the transaction of a batch fails, the items of the batch are written
+    again one by one, each in its own transaction, such that only the
+    results of the failing items are lost. Their errors are logged.
     """
 
-    def __init__(self, queue: Queue, conn: ConnectionPlus):
+    def __init__(self, queue: Queue, conn: ConnectionPlus,
+                 max_batch_size: Optional[int] = None,
+                 max_latency: Optional[float] = None):
         super().__init__(daemon=True)
         self.queue = queue
         self.path = conn.path_to_dbfile
         self.keep_writing = True
+        if max_batch_size is None:
+            max_batch_size = qcodes.config["core"]["db_writer_max_batch_size"]
+        if max_latency is None:
+            max_latency = qcodes.config["core"]["db_writer_max_latency"]
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, "
+                             f"got {max_batch_size}")
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.metrics = _BackgroundWriterMetrics()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The approximate number of items waiting in the queue to be written.
+        """
+        return self.queue.qsize()
 
     def run(self) -> None:
 
@@ -230,20 +449,114 @@ class _BackgroundWriter(Thread):
 
         while self.keep_writing:
 
-            item = self.queue.get()
-            if item['keys'] == 'stop':
-                self.keep_writing = False
-                self.conn.close()
-            elif item['keys'] == 'finalize':
-                _WRITERS[self.path].active_datasets.remove(item['values'])
+            items = self._get_batch()
+            try:
+                self._write_batch(items)
+            finally:
+                for item in items:
+                    if item['keys'] == 'stop':
+                        self.keep_writing = False
+                        self.conn.close()
+                    elif item['keys'] == 'finalize':
+                        _WRITERS[self.path].active_datasets.discard(
+                            item['values'])
+                # always mark the items as done, otherwise joining the
+                # queue when flushing or completing a dataset hangs
+                for _ in items:
+                    self.queue.task_done()
+
+    def _get_batch(self) -> List[Dict[str, Any]]:
+        """
+        Block until an item is available and collect it along with the
+        items that are already pending or arrive within ``max_latency``.
+        """
+        items = [self.queue.get()]
+        self.metrics.last_queue_depth = self.queue_depth + 1
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth,
+                                           self.metrics.last_queue_depth)
+        deadline = time.perf_counter() + self.max_latency
+        while (len(items) < self.max_batch_size
+               and items[-1]['keys'] != 'stop'):
+            timeout = deadline - time.perf_counter()
+            try:
+                if timeout > 0:
+                    items.append(self.queue.get(timeout=timeout))
+                else:
+                    items.append(self.queue.get(block=False))
+            except Empty:
+                break
+        return items
+
+    def _write_batch(self, items: Sequence[Dict[str, Any]]) -> None:
+        """
+        Write the results of all the items in one transaction. Consecutive
+        results for the same table and keys are inserted in one go; the
+        order of the results within each table is preserved.
+        """
+        groups: Dict[str, List[Tuple[List[str], List[List[Any]]]]] = {}
+        results = [item for item in items
+                   if item['keys'] not in ('stop', 'finalize')]
+        n_results = len(results)
+        for item in results:
+            table_groups = groups.setdefault(item['table_name'], [])
+            if table_groups and table_groups[-1][0] == item['keys']:
+                table_groups[-1][1].extend(item['values'])
             else:
-                self.write_results(item['keys'], item['values'], item['table_name'])
-            self.queue.task_done()
+                table_groups.append((list(item['keys']),
+                                     list(item['values'])))
+        if n_results == 0:
+            return
+
+        t_start = time.perf_counter()
+        try:
+            with atomic(self.conn):
+                for table_name, table_groups in groups.items():
+                    for keys, values in table_groups:
+                        self.write_results(keys, values, table_name)
+        except Exception:
+            log.exception(f"Could not write a batch of {n_results} "
+                          f"results, writing them one by one instead")
+            n_failed = self._write_items_one_by_one(results)
+        else:
+            n_failed = 0
+        latency = time.perf_counter() - t_start
+
+        metrics = self.metrics
+        metrics.batches_committed += 1
+        metrics.items_written += n_results - n_failed
+        metrics.items_failed += n_failed
+        metrics.last_batch_size = n_results
+        metrics.max_batch_size = max(metrics.max_batch_size, n_results)
+        metrics.last_commit_latency = latency
+        metrics.max_commit_latency = max(metrics.max_commit_latency, latency)
+        metrics.total_commit_time += latency
+        log.debug(f"Committed {n_results} results to {len(groups)} "
+                  f"table(s) in {latency:.6f} s")
+
+    def _write_items_one_by_one(self, items: Sequence[Dict[str, Any]]
+                                ) -> int:
+        """
+        Write the results of each item in its own transaction, logging the
+        errors of the items that fail. Returns the number of failed items.
+        """
+        n_failed = 0
+        for item in items:
+            try:
+                with atomic(self.conn):
+                    self.write_results(item['keys'], item['values'],
+                                       item['table_name'])
+            except Exception:
+                n_failed += 1
+                log.exception(f"Could not write results to "
+                              f"{item['table_name']}, they are lost")
+        return n_failed
 
     def write_results(self, keys: Sequence[str],
                       values: Sequence[List[Any]],
                       table_name: str) -> None:
-        insert_many_values(self.conn, table_name, keys, values)
+        insert_many_values(
+            self.conn, table_name, keys, values,
+            use_executemany=qcodes.config["core"]["db_use_executemany"])
 
     def shutdown(self) -> None:
         """
@@ -290,7 +603,8 @@ class DataSet(Sized):
                  specs: Optional[SpecsOrInterDeps] = None,
                  values: Optional[VALUES] = None,
                  metadata: Optional[Mapping[str, Any]] = None,
-                 shapes: Optional[Shapes] = None) -> None:
+                 shapes: Optional[Shapes] = None,
+                 array_format: str = 'npy') -> None:
         """
         Create a new :class:`.DataSet` object. The object can either hold a new run or
         an already existing run. If a ``run_id`` is provided, then an old run is
@@ -319,15 +633,23 @@ class DataSet(Sized):
                 of the data captured as a list of integers. The list is in the
                 same order as the interdependencies or paramspecs provided.
                 Ignored if ``run_id`` is provided.
+            array_format: The format used to store array type parameters,
+                either ``'npy'`` (default) or ``'raw'``. The raw format stores
+                the data buffer of the array along with its dtype and shape
+                and is considerably faster to write and read back. Ignored
+                if ``run_id`` is provided.
         """
         self.conn = conn_from_dbpath_or_conn(conn, path_to_db)
 
         self._debug = False
-        self.subscribers: Dict[str, _Subscriber] = {}
+        self.subscribers: Dict[str, Union[_Subscriber,
+                                          _InProcessSubscriber]] = {}
         self._parent_dataset_links: List[Link]
         #: In memory representation of the data in the dataset.
         self.cache: DataSetCache = DataSetCache(self)
-        self._results: List[Dict[str, VALUE]] = []
+        #: Results enqueued by a :class:`.DataSaver` but not yet written to
+        #: the database, as blocks of column arrays (see ``_enqueue_results``)
+        self._results: List[Dict[str, numpy.ndarray]] = []
 
         if run_id is not None:
             if not run_exists(self.conn, run_id):
@@ -372,7 +694,8 @@ class DataSet(Sized):
 
             self.set_interdependencies(
                 interdeps=interdeps,
-                shapes=shapes)
+                shapes=shapes,
+                array_format=array_format)
 
             self._metadata = get_metadata_from_run_id(self.conn, self.run_id)
             self._parent_dataset_links = []
@@ -425,8 +748,9 @@ class DataSet(Sized):
     @property
     def snapshot_raw(self) -> Optional[str]:
         """Snapshot of the run as a JSON-formatted string (or None)"""
-        return select_one_where(self.conn, "runs", "snapshot",
-                                "run_id", self.run_id)
+        stored = select_one_where(self.conn, "runs", "snapshot",
+                                  "run_id", self.run_id)
+        return resolve_snapshot_raw(self.conn, stored)
 
     @property
     def number_of_results(self) -> int:
@@ -635,12 +959,14 @@ class DataSet(Sized):
 
     def set_interdependencies(self,
                               interdeps: InterDependencies_,
-                              shapes: Shapes = None) -> None:
+                              shapes: Shapes = None,
+                              array_format: str = 'npy') -> None:
         """
         Set the interdependencies object (which holds all added
         parameters and their relationships) of this dataset and
         optionally the shapes object that holds information about
-        the shape of the data to be measured.
+        the shape of the data to be measured and the format used to
+        store array type parameters.
         """
         if not isinstance(interdeps, InterDependencies_):
             raise TypeError('Wrong input type. Expected InterDepencies_, '
@@ -650,7 +976,8 @@ class DataSet(Sized):
             mssg = ('Can not set interdependencies on a DataSet that has '
                     'been started.')
             raise RuntimeError(mssg)
-        self._rundescriber = RunDescriber(interdeps, shapes=shapes)
+        self._rundescriber = RunDescriber(interdeps, shapes=shapes,
+                                          array_format=array_format)
 
     def get_parameters(self) -> SPECS:
         old_interdeps = new_to_old(self.description.interdeps)
@@ -678,10 +1005,17 @@ class DataSet(Sized):
         Args:
             snapshot: the raw JSON dump of the snapshot
             overwrite: force overwrite an existing snapshot
+
+        If ``core.db_deduplicate_snapshots`` is enabled in the config, the
+        snapshot is stored in the content-addressed snapshot store of the
+        database, see :mod:`qcodes.dataset.sqlite.snapshot_store`.
         """
-        if self.snapshot is None or overwrite:
-            add_meta_data(self.conn, self.run_id, {'snapshot': snapshot})
-        elif self.snapshot is not None and not overwrite:
+        if self.snapshot_raw is None or overwrite:
+            if qcodes.config["core"]["db_deduplicate_snapshots"]:
+                store_snapshot(self.conn, self.run_id, snapshot)
+            else:
+                add_meta_data(self.conn, self.run_id, {'snapshot': snapshot})
+        elif self.snapshot_raw is not None and not overwrite:
             log.warning('This dataset already has a snapshot. Use overwrite'
                         '=True to overwrite that')
 
@@ -827,9 +1161,13 @@ class DataSet(Sized):
             raise ValueError(
                 'Can not add result, missing setpoint values') from de
 
+        self._publish_results(list(results.keys()),
+                              [list(results.values())])
+        values, = adapt_arrays_to_format([list(results.values())],
+                                         self._rundescriber.array_format)
         index = insert_values(self.conn, self.table_name,
                               list(results.keys()),
-                              list(results.values())
+                              values
                               )
         return index
 
@@ -852,17 +1190,64 @@ class DataSet(Sized):
         self._raise_if_not_writable()
 
         expected_keys = frozenset.union(*[frozenset(d) for d in results])
-        values = [[d.get(k, None) for k in expected_keys] for d in results]
+        keys = list(expected_keys)
+        values = [[d.get(k, None) for k in keys] for d in results]
+        self._publish_results(keys, values)
+        self._write_rows(keys, values)
+
+    def _add_result_columns(self, columns: Mapping[str, numpy.ndarray]
+                            ) -> None:
+        """
+        Adds results given as column arrays of equal length to the
+        :class:`.DataSet`, see :func:`_concatenate_columns`. The columns are
+        handed to the in-process subscribers as they are and only turned
+        into rows for the database.
+        """
+        self._raise_if_not_writable()
+
+        keys = list(columns)
+        n_rows = len(columns[keys[0]])
+        if n_rows == 0:
+            return
+        subscribers = [sub for sub in self.subscribers.values()
+                       if isinstance(sub, _InProcessSubscriber)]
+        for sub in subscribers:
+            sub.publish(dict(columns), n_rows)
+        values = list(zip(*(_column_to_list(columns[key]) for key in keys)))
+        self._write_rows(keys, values)
+
+    def _write_rows(self, keys: Sequence[str],
+                    values: Sequence[Sequence[Any]]) -> None:
+        """
+        Insert rows of values into the results table, or hand them to the
+        background writer if it is used.
+        """
+        values = adapt_arrays_to_format(values,
+                                        self._rundescriber.array_format)
 
         writer_status = self._writer_status
 
         if writer_status.write_in_background:
-            item = {'keys': list(expected_keys), 'values': values,
+            item = {'keys': keys, 'values': values,
                     "table_name": self.table_name}
             writer_status.data_write_queue.put(item)
         else:
-            insert_many_values(self.conn, self.table_name, list(expected_keys),
-                               values)
+            insert_many_values(
+                self.conn, self.table_name, keys, values,
+                use_executemany=qcodes.config["core"]["db_use_executemany"])
+
+    def _publish_results(self, keys: Sequence[str],
+                         values: Sequence[Sequence[Any]]) -> None:
+        """
+        Hand the results over to the in-process subscribers as column arrays
+        """
+        subscribers = [sub for sub in self.subscribers.values()
+                       if isinstance(sub, _InProcessSubscriber)]
+        if not subscribers or len(values) == 0:
+            return
+        columns = _results_to_columns(keys, values)
+        for sub in subscribers:
+            sub.publish(columns, len(values))
 
     def _raise_if_not_writable(self) -> None:
         if self.pristine:
@@ -935,7 +1320,10 @@ class DataSet(Sized):
             self,
             *params: Union[str, ParamSpec, _BaseParameter],
             start: Optional[int] = None,
-            end: Optional[int] = None) -> ParameterData:
+            end: Optional[int] = None,
+            setpoint_ranges: Optional[SetpointRanges] = None,
+            last: Optional[int] = None
+    ) -> ParameterData:
         """
         Returns the values stored in the :class:`.DataSet` for the specified parameters
         and their dependencies. If no parameters are supplied the values will
@@ -964,6 +1352,15 @@ class DataSet(Sized):
         by result count (index). If the range is empty - that is, if the end is
         less than or equal to the start, or if start is after the current end
         of the :class:`.DataSet` – then a list of empty arrays is returned.
+        If provided, last restricts the results to the last ones in the
+        range, e.g. ``last=1000`` returns the 1000 most recent results.
+
+        If provided, the setpoint ranges restrict the returned results to the
+        ones where the given parameters are within the given bounds. The
+        selection is performed by the database; for large datasets consider
+        indexing the setpoints with :meth:`create_setpoint_indices` first.
+        The start, end and last arguments are applied to the selected
+        results.
 
         Args:
             *params: string parameter names, QCoDeS Parameter objects, and
@@ -974,6 +1371,13 @@ class DataSet(Sized):
                 if None
             end: end value of selection range (by results count); ignored if
                 None
+            setpoint_ranges: dict from parameter names to a tuple of the
+                lower and upper bound (both included) of the values to
+                select, None meaning unbounded, e.g.
+                ``{'gate_voltage': (0.1, 0.2)}``. The parameters must be part
+                of the parameter trees of the requested parameters.
+            last: number of results to return from the end of the selection
+                range; ignored if None
 
         Returns:
             Dictionary from requested parameters to Dict of parameter names
@@ -986,7 +1390,44 @@ class DataSet(Sized):
         else:
             valid_param_names = self._validate_parameters(*params)
         return get_parameter_data(self.conn, self.table_name,
-                                  valid_param_names, start, end)
+                                  valid_param_names, start, end,
+                                  setpoint_ranges, last)
+
+    def create_setpoint_indices(
+            self,
+            *params: Union[str, ParamSpec, _BaseParameter]) -> List[str]:
+        """
+        Create database indices for the given parameters of this
+        :class:`.DataSet`. This speeds up selecting results by the values of
+        these parameters using the ``setpoint_ranges`` argument of
+        :meth:`get_parameter_data` at the expense of a larger database file
+        and slower inserts, so it is best done once the dataset is completed.
+
+        Args:
+            *params: string parameter names, QCoDeS Parameter objects, and
+                ParamSpec objects. If no parameters are supplied all
+                parameters that are setpoints of another parameter are
+                indexed.
+
+        Returns:
+            The names of the indices.
+        """
+        if len(params) == 0:
+            interdeps = self._rundescriber.interdeps
+            names: Dict[str, None] = {}
+            for setpoints in interdeps.dependencies.values():
+                names.update(dict.fromkeys(ps.name for ps in setpoints))
+            param_names = list(names)
+        else:
+            param_names = self._validate_parameters(*params)
+            known_names = self._rundescriber.interdeps.names
+            unknown = [name for name in param_names
+                       if name not in known_names]
+            if unknown:
+                raise ValueError(f"Cannot index unknown parameters "
+                                 f"{unknown}.")
+        return create_setpoint_indices(self.conn, self.table_name,
+                                       param_names)
 
     def get_data_as_pandas_dataframe(self,
                                      *params: Union[str,
@@ -1169,11 +1610,42 @@ class DataSet(Sized):
                   min_wait: int = 0,
                   min_count: int = 1,
                   state: Optional[Any] = None,
-                  callback_kwargs: Optional[Mapping[str, Any]] = None
+                  callback_kwargs: Optional[Mapping[str, Any]] = None,
+                  in_process: bool = False
                   ) -> str:
+        """
+        Subscribe a callback to the results added to this :class:`.DataSet`.
+
+        Args:
+            callback: The function called with the new results, the total
+                number of results and ``state``.
+            min_wait: Minimal time in milliseconds between two calls of the
+                callback.
+            min_count: Minimal number of new results for which the callback
+                is called.
+            state: An object passed to the callback, e.g. to accumulate the
+                results in.
+            callback_kwargs: Extra keyword arguments passed to the callback.
+            in_process: If False (default) the subscriber is notified of
+                every row inserted into the results table through a database
+                trigger and the callback receives a list of row tuples. If
+                True the blocks of results added through this object are
+                handed to the subscriber directly and the callback receives
+                a dict from parameter names to numpy arrays, see
+                :class:`_InProcessSubscriber`.
+
+        Returns:
+            The id of the subscriber, to be used with :meth:`unsubscribe`.
+        """
         subscriber_id = uuid.uuid4().hex
-        subscriber = _Subscriber(self, subscriber_id, callback, state,
-                                 min_wait, min_count, callback_kwargs)
+        subscriber: Union[_Subscriber, _InProcessSubscriber]
+        if in_process:
+            subscriber = _InProcessSubscriber(self, subscriber_id, callback,
+                                              state, min_wait, min_count,
+                                              callback_kwargs)
+        else:
+            subscriber = _Subscriber(self, subscriber_id, callback, state,
+                                     min_wait, min_count, callback_kwargs)
         self.subscribers[subscriber_id] = subscriber
         subscriber.start()
         return subscriber_id
@@ -1216,7 +1688,8 @@ class DataSet(Sized):
         """
         with atomic(self.conn) as conn:
             sub = self.subscribers[uuid]
-            remove_trigger(conn, sub.trigger_id)
+            if isinstance(sub, _Subscriber):
+                remove_trigger(conn, sub.trigger_id)
             sub.schedule_stop()
             sub.join()
             del self.subscribers[uuid]
@@ -1263,9 +1736,13 @@ class DataSet(Sized):
         effectively mimicking making one call to add_result per parameter
         tree.
 
-        Deal with 'numeric' type parameters. If a 'numeric' top level parameter
-        has non-scalar shape, it must be unrolled into a list of dicts of
-        single values (database).
+        The results are buffered in columnar form: every parameter tree (and
+        every standalone parameter) adds one block to ``self._results``
+        mapping the names of its parameters to numpy arrays with one element
+        per row. If a 'numeric' top level parameter has non-scalar shape,
+        its values and the values of its setpoints and inferred parameters
+        are flattened into such columns rather than unrolled into one dict
+        per row.
         """
         self._raise_if_not_writable()
         interdeps = self._rundescriber.interdeps
@@ -1278,18 +1755,18 @@ class DataSet(Sized):
             all_params = (inff_params
                           .union(deps_params)
                           .union({toplevel_param}))
-            res_dict: Dict[str, VALUE] = {}  # the dict to append to _results
             if toplevel_param.type == 'array':
-                res_list = self._finalize_res_dict_array(
+                block = self._finalize_res_dict_array(
                     result_dict, all_params)
             elif toplevel_param.type in ('numeric', 'text', 'complex'):
-                res_list = self._finalize_res_dict_numeric_text_or_complex(
-                               result_dict, toplevel_param,
-                               inff_params, deps_params)
+                block = self._finalize_res_dict_numeric_text_or_complex(
+                            result_dict, toplevel_param,
+                            inff_params, deps_params)
             else:
-                res_dict = {ps.name: result_dict[ps] for ps in all_params}
-                res_list = [res_dict]
-            self._results += res_list
+                block = {ps.name: column_values_to_array([result_dict[ps]],
+                                                          None)
+                         for ps in all_params}
+            self._results.append(block)
 
         # Finally, handle standalone parameters
 
@@ -1300,14 +1777,51 @@ class DataSet(Sized):
             stdln_dict = {st: result_dict[st] for st in standalones}
             self._results += self._finalize_res_dict_standalones(stdln_dict)
 
+    def _enqueue_results_block(
+            self, result_dict: Mapping[ParamSpecBase, numpy.ndarray],
+            n_rows: int) -> None:
+        """
+        Enqueue a block of ``n_rows`` results into self._results
+
+        The first axis of the values in ``result_dict`` runs over the rows
+        of the block, scalar values are repeated for all rows. The values
+        are assumed to already have been validated for type and shape, they
+        are enqueued as one block of columns per parameter tree (and
+        standalone parameter) without any conversion.
+        """
+        self._raise_if_not_writable()
+        interdeps = self._rundescriber.interdeps
+
+        def column(ps: ParamSpecBase) -> numpy.ndarray:
+            value = result_dict[ps]
+            if value.ndim == 0:
+                value = numpy.repeat(value, n_rows)
+            if ps.type == 'array' and value.ndim == 1:
+                # one array of a single value per row
+                value = value.reshape(n_rows, 1)
+            return value
+
+        toplevel_params = (set(interdeps.dependencies)
+                           .intersection(set(result_dict)))
+        for toplevel_param in toplevel_params:
+            all_params = (set(interdeps.inferences.get(toplevel_param, ()))
+                          .union(interdeps.dependencies[toplevel_param])
+                          .union({toplevel_param}))
+            self._results.append({ps.name: column(ps) for ps in all_params})
+
+        standalones = (set(interdeps.standalones)
+                       .intersection(set(result_dict)))
+        for standalone in standalones:
+            self._results.append({standalone.name: column(standalone)})
+
     @staticmethod
     def _finalize_res_dict_array(
             result_dict: Mapping[ParamSpecBase, values_type],
-            all_params: Set[ParamSpecBase]) -> List[Dict[str, VALUE]]:
+            all_params: Set[ParamSpecBase]) -> Dict[str, numpy.ndarray]:
         """
-        Make a list of res_dicts out of the results for a 'array' type
-        parameter. The results are assumed to already have been validated for
-        type and shape
+        Make a block of columns holding a single row out of the results for
+        a 'array' type parameter. The results are assumed to already have
+        been validated for type and shape
         """
 
         def reshaper(val: Any, ps: ParamSpecBase) -> VALUE:
@@ -1327,25 +1841,22 @@ class DataSet(Sized):
                 raise ValueError(f'Cannot handle unknown paramtype '
                                  f'{paramtype!r} of {ps!r}.')
 
-        res_dict = {ps.name: reshaper(result_dict[ps], ps)
-                    for ps in all_params}
-
-        return [res_dict]
+        return {ps.name: column_values_to_array(
+                    [reshaper(result_dict[ps], ps)], None)
+                for ps in all_params}
 
     @staticmethod
     def _finalize_res_dict_numeric_text_or_complex(
             result_dict: Mapping[ParamSpecBase, numpy.ndarray],
             toplevel_param: ParamSpecBase,
             inff_params: Set[ParamSpecBase],
-            deps_params: Set[ParamSpecBase]) -> List[Dict[str, VALUE]]:
+            deps_params: Set[ParamSpecBase]) -> Dict[str, numpy.ndarray]:
         """
-        Make a res_dict in the format expected by DataSet.add_results out
-        of the results for a 'numeric' or text type parameter. This includes
-        replicating and unrolling values as needed and also handling the corner
-        case of np.array(1) kind of values
+        Make a block of columns out of the results for a 'numeric' or text
+        type parameter. This includes replicating and flattening values as
+        needed and also handling the corner case of np.array(1) kind of
+        values
         """
-
-        res_list: List[Dict[str, VALUE]] = []
         all_params = inff_params.union(deps_params).union({toplevel_param})
 
         t_map = {'numeric': float, 'text': str, 'complex': complex}
@@ -1353,62 +1864,54 @@ class DataSet(Sized):
         toplevel_shape = result_dict[toplevel_param].shape
         if toplevel_shape == ():
             # In the case of a single value, life is reasonably simple
-            res_list = [{ps.name: t_map[ps.type](result_dict[ps])
-                         for ps in all_params}]
-        else:
-            # We first massage all values into np.arrays of the same
-            # shape
-            flat_results: Dict[str, numpy.ndarray] = {}
-
-            toplevel_val = result_dict[toplevel_param]
-            flat_results[toplevel_param.name] = toplevel_val.ravel()
-            N = len(flat_results[toplevel_param.name])
-            for dep in deps_params:
-                if result_dict[dep].shape == ():
-                    flat_results[dep.name] = numpy.repeat(result_dict[dep], N)
-                else:
-                    flat_results[dep.name] = result_dict[dep].ravel()
-            for inff in inff_params:
-                if numpy.shape(result_dict[inff]) == ():
-                    flat_results[inff.name] = numpy.repeat(result_dict[dep], N)
-                else:
-                    flat_results[inff.name] = result_dict[inff].ravel()
+            return {ps.name: numpy.array([t_map[ps.type](result_dict[ps])])
+                    for ps in all_params}
 
-            # And then put everything into the list
+        # We massage all values into flat np.arrays of the same length
+        block: Dict[str, numpy.ndarray] = {}
 
-            res_list = [{p.name: flat_results[p.name][ind] for p in all_params}
-                        for ind in range(N)]
+        toplevel_val = result_dict[toplevel_param]
+        block[toplevel_param.name] = toplevel_val.ravel()
+        N = len(block[toplevel_param.name])
+        for param in deps_params.union(inff_params):
+            value = result_dict[param]
+            if numpy.shape(value) == ():
+                block[param.name] = numpy.repeat(value, N)
+            else:
+                block[param.name] = numpy.ravel(value)
 
-        return res_list
+        return block
 
     @staticmethod
     def _finalize_res_dict_standalones(
             result_dict: Mapping[ParamSpecBase, numpy.ndarray]
-    ) -> List[Dict[str, VALUE]]:
+    ) -> List[Dict[str, numpy.ndarray]]:
         """
-        Massage all standalone parameters into the correct shape
+        Massage all standalone parameters into the correct shape. Each
+        standalone parameter gets its own block of columns.
         """
-        res_list: List[Dict[str, VALUE]] = []
+        blocks: List[Dict[str, numpy.ndarray]] = []
         for param, value in result_dict.items():
             if param.type == 'text':
                 if value.shape:
-                    res_list += [{param.name: str(val)} for val in value]
+                    column = numpy.array([str(val) for val in value])
                 else:
-                    res_list += [{param.name: str(value)}]
+                    column = numpy.array([str(value)])
             elif param.type == 'numeric':
                 if value.shape:
-                    res_list += [{param.name: number} for number in value]
+                    column = value
                 else:
-                    res_list += [{param.name: float(value)}]
+                    column = numpy.array([float(value)])
             elif param.type == 'complex':
                 if value.shape:
-                    res_list += [{param.name: number} for number in value]
+                    column = value
                 else:
-                    res_list += [{param.name: complex(value)}]
+                    column = numpy.array([complex(value)])
             else:
-                res_list += [{param.name: value}]
+                column = column_values_to_array([value], None)
+            blocks.append({param.name: column})
 
-        return res_list
+        return blocks
 
     def _flush_data_to_database(self, block: bool = False) -> None:
         """
@@ -1425,8 +1928,7 @@ class DataSet(Sized):
         writer_status = self._writer_status
         if len(self._results) > 0:
             try:
-
-                self.add_results(self._results)
+                self._add_result_columns(_concatenate_columns(self._results))
                 if writer_status.write_in_background:
                     log.debug(f"Succesfully enqueued result for write thread")
                 else:
@@ -26,6 +26,10 @@ class DataSetCache:
         self._read_status: Dict[str, int] = {}
         #: number of rows written per parameter tree (by the name of the dependent parameter)
         self._write_status: Dict[str, Optional[int]] = {}
+        #: preallocated arrays backing the arrays in ``_data`` of parameters
+        #: without a known shape such that new data can be appended without
+        #: copying all the data loaded so far
+        self._buffers: ParameterData = {}
         self._loaded_from_completed_ds = False
 
     @property
@@ -55,7 +59,8 @@ class DataSetCache:
             self.rundescriber,
             self._write_status,
             self._read_status,
-            self._data
+            self._data,
+            buffers=self._buffers
         )
 
     def data(self) -> 'ParameterData':
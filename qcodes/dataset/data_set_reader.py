@@ -0,0 +1,141 @@
+import time
+from typing import TYPE_CHECKING, Optional
+
+from qcodes.dataset.sqlite.queries import (completed, get_data_version,
+                                           get_last_rowid)
+
+if TYPE_CHECKING:
+    from .data_set import DataSet, ParameterData
+
+
+class DataSetReader:
+    """
+    The DataSetReader follows the data of a :class:`.DataSet` that is being
+    written by another process, e.g. for live plotting. It keeps track of the
+    data version of the database (``PRAGMA data_version``) and of the last
+    rowid of the run that has been seen, such that the results table of the
+    run is only queried and the :class:`.DataSetCache` of the dataset only
+    updated when something has actually changed.
+
+    Note that the data version only changes for commits made through other
+    connections to the database, so the dataset must not be the one that the
+    data is being written through.
+
+    Args:
+        dataset: The dataset to follow.
+        poll_interval: Time in seconds between two checks of the data version
+            while waiting for new data.
+    """
+
+    def __init__(self, dataset: 'DataSet', poll_interval: float = 0.05):
+        self._dataset = dataset
+        self.poll_interval = poll_interval
+        #: data version of the database when the reader last checked it
+        self._data_version: Optional[int] = None
+        #: largest rowid of the results table of the run seen so far
+        self._last_rowid: int = 0
+        self._completed = False
+        self._loaded_completed = False
+        #: whether a change has been seen that has not been loaded yet
+        self._pending_change = False
+
+    @property
+    def data_version(self) -> Optional[int]:
+        """
+        The data version of the database when it was last checked, None if
+        it has not been checked yet.
+        """
+        return self._data_version
+
+    @property
+    def last_seen_rowid(self) -> int:
+        """
+        The largest rowid of the results table of the run seen so far.
+        """
+        return self._last_rowid
+
+    def has_changed(self) -> bool:
+        """
+        Check if results have been added to the run or the run has been
+        marked completed since the data was last loaded. The results table
+        and the run are only queried if the data version of the database
+        has changed since the last check.
+        """
+        if self._loaded_completed:
+            return False
+        conn = self._dataset.conn
+        data_version = get_data_version(conn)
+        if data_version != self._data_version:
+            first_check = self._data_version is None
+            self._data_version = data_version
+            is_completed = completed(conn, self._dataset.run_id)
+            last_rowid = get_last_rowid(conn, self._dataset.table_name)
+            if (first_check
+                    or last_rowid != self._last_rowid
+                    or is_completed != self._completed):
+                self._pending_change = True
+            self._last_rowid = last_rowid
+            self._completed = is_completed
+        return self._pending_change
+
+    def update(self) -> bool:
+        """
+        Load the new data into the cache of the dataset if anything has
+        changed.
+
+        Returns:
+            True if new data was loaded or the run was marked completed,
+            False otherwise.
+        """
+        if not self.has_changed():
+            return False
+        self._dataset.cache.load_data_from_db()
+        self._pending_change = False
+        self._loaded_completed = self._completed
+        return True
+
+    def wait_for_new_data(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until new data has been written to the run or the run has been
+        marked completed and load the data into the cache of the dataset.
+
+        Args:
+            timeout: Maximal time in seconds to wait. If None wait until new
+                data arrives or the run is completed.
+
+        Returns:
+            True if new data was loaded or the run was marked completed,
+            False if the timeout expired or all the data of the completed run
+            had already been loaded.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            if self.update():
+                return True
+            if self._loaded_completed:
+                return False
+            if deadline is None:
+                time.sleep(self.poll_interval)
+            else:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self.poll_interval, remaining))
+
+    @property
+    def completed(self) -> bool:
+        """
+        Has the run been marked completed and all of its data been loaded?
+        """
+        return self._loaded_completed
+
+    def data(self) -> 'ParameterData':
+        """
+        Load new data if anything has changed and return the data cached
+        in the dataset, see :meth:`.DataSetCache.data`. The returned dicts
+        and arrays are copies, such that modifying them leaves the cache
+        intact.
+        """
+        self.update()
+        return {name: {param: values.copy() for param, values in tree.items()}
+                for name, tree in self._dataset.cache.data().items()}
@@ -1,4 +1,6 @@
+import logging
 import os
+import time
 from typing import Optional, Union
 from warnings import warn
 
@@ -19,17 +21,27 @@ from qcodes.dataset.sqlite.queries import (add_meta_data, create_run,
 from qcodes.dataset.sqlite.query_helpers import (select_many_where,
                                                  sql_placeholder_string)
 
+log = logging.getLogger(__name__)
+
+# name under which the source database is attached to the target connection
+_SOURCE_SCHEMA = 'extract_source'
 
 def extract_runs_into_db(source_db_path: str,
                          target_db_path: str, *run_ids: int,
                          upgrade_source_db: bool = False,
-                         upgrade_target_db: bool = False) -> None:
+                         upgrade_target_db: bool = False,
+                         runs_per_transaction: Optional[int] = None) -> None:
     """
     Extract a selection of runs into another DB file. All runs must come from
     the same experiment. They will be added to an experiment with the same name
     and ``sample_name`` in the target db. If such an experiment does not exist, it
     will be created.
 
+    The source DB file is attached to the connection to the target DB file
+    such that the results are copied by SQLite directly from one file to the
+    other without being loaded into Python. The number of copied rows and the
+    throughput are logged per run and in total.
+
     Args:
         source_db_path: Path to the source DB file
         target_db_path: Path to the target DB file. The target DB file will be
@@ -39,7 +51,16 @@ def extract_runs_into_db(source_db_path: str,
           not the newest, should it be upgraded?
         upgrade_target_db: If the target DB is found to be in a version that is
           not the newest, should it be upgraded?
+        runs_per_transaction: The number of runs copied per transaction. If
+          None (default) all runs are copied in a single transaction, such
+          that either all or none of the runs end up in the target DB file.
+          Committing more often limits the size of the journal of the target
+          DB file and keeps the runs copied so far if the copy is interrupted.
     """
+    if runs_per_transaction is not None and runs_per_transaction < 1:
+        raise ValueError("runs_per_transaction must be at least 1, got "
+                         f"{runs_per_transaction}")
+
     # Check for versions
     (s_v, new_v) = get_db_version_and_newest_available_version(source_db_path)
     if s_v < new_v and not upgrade_source_db:
@@ -98,26 +119,49 @@ def extract_runs_into_db(source_db_path: str,
     # this function raises if the target DB file has several experiments
     # matching both the name and sample_name
 
+    if runs_per_transaction is None:
+        runs_per_transaction = max(len(run_ids), 1)
+    batches = [run_ids[i:i + runs_per_transaction]
+               for i in range(0, len(run_ids), runs_per_transaction)] or [()]
+
+    t_start = time.perf_counter()
+    n_rows_total = 0
     try:
-        with atomic(target_conn) as target_conn:
-
-            target_exp_id = _create_exp_if_needed(target_conn,
-                                                  exp_attrs['name'],
-                                                  exp_attrs['sample_name'],
-                                                  exp_attrs['format_string'],
-                                                  exp_attrs['start_time'],
-                                                  exp_attrs['end_time'])
-
-            # Finally insert the runs
-            for run_id in run_ids:
-                _extract_single_dataset_into_db(DataSet(run_id=run_id,
-                                                        conn=source_conn),
-                                                target_conn,
-                                                target_exp_id)
+        # a database can not be attached within a transaction
+        target_conn.execute(f"ATTACH DATABASE ? AS {_SOURCE_SCHEMA}",
+                            (source_db_path,))
+        target_exp_id: Optional[int] = None
+        # Finally insert the runs. The experiment is created in the same
+        # transaction as the first runs, such that nothing is written if
+        # those can not be copied
+        for batch in batches:
+            with atomic(target_conn) as target_conn:
+                if target_exp_id is None:
+                    target_exp_id = _create_exp_if_needed(
+                        target_conn,
+                        exp_attrs['name'],
+                        exp_attrs['sample_name'],
+                        exp_attrs['format_string'],
+                        exp_attrs['start_time'],
+                        exp_attrs['end_time'])
+                for run_id in batch:
+                    n_rows_total += _extract_single_dataset_into_db(
+                        DataSet(run_id=run_id, conn=source_conn),
+                        target_conn,
+                        target_exp_id,
+                        source_schema=_SOURCE_SCHEMA)
     finally:
         source_conn.close()
+        if not target_conn.in_transaction:
+            target_conn.execute(f"DETACH DATABASE {_SOURCE_SCHEMA}")
         target_conn.close()
 
+    elapsed = time.perf_counter() - t_start
+    log.info(f"Extracted {len(run_ids)} run(s) with {n_rows_total} results "
+             f"from {source_db_path} into {target_db_path} in "
+             f"{elapsed:.3f} s ({n_rows_total / max(elapsed, 1e-9):.0f} "
+             f"results/s)")
+
 
 def _create_exp_if_needed(target_conn: ConnectionPlus,
                           exp_name: str,
@@ -158,7 +202,9 @@ def _create_exp_if_needed(target_conn: ConnectionPlus,
 
 def _extract_single_dataset_into_db(dataset: DataSet,
                                     target_conn: ConnectionPlus,
-                                    target_exp_id: int) -> None:
+                                    target_exp_id: int,
+                                    source_schema: Optional[str] = None
+                                    ) -> int:
     """
     NB: This function should only be called from within
     meth:`extract_runs_into_db`
@@ -173,6 +219,11 @@ def _extract_single_dataset_into_db(dataset: DataSet,
         target_conn: connection to the DB. Must be atomically guarded
         target_exp_id: The ``exp_id`` of the (target DB) experiment in which to
           insert the run
+        source_schema: The name under which the source DB is attached to
+          ``target_conn``, if it is. See :func:`_populate_results_table`.
+
+    Returns:
+        The number of copied results
     """
 
     if not dataset.completed:
@@ -185,7 +236,7 @@ def _extract_single_dataset_into_db(dataset: DataSet,
     run_id = get_runid_from_guid(target_conn, dataset.guid)
 
     if run_id != -1:
-        return
+        return 0
 
     if dataset.parameters is not None:
         param_names = dataset.parameters.split(',')
@@ -213,10 +264,16 @@ def _extract_single_dataset_into_db(dataset: DataSet,
             captured_counter=captured_counter,
             parent_dataset_links=parent_dataset_links)
 
-    _populate_results_table(source_conn,
-                            target_conn,
-                            dataset.table_name,
-                            target_table_name)
+    t_start = time.perf_counter()
+    n_rows = _populate_results_table(source_conn,
+                                     target_conn,
+                                     dataset.table_name,
+                                     target_table_name,
+                                     source_schema=source_schema)
+    elapsed = time.perf_counter() - t_start
+    log.info(f"Copied {n_rows} results of run {dataset.run_id} "
+             f"(GUID: {dataset.guid}) in {elapsed:.3f} s "
+             f"({n_rows / max(elapsed, 1e-9):.0f} results/s)")
     mark_run_complete(target_conn, target_run_id)
     _rewrite_timestamps(target_conn,
                         target_run_id,
@@ -226,32 +283,68 @@ def _extract_single_dataset_into_db(dataset: DataSet,
     if snapshot_raw is not None:
         add_meta_data(target_conn, target_run_id, {'snapshot': snapshot_raw})
 
+    return n_rows
+
 
 def _populate_results_table(source_conn: ConnectionPlus,
                             target_conn: ConnectionPlus,
                             source_table_name: str,
-                            target_table_name: str) -> None:
+                            target_table_name: str,
+                            source_schema: Optional[str] = None,
+                            chunk_size: int = 10000) -> int:
     """
     Copy over all the entries of the results table
+
+    If the source DB is attached to ``target_conn`` as ``source_schema``, the
+    results are copied with a single ``INSERT INTO ... SELECT`` statement
+    such that the data never leaves SQLite. Otherwise the results are read
+    from ``source_conn`` and inserted in chunks of ``chunk_size`` rows.
+
+    Returns:
+        The number of copied results
     """
+    column_names = [
+        row[1] for row in source_conn.execute(
+            f'PRAGMA table_info("{source_table_name}")').fetchall()
+        if row[1] != 'id']
+    if len(column_names) == 0:
+        return 0
+    columns = ','.join(column_names)
+
+    if source_schema is not None:
+        copy_query = f"""
+                     INSERT INTO "{target_table_name}" ({columns})
+                     SELECT {columns}
+                     FROM {source_schema}."{source_table_name}"
+                     ORDER BY id
+                     """
+        return target_conn.cursor().execute(copy_query).rowcount
+
     get_data_query = f"""
-                     SELECT *
+                     SELECT {columns}
                      FROM "{source_table_name}"
+                     ORDER BY id
                      """
-
+    insert_data_query = f"""
+                         INSERT INTO "{target_table_name}"
+                         ({columns})
+                         values {sql_placeholder_string(len(column_names))}
+                         """
     source_cursor = source_conn.cursor()
+    # plain tuples can be passed on as they are and the values are passed
+    # on as stored, without converting arrays back and forth
+    source_cursor.row_factory = None
     target_cursor = target_conn.cursor()
 
-    for row in source_cursor.execute(get_data_query):
-        column_names = ','.join(row.keys()[1:])  # the first key is "id"
-        values = tuple(val for val in row[1:])
-        value_placeholders = sql_placeholder_string(len(values))
-        insert_data_query = f"""
-                             INSERT INTO "{target_table_name}"
-                             ({column_names})
-                             values {value_placeholders}
-                             """
-        target_cursor.execute(insert_data_query, values)
+    n_rows = 0
+    source_cursor.execute(get_data_query)
+    while True:
+        rows = source_cursor.fetchmany(chunk_size)
+        if len(rows) == 0:
+            break
+        target_cursor.executemany(insert_data_query, rows)
+        n_rows += len(rows)
+    return n_rows
 
 
 def _rewrite_timestamps(target_conn: ConnectionPlus, target_run_id: int,
@@ -7,10 +7,16 @@ from .versioning.rundescribertypes import (RunDescriberDicts,
                                            RunDescriberV0Dict,
                                            RunDescriberV1Dict,
                                            RunDescriberV2Dict,
-                                           RunDescriberV3Dict, Shapes)
+                                           RunDescriberV3Dict,
+                                           RunDescriberV4Dict, Shapes)
 
 from.versioning.v0 import InterDependencies
 
+ARRAY_FORMATS = ('npy', 'raw')
+# the formats in which values of array type parameters can be stored:
+# 'npy' is the numpy .npy file format written with ``np.save``, 'raw' is a
+# small dtype/shape header followed by the raw data buffer of the array
+
 
 class RunDescriber:
     """
@@ -23,20 +29,33 @@ class RunDescriber:
     convert themselves to dictionary and added as attributes to the
     RunDescriber, such that the RunDescriber can iteratively convert its
     attributes when converting itself to dictionary.
+
+    Args:
+        interdeps: The interdependencies of the parameters of the run.
+        shapes: Optional dict from names of dependent parameters to the
+            expected shape of their data.
+        array_format: The format in which values of array type parameters
+            are written to the results table. One of ``'npy'`` (default)
+            or ``'raw'``.
     """
 
     def __init__(self, interdeps: InterDependencies_,
-                 shapes: Shapes = None) -> None:
+                 shapes: Shapes = None,
+                 array_format: str = 'npy') -> None:
 
         if not isinstance(interdeps, InterDependencies_):
             raise ValueError('The interdeps arg must be of type: '
                              'InterDependencies_. '
                              f'Got {type(interdeps)}.')
+        if array_format not in ARRAY_FORMATS:
+            raise ValueError(f'Invalid array_format {array_format!r}. '
+                             f'Must be one of {ARRAY_FORMATS}.')
         self._verify_interdeps_shape(interdeps, shapes)
 
         self._interdeps = interdeps
         self._shapes = shapes
-        self._version = 3
+        self._array_format = array_format
+        self._version = 4
 
     @property
     def version(self) -> int:
@@ -50,6 +69,10 @@ class RunDescriber:
     def interdeps(self) -> InterDependencies_:
         return self._interdeps
 
+    @property
+    def array_format(self) -> str:
+        return self._array_format
+
 
     @staticmethod
     def _verify_interdeps_shape(interdeps: InterDependencies_,
@@ -70,17 +93,17 @@ class RunDescriber:
                                          f"but it's shape "
                                          f"is given as {shape}")
 
-    def _to_dict(self) -> RunDescriberV3Dict:
+    def _to_dict(self) -> RunDescriberV4Dict:
         """
         Convert this object into a dictionary. This method is intended to
         be used only by the serialization routines.
         """
-        ser: RunDescriberV3Dict = {
+        ser: RunDescriberV4Dict = {
             'version': self._version,
             'interdependencies': new_to_old(self.interdeps)._to_dict(),
             'interdependencies_': self.interdeps._to_dict(),
-            'shapes': self.shapes
-
+            'shapes': self.shapes,
+            'array_format': self.array_format
         }
 
         return ser
@@ -108,12 +131,19 @@ class RunDescriber:
             rundesc = cls(
                 InterDependencies_._from_dict(ser['interdependencies_'])
             )
-        elif ser['version'] >= 3:
+        elif ser['version'] == 3:
             ser = cast(RunDescriberV3Dict, ser)
             rundesc = cls(
                 InterDependencies_._from_dict(ser['interdependencies_']),
                 shapes=ser['shapes']
             )
+        elif ser['version'] >= 4:
+            ser = cast(RunDescriberV4Dict, ser)
+            rundesc = cls(
+                InterDependencies_._from_dict(ser['interdependencies_']),
+                shapes=ser['shapes'],
+                array_format=ser['array_format']
+            )
         else:
             raise RuntimeError(f"Unknown version: "
                                f"Cannot deserialize from {ser['version']}")
@@ -128,4 +158,5 @@ class RunDescriber:
         return True
 
     def __repr__(self) -> str:
-        return f"RunDescriber({self.interdeps}, Shapes: {self._shapes})"
+        return (f"RunDescriber({self.interdeps}, Shapes: {self._shapes}, "
+                f"Array format: {self._array_format})")
@@ -10,7 +10,8 @@ from typing import Dict, List
 from ..dependencies import InterDependencies_
 from ..param_spec import ParamSpec, ParamSpecBase
 from .rundescribertypes import (RunDescriberV0Dict, RunDescriberV1Dict,
-                                RunDescriberV2Dict, RunDescriberV3Dict)
+                                RunDescriberV2Dict, RunDescriberV3Dict,
+                                RunDescriberV4Dict)
 from .v0 import InterDependencies
 
 
@@ -116,6 +117,16 @@ def v2_to_v3(old: RunDescriberV2Dict) -> RunDescriberV3Dict:
                               )
 
 
+def v3_to_v4(old: RunDescriberV3Dict) -> RunDescriberV4Dict:
+    # all runs written before v4 store arrays in the numpy .npy format
+    return RunDescriberV4Dict(version=4,
+                              interdependencies=old['interdependencies'],
+                              interdependencies_=old['interdependencies_'],
+                              shapes=old['shapes'],
+                              array_format='npy'
+                              )
+
+
 def v0_to_v2(old: RunDescriberV0Dict) -> RunDescriberV2Dict:
     """
     Convert a v0 RunDescriber Dict to a v2 RunDescriber Dict
@@ -131,6 +142,26 @@ def v1_to_v3(old: RunDescriberV1Dict) -> RunDescriberV3Dict:
     return v2_to_v3(v1_to_v2(old))
 
 
+def v0_to_v4(old: RunDescriberV0Dict) -> RunDescriberV4Dict:
+    return v3_to_v4(v0_to_v3(old))
+
+
+def v1_to_v4(old: RunDescriberV1Dict) -> RunDescriberV4Dict:
+    return v3_to_v4(v1_to_v3(old))
+
+
+def v2_to_v4(old: RunDescriberV2Dict) -> RunDescriberV4Dict:
+    return v3_to_v4(v2_to_v3(old))
+
+
+def v4_to_v3(new: RunDescriberV4Dict) -> RunDescriberV3Dict:
+    return RunDescriberV3Dict(version=3,
+                              interdependencies=new['interdependencies'],
+                              interdependencies_=new['interdependencies_'],
+                              shapes=new['shapes']
+                              )
+
+
 def v3_to_v2(new: RunDescriberV3Dict) -> RunDescriberV2Dict:
     return RunDescriberV2Dict(version=2,
                               interdependencies=new['interdependencies'],
@@ -174,3 +205,15 @@ def v2_to_v0(new: RunDescriberV2Dict) -> RunDescriberV0Dict:
 
 def v3_to_v0(new: RunDescriberV3Dict) -> RunDescriberV0Dict:
     return v1_to_v0(v3_to_v1(new))
+
+
+def v4_to_v2(new: RunDescriberV4Dict) -> RunDescriberV2Dict:
+    return v3_to_v2(v4_to_v3(new))
+
+
+def v4_to_v1(new: RunDescriberV4Dict) -> RunDescriberV1Dict:
+    return v3_to_v1(v4_to_v3(new))
+
+
+def v4_to_v0(new: RunDescriberV4Dict) -> RunDescriberV0Dict:
+    return v3_to_v0(v4_to_v3(new))
@@ -12,6 +12,12 @@ instance of InterDependencies_ (which contains ParamSpecBases)
 instance of InterDependencies (which contains ParamSpecs) and
 interdependencies_, which is an instance of InterDependencies_
 (which contains ParamSpecBases)
+- 3: The run_describer has three attributes: interdependencies,
+interdependencies_ and shapes, the expected shape of the data of each
+dependent parameter
+- 4: The run_describer has four attributes: interdependencies,
+interdependencies_, shapes and array_format, the format in which values of
+array type parameters are written to the results table
 """
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -53,7 +59,12 @@ class RunDescriberV3Dict(RunDescriberV2Dict):
     # dict from dependent to dict from depenency to num points in grid
 
 
+class RunDescriberV4Dict(RunDescriberV3Dict):
+    array_format: str
+
+
 RunDescriberDicts = Union[RunDescriberV0Dict,
                           RunDescriberV1Dict,
                           RunDescriberV2Dict,
-                          RunDescriberV3Dict]
+                          RunDescriberV3Dict,
+                          RunDescriberV4Dict]
@@ -36,16 +36,20 @@ from typing import Callable, Dict, Tuple, cast
 from qcodes.utils.helpers import YAML
 
 from .. import rundescriber as current
-from .converters import (v0_to_v1, v0_to_v2, v0_to_v3, v1_to_v0, v1_to_v2,
-                         v1_to_v3, v2_to_v0, v2_to_v1, v2_to_v3, v3_to_v0,
-                         v3_to_v1, v3_to_v2)
+from .converters import (v0_to_v1, v0_to_v2, v0_to_v3, v0_to_v4, v1_to_v0,
+                         v1_to_v2, v1_to_v3, v1_to_v4, v2_to_v0, v2_to_v1,
+                         v2_to_v3, v2_to_v4, v3_to_v0, v3_to_v1, v3_to_v2,
+                         v3_to_v4, v4_to_v0, v4_to_v1, v4_to_v2, v4_to_v3)
 from .rundescribertypes import (RunDescriberDicts, RunDescriberV0Dict,
                                 RunDescriberV1Dict, RunDescriberV2Dict,
-                                RunDescriberV3Dict)
+                                RunDescriberV3Dict, RunDescriberV4Dict)
 
 STORAGE_VERSION = 3
 # the version of :class:`RunDescriber` object that is used by the data storage
-# infrastructure of :mod:`qcodes`
+# infrastructure of :mod:`qcodes`. Runs that store arrays in a format other
+# than the default 'npy' format are stored as version 4, which is the first
+# version to record the array format, see :func:`_storage_version`. Runs in
+# the default format thus stay readable by older versions of :mod:`qcodes`.
 
 # keys: (from_version, to_version)
 _converters: Dict[Tuple[int, int], Callable] = {
@@ -53,19 +57,27 @@ _converters: Dict[Tuple[int, int], Callable] = {
     (0, 1): v0_to_v1,
     (0, 2): v0_to_v2,
     (0, 3): v0_to_v3,
+    (0, 4): v0_to_v4,
     (1, 0): v1_to_v0,
     (1, 1): lambda x: x,
     (1, 2): v1_to_v2,
     (1, 3): v1_to_v3,
+    (1, 4): v1_to_v4,
     (2, 0): v2_to_v0,
     (2, 1): v2_to_v1,
     (2, 2): lambda x: x,
     (2, 3): v2_to_v3,
+    (2, 4): v2_to_v4,
     (3, 0): v3_to_v0,
     (3, 1): v3_to_v1,
     (3, 2): v3_to_v2,
     (3, 3): lambda x: x,
-
+    (3, 4): v3_to_v4,
+    (4, 0): v4_to_v0,
+    (4, 1): v4_to_v1,
+    (4, 2): v4_to_v2,
+    (4, 3): v4_to_v3,
+    (4, 4): lambda x: x,
 }
 
 
@@ -80,8 +92,10 @@ def from_dict_to_current(dct: RunDescriberDicts) -> current.RunDescriber:
         return current.RunDescriber._from_dict(cast(RunDescriberV1Dict, dct))
     elif dct_version == 2:
         return current.RunDescriber._from_dict(cast(RunDescriberV2Dict, dct))
-    elif dct_version >= 3:
+    elif dct_version == 3:
         return current.RunDescriber._from_dict(cast(RunDescriberV3Dict, dct))
+    elif dct_version >= 4:
+        return current.RunDescriber._from_dict(cast(RunDescriberV4Dict, dct))
     else:
         raise RuntimeError(f"Unknown version of run describer dictionary, can't deserialize. The dictionary is {dct!r}")
 
@@ -103,7 +117,16 @@ def to_dict_for_storage(desc: current.RunDescriber) -> RunDescriberDicts:
     Convert a RunDescriber into a dictionary that represents the
     RunDescriber of the storage version
     """
-    return to_dict_as_version(desc, STORAGE_VERSION)
+    return to_dict_as_version(desc, _storage_version(desc))
+
+
+def _storage_version(desc: current.RunDescriber) -> int:
+    """
+    The version a RunDescriber is stored as, see :data:`STORAGE_VERSION`.
+    """
+    if desc.array_format != 'npy':
+        return 4
+    return STORAGE_VERSION
 
 
 # JSON
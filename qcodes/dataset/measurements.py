@@ -15,22 +15,23 @@ from inspect import signature
 from numbers import Number
 from time import perf_counter
 from types import TracebackType
-from typing import (Any, Callable, Dict, List, Mapping, MutableMapping,
-                    MutableSequence, Optional, Sequence, Tuple, Type, TypeVar,
-                    Union, cast)
+from typing import (Any, Callable, Dict, FrozenSet, List, Mapping,
+                    MutableMapping, MutableSequence, Optional, Sequence, Tuple,
+                    Type, TypeVar, Union, cast)
 
 import numpy as np
 
 import qcodes as qc
 import qcodes.utils.validators as vals
 from qcodes import Station
-from qcodes.dataset.data_set import (VALUE, DataSet, load_by_guid, res_type,
+from qcodes.dataset.data_set import (DataSet, load_by_guid, res_type,
                                      setpoints_type, values_type)
 from qcodes.dataset.descriptions.dependencies import (DependencyError,
                                                       InferenceError,
                                                       InterDependencies_)
 from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
-from qcodes.dataset.descriptions.rundescriber import RunDescriber
+from qcodes.dataset.descriptions.rundescriber import (ARRAY_FORMATS,
+                                                      RunDescriber)
 from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
 from qcodes.dataset.experiment_container import Experiment
 from qcodes.dataset.linked_datasets.links import Link
@@ -39,7 +40,7 @@ from qcodes.instrument.parameter import (ArrayParameter, MultiParameter,
                                          _BaseParameter,
                                          expand_setpoints_helper)
 from qcodes.utils.delaykeyboardinterrupt import DelayedKeyboardInterrupt
-from qcodes.utils.helpers import NumpyJSONEncoder
+from qcodes.utils.helpers import SnapshotJSONEncoder
 
 log = logging.getLogger(__name__)
 
@@ -48,6 +49,27 @@ class ParameterTypeError(Exception):
     pass
 
 
+class _ResultPlan:
+    """
+    The parts of :meth:`DataSaver.add_result` that only depend on which
+    parameters are passed to it and not on their values: the function that
+    unpacks each partial result, the parameters whose data has to be checked
+    against an ``Arrays`` validator and, once validated, the set of
+    parameters whose dependencies are known to be met.
+    """
+
+    def __init__(self,
+                 unpackers: Sequence[Callable[[res_type],
+                                              Dict[ParamSpecBase,
+                                                   np.ndarray]]],
+                 array_parameters: Sequence[Optional[_BaseParameter]]
+                 ) -> None:
+        self.unpackers = unpackers
+        self.array_parameters = array_parameters
+        self.validated_params: Optional[FrozenSet[ParamSpecBase]] = None
+        self.toplevel_params: Tuple[ParamSpecBase, ...] = ()
+
+
 class DataSaver:
     """
     The class used by the :class:`Runner` context manager to handle the
@@ -69,7 +91,7 @@ class DataSaver:
                 'run_tables_subscription_min_wait']
             min_count = DataSaver.default_callback[
                 'run_tables_subscription_min_count']
-            snapshot = dataset.get_metadata('snapshot')
+            snapshot = dataset.snapshot_raw
             self._dataset.subscribe(callback,
                                     min_wait=min_wait,
                                     min_count=min_count,
@@ -83,10 +105,12 @@ class DataSaver:
 
         self._interdeps = interdeps
         self.write_period = float(write_period)
-        # self._results will be filled by add_result
-        self._results: List[Dict[str, VALUE]] = []
         self._last_save_time = perf_counter()
         self._known_dependencies: Dict[str, List[str]] = {}
+        # plans for add_result by the parameters passed to it
+        self._result_plans: Dict[Tuple[Union[str, _BaseParameter], ...],
+                                 _ResultPlan] = {}
+        self._max_result_plans = 100
         self.parent_datasets: List[DataSet] = []
 
         for link in self._dataset.parent_dataset_links:
@@ -123,62 +147,196 @@ class DataSaver:
                 its type.
         """
 
-        # we iterate through the input twice. First we find any array and
-        # multiparameters that need to be unbundled and collect the names
-        # of all parameters. This also allows users to call
-        # add_result with the arguments in any particular order, i.e. NOT
-        # enforcing that setpoints come before dependent variables.
+        # The unpacking of the partial results and the checks of the
+        # dependencies only depend on which parameters are passed, so they
+        # are planned once per combination of parameters. This also allows
+        # users to call add_result with the arguments in any particular
+        # order, i.e. NOT enforcing that setpoints come before dependent
+        # variables.
+        plan = self._get_result_plan(res_tuple)
+
         results_dict: Dict[ParamSpecBase, np.ndarray] = {}
+        for partial_result, unpack, array_parameter in zip(
+                res_tuple, plan.unpackers, plan.array_parameters):
+            if array_parameter is not None:
+                self._validate_array_parameter_data(array_parameter,
+                                                    partial_result[1])
+            results_dict.update(unpack(partial_result))
+
+        if plan.validated_params != results_dict.keys():
+            self._validate_result_deps(results_dict)
+            plan.validated_params = frozenset(results_dict)
+            plan.toplevel_params = tuple(
+                set(self._interdeps.dependencies)
+                .intersection(plan.validated_params))
+        self._validate_result_shapes(results_dict, plan.toplevel_params)
+        self._validate_result_types(results_dict)
 
-        parameter_names = tuple(partial_result[0].full_name
-                                if isinstance(partial_result[0], _BaseParameter) else partial_result[0]
-                                for partial_result in res_tuple)
+        self.dataset._enqueue_results(results_dict)
 
-        for partial_result in res_tuple:
-            parameter = partial_result[0]
-            data = partial_result[1]
+        if perf_counter() - self._last_save_time > self.write_period:
+            self.flush_data_to_database()
+            self._last_save_time = perf_counter()
 
-            if (isinstance(parameter, _BaseParameter) and
-                    isinstance(parameter.vals, vals.Arrays)):
-                if not isinstance(data, np.ndarray):
-                    raise TypeError(
-                        f"Expected data for Parameter with Array validator "
-                        f"to be a numpy array but got: {type(data)}")
-
-                if (parameter.vals.shape is not None
-                        and data.shape != parameter.vals.shape):
-                    raise TypeError(
-                        "Expected data with shape {parameter.vals.shape}, "
-                        "but got {data.shape}"
-                    )
-
-            if isinstance(parameter, ArrayParameter):
-                results_dict.update(
-                    self._unpack_arrayparameter(partial_result))
-            elif isinstance(parameter, MultiParameter):
-                results_dict.update(
-                    self._unpack_multiparameter(partial_result))
-            elif isinstance(parameter, ParameterWithSetpoints):
-                results_dict.update(
-                    self._conditionally_expand_parameter_with_setpoints(
-                        data, parameter, parameter_names, partial_result
-                    )
-                )
-            else:
-                results_dict.update(
-                    self._unpack_partial_result(partial_result)
-                )
+    def add_results_block(self, *res_tuple: res_type) -> None:
+        """
+        Add a block of results to the measurement results in one go, e.g.
+        a whole line of a sweep computed at once. The values of all
+        parameters are arrays whose first axis runs over the measurement
+        points of the block, such that
+
+            >>> datasaver.add_results_block((v1, v1_values), (c1, c1_values))
+
+        adds the same results as calling ``add_result`` for every ``i`` with
+        ``(v1, v1_values[i]), (c1, c1_values[i])``, but validates the
+        results only once and hands them to the dataset without looping
+        over the points. The values of 'array' type parameters therefore
+        have the shape ``(n_points, *shape_of_each_value)``. Scalar values
+        are used for all points of the block.
+
+        Setpoints are not looked up or expanded from the parameters, the
+        values of all setpoints and inferred parameters must be passed
+        explicitly.
+
+        Args:
+            res_tuple: Tuples of a parameter (or its name) and the array
+                of its values at all points of the block.
+
+        Raises:
+            ValueError: If a parameter name is not registered in the parent
+                Measurement object.
+            ValueError: If the number of points differs between the
+                parameters, the values of a parameter and its setpoints
+                have different shapes at each point, or a parameter that is
+                not of 'array' type does not have a scalar value at each
+                point.
+            ParameterTypeError: If a parameter is given a value not matching
+                its type.
+        """
+        results_dict: Dict[ParamSpecBase, np.ndarray] = {}
+        for partial_result in res_tuple:
+            results_dict.update(self._unpack_partial_result(partial_result))
 
         self._validate_result_deps(results_dict)
-        self._validate_result_shapes(results_dict)
+        n_points = self._validate_results_block_shapes(results_dict)
         self._validate_result_types(results_dict)
 
-        self.dataset._enqueue_results(results_dict)
+        self.dataset._enqueue_results_block(results_dict, n_points)
 
         if perf_counter() - self._last_save_time > self.write_period:
             self.flush_data_to_database()
             self._last_save_time = perf_counter()
 
+    def _validate_results_block_shapes(
+            self, results_dict: Mapping[ParamSpecBase, np.ndarray]) -> int:
+        """
+        Validate that all parameters of a block of results have values for
+        the same number of points, and that the values of parameters and
+        their setpoints at each point have the same shape (or that the
+        setpoint is scalar). Only 'array' type parameters can have a value
+        with a shape at each point. Return the number of points of the
+        block.
+        """
+        for ps, value in results_dict.items():
+            if ps.type != 'array' and value.ndim > 1:
+                raise ValueError(f'Incompatible shapes. Parameter {ps.name} '
+                                 f'of type {ps.type!r} must have a scalar '
+                                 f'value at each point, but has values of '
+                                 f'shape {value.shape[1:]}.')
+        lengths = {ps.name: len(value) for ps, value in results_dict.items()
+                   if value.ndim > 0}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f'Incompatible shapes. The parameters have '
+                             f'values for different numbers of points: '
+                             f'{lengths}.')
+        n_points = next(iter(lengths.values()), 1)
+
+        toplevel_params = (set(self._interdeps.dependencies)
+                           .intersection(set(results_dict)))
+        for toplevel_param in toplevel_params:
+            required_shape = results_dict[toplevel_param].shape[1:]
+            for setpoint in self._interdeps.dependencies[toplevel_param]:
+                setpoint_shape = results_dict[setpoint].shape[1:]
+                if setpoint_shape not in [(), required_shape]:
+                    raise ValueError(f'Incompatible shapes. Parameter '
+                                     f"{toplevel_param.name} has shape "
+                                     f"{required_shape} at each point, but "
+                                     f"its setpoint {setpoint.name} has "
+                                     f"shape {setpoint_shape}.")
+        return n_points
+
+    def _get_result_plan(self, res_tuple: Sequence[res_type]) -> _ResultPlan:
+        """
+        Get the plan for adding results for the parameters in ``res_tuple``,
+        making it if these parameters have not been passed to
+        :meth:`add_result` before.
+        """
+        parameters = tuple(partial_result[0] for partial_result in res_tuple)
+        plan = self._result_plans.get(parameters)
+        if plan is None:
+            plan = self._make_result_plan(parameters)
+            if len(self._result_plans) >= self._max_result_plans:
+                self._result_plans.clear()
+            self._result_plans[parameters] = plan
+        return plan
+
+    def _make_result_plan(self, parameters: Sequence[Union[str,
+                                                          _BaseParameter]]
+                          ) -> _ResultPlan:
+        parameter_names = tuple(parameter.full_name
+                                if isinstance(parameter, _BaseParameter)
+                                else parameter
+                                for parameter in parameters)
+        unpackers = []
+        array_parameters: List[Optional[_BaseParameter]] = []
+        for parameter in parameters:
+            if (isinstance(parameter, _BaseParameter) and
+                    isinstance(parameter.vals, vals.Arrays)):
+                array_parameters.append(parameter)
+            else:
+                array_parameters.append(None)
+            unpackers.append(self._make_unpacker(parameter, parameter_names))
+        return _ResultPlan(unpackers, array_parameters)
+
+    def _make_unpacker(self, parameter: Union[str, _BaseParameter],
+                       parameter_names: Sequence[str]
+                       ) -> Callable[[res_type],
+                                     Dict[ParamSpecBase, np.ndarray]]:
+        """
+        Make the function that unpacks a partial result for ``parameter``
+        into a standard results dict form.
+        """
+        if isinstance(parameter, ArrayParameter):
+            return self._unpack_arrayparameter
+        if isinstance(parameter, MultiParameter):
+            return self._unpack_multiparameter
+        if isinstance(parameter, ParameterWithSetpoints):
+            pws = parameter
+            return lambda partial_result: (
+                self._conditionally_expand_parameter_with_setpoints(
+                    partial_result[1], pws, parameter_names, partial_result))
+
+        paramspec = self._interdeps._id_to_paramspec.get(str(parameter))
+        if paramspec is None:
+            # raises the error for unknown parameters
+            return self._unpack_partial_result
+        return lambda partial_result: {paramspec: np.array(partial_result[1])}
+
+    @staticmethod
+    def _validate_array_parameter_data(parameter: _BaseParameter,
+                                       data: values_type) -> None:
+        if not isinstance(data, np.ndarray):
+            raise TypeError(
+                f"Expected data for Parameter with Array validator "
+                f"to be a numpy array but got: {type(data)}")
+
+        if (parameter.vals.shape is not None
+                and data.shape != parameter.vals.shape):
+            raise TypeError(
+                "Expected data with shape {parameter.vals.shape}, "
+                "but got {data.shape}"
+            )
+
     def _conditionally_expand_parameter_with_setpoints(
             self, data: values_type, parameter: ParameterWithSetpoints,
             parameter_names: Sequence[str], partial_result: res_type
@@ -357,15 +515,21 @@ class DataSaver:
                              'are missing.') from err
 
     def _validate_result_shapes(
-            self, results_dict: Mapping[ParamSpecBase, values_type]) -> None:
+            self, results_dict: Mapping[ParamSpecBase, values_type],
+            toplevel_params: Optional[Sequence[ParamSpecBase]] = None
+    ) -> None:
         """
         Validate that all sizes of the ``results_dict`` are consistent.
         This means that array-values of parameters and their setpoints are
         of the same size, whereas parameters with no setpoint relation to
         each other can have different sizes.
+
+        The parameters in ``results_dict`` that have setpoints can be passed
+        as ``toplevel_params`` if they are already known.
         """
-        toplevel_params = (set(self._interdeps.dependencies)
-                           .intersection(set(results_dict)))
+        if toplevel_params is None:
+            toplevel_params = tuple(set(self._interdeps.dependencies)
+                                    .intersection(set(results_dict)))
         for toplevel_param in toplevel_params:
             required_shape = np.shape(results_dict[toplevel_param])
             for setpoint in self._interdeps.dependencies[toplevel_param]:
@@ -444,7 +608,8 @@ class Runner:
             parent_datasets: Sequence[Dict] = (),
             extra_log_info: str = '',
             write_in_background: bool = False,
-            shapes: Optional[Shapes] = None) -> None:
+            shapes: Optional[Shapes] = None,
+            array_format: str = 'npy') -> None:
 
         if write_in_background and (write_period is not None):
             warnings.warn(f"The specified write period of {write_period} s "
@@ -464,6 +629,7 @@ class Runner:
         self.station = station
         self._interdependencies = interdeps
         self._shapes: Shapes = shapes
+        self._array_format = array_format
         # here we use 5 s as a sane default, but that value should perhaps
         # be read from some config file
         self.write_period = float(write_period) \
@@ -497,14 +663,16 @@ class Runner:
             station = self.station
 
         if station:
-            self.ds.add_snapshot(json.dumps({'station': station.snapshot()},
-                                            cls=NumpyJSONEncoder))
+            self.ds.add_snapshot(json.dumps(
+                {'station': station.snapshot()}, cls=SnapshotJSONEncoder,
+                max_array_size=qc.config.station.snapshot_max_array_size))
 
         if self._interdependencies == InterDependencies_():
             raise RuntimeError("No parameters supplied")
         else:
             self.ds.set_interdependencies(self._interdependencies,
-                                          self._shapes)
+                                          self._shapes,
+                                          self._array_format)
 
         links = [Link(head=self.ds.guid, **pdict)
                  for pdict in self._parent_datasets]
@@ -600,6 +768,7 @@ class Measurement:
         self._write_period: Optional[float] = None
         self._interdeps = InterDependencies_()
         self._shapes: Shapes = None
+        self._array_format = 'npy'
         self._parent_datasets: List[Dict] = []
         self._extra_log_info: str = ''
 
@@ -1086,6 +1255,22 @@ class Measurement:
                                              shapes=shapes)
         self._shapes = shapes
 
+    def set_array_format(self, array_format: str) -> None:
+        """
+        Set the format used to store array type parameters in the
+        database for this measurement.
+
+        Args:
+            array_format: Either ``'npy'`` (default) to store arrays in the
+                numpy .npy format or ``'raw'`` to store the raw data buffer
+                of the arrays along with their dtype and shape. The latter
+                is considerably faster to write and to read back.
+        """
+        if array_format not in ARRAY_FORMATS:
+            raise ValueError(f'Invalid array_format {array_format!r}. '
+                             f'Must be one of {ARRAY_FORMATS}.')
+        self._array_format = array_format
+
     def run(self, write_in_background: bool = False) -> Runner:
         """
         Returns the context manager for the experimental run
@@ -1105,4 +1290,5 @@ class Measurement:
                       parent_datasets=self._parent_datasets,
                       extra_log_info=self._extra_log_info,
                       write_in_background=write_in_background,
-                      shapes=self._shapes)
+                      shapes=self._shapes,
+                      array_format=self._array_format)
@@ -5,10 +5,11 @@ database version and possibly perform database upgrades.
 """
 import io
 import sqlite3
+import struct
 import sys
 from contextlib import contextmanager
 from os.path import expanduser, normpath
-from typing import Union, Iterator, Tuple, Optional
+from typing import Any, Iterator, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from numpy import ndarray
@@ -33,12 +34,77 @@ def _adapt_array(arr: ndarray) -> sqlite3.Binary:
     return sqlite3.Binary(out.read())
 
 
+# arrays written in the 'raw' array format start with this magic string
+# (as opposed to b'\x93NUMPY' for the .npy format) followed by the length
+# of a "<dtype>;<shape>" ascii header and the raw data buffer of the array
+_RAW_ARRAY_MAGIC = b'\x93QCRAW'
+_RAW_ARRAY_HEADER_LEN = struct.Struct('<H')
+
+
+def _adapt_array_raw(arr: ndarray) -> sqlite3.Binary:
+    """
+    Serialize an array as its raw data buffer prefixed with a small header
+    holding the dtype and the shape. As opposed to :func:`_adapt_array`, the
+    result can be read back with ``np.frombuffer`` without parsing a .npy
+    header or copying the data. Arrays that can not be described by a dtype
+    string alone (object or structured arrays) are stored as .npy instead.
+    """
+    if arr.dtype.hasobject or arr.dtype.names is not None:
+        return _adapt_array(arr)
+    shape = ','.join(str(dim) for dim in arr.shape)
+    header = f"{arr.dtype.str};{shape}".encode('ascii')
+    return sqlite3.Binary(b''.join((_RAW_ARRAY_MAGIC,
+                                    _RAW_ARRAY_HEADER_LEN.pack(len(header)),
+                                    header,
+                                    arr.tobytes())))
+
+
 def _convert_array(text: bytes) -> ndarray:
+    if text.startswith(_RAW_ARRAY_MAGIC):
+        return _convert_array_raw(text)
     out = io.BytesIO(text)
     out.seek(0)
     return np.load(out)
 
 
+def _convert_array_raw(text: bytes) -> ndarray:
+    """
+    Inverse of :func:`_adapt_array_raw`. Note that the returned array is a
+    read-only view on ``text``.
+    """
+    offset = len(_RAW_ARRAY_MAGIC)
+    header_len, = _RAW_ARRAY_HEADER_LEN.unpack_from(text, offset)
+    offset += _RAW_ARRAY_HEADER_LEN.size
+    header = text[offset:offset + header_len].decode('ascii')
+    dtype, shape = header.split(';')
+    return np.frombuffer(
+        text, dtype=np.dtype(dtype), offset=offset + header_len
+    ).reshape(tuple(int(dim) for dim in shape.split(',') if dim))
+
+
+_array_adapters = {'npy': _adapt_array, 'raw': _adapt_array_raw}
+
+
+def adapt_arrays_to_format(values: Sequence[Sequence[Any]],
+                           array_format: str) -> Sequence[Sequence[Any]]:
+    """
+    Serialize all numpy arrays in a list of rows of values in the given
+    array format. Arrays in the default 'npy' format are serialized by the
+    adapter registered with sqlite so in that case ``values`` are returned
+    as is.
+
+    Args:
+        values: list of rows of values as passed to ``insert_many_values``
+        array_format: one of the ``ARRAY_FORMATS`` of the ``RunDescriber``
+    """
+    if array_format == 'npy':
+        return values
+    adapter = _array_adapters[array_format]
+    return [[adapter(value) if isinstance(value, ndarray) else value
+             for value in row]
+            for row in values]
+
+
 def _convert_complex(text: bytes) -> complex_type_union:
     out = io.BytesIO(text)
     out.seek(0)
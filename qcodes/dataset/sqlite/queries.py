@@ -7,9 +7,11 @@ import sqlite3
 import time
 import unicodedata
 import warnings
-from typing import (Any, Callable, Dict, List, Mapping, Optional, Sequence,
-                    Tuple, Union, cast)
 from copy import copy
+from operator import itemgetter
+from typing import (Any, Callable, Dict, Iterator, List, Mapping, Optional,
+                    Sequence, Tuple, Union, cast)
+
 import numpy as np
 from numpy import VisibleDeprecationWarning
 
@@ -35,6 +37,10 @@ from qcodes.utils.deprecate import deprecate
 
 log = logging.getLogger(__name__)
 
+# dict from parameter names to the lower and upper bound of the values of
+# the rows to select, see get_parameter_data
+SetpointRanges = Mapping[str, Tuple[Optional[Any], Optional[Any]]]
+
 
 _unicode_categories = ('Lu', 'Ll', 'Lt', 'Lm', 'Lo', 'Nd', 'Pc', 'Pd', 'Zs')
 
@@ -142,7 +148,9 @@ def get_parameter_data(conn: ConnectionPlus,
                        table_name: str,
                        columns: Sequence[str] = (),
                        start: Optional[int] = None,
-                       end: Optional[int] = None) -> \
+                       end: Optional[int] = None,
+                       setpoint_ranges: Optional[SetpointRanges] = None,
+                       last: Optional[int] = None) -> \
         Dict[str, Dict[str, np.ndarray]]:
     """
     Get data for one or more parameters and its dependencies. The data
@@ -150,11 +158,18 @@ def get_parameter_data(conn: ConnectionPlus,
     the outermost dict are the requested parameters and the keys of the second
     level are the loaded parameters (requested parameter followed by its
     dependencies). Start and End allows one to specify a range of rows to
-    be returned (1-based indexing, both ends are included). The range filter
-    is applied AFTER the NULL values have been filtered out.
+    be returned (1-based indexing, both ends are included). Last restricts
+    the returned rows to the last rows of that range. The range filters are
+    applied AFTER the NULL values have been filtered out and the setpoint
+    ranges have been applied.
     Be aware that different parameters that are independent of each other
     may return a different number of rows.
 
+    The setpoint ranges are applied as part of the SQL queries such that only
+    the matching rows are loaded. Consider creating indices for the setpoint
+    columns with :func:`create_setpoint_indices` when selecting small
+    ranges of large runs.
+
     Note that this assumes that all array type parameters have the same length.
     This should always be the case for a parameter and its dependencies.
 
@@ -168,6 +183,12 @@ def get_parameter_data(conn: ConnectionPlus,
             are returned.
         start: start of range; if None, then starts from the top of the table
         end: end of range; if None, then ends at the bottom of the table
+        setpoint_ranges: dict from the names of parameters to tuples of the
+            lower and upper bound (both included, None for no bound) of the
+            values of the rows to return. A range is only applied to the
+            parameter trees that contain the parameter.
+        last: if not None, only the last ``last`` rows of the range are
+            returned
     """
     rundescriber = get_rundescriber_from_result_table_name(conn, table_name)
 
@@ -175,6 +196,20 @@ def get_parameter_data(conn: ConnectionPlus,
     if len(columns) == 0:
         columns = [ps.name for ps in rundescriber.interdeps.non_dependencies]
 
+    if setpoint_ranges:
+        interdeps = rundescriber.interdeps
+        tree_names = set(columns)
+        for output_param in columns:
+            output_param_spec = interdeps._id_to_paramspec[output_param]
+            tree_names.update(
+                ps.name
+                for ps in interdeps.dependencies.get(output_param_spec, ()))
+        unknown = set(setpoint_ranges) - tree_names
+        if unknown:
+            raise ValueError(f"Cannot select a range of {sorted(unknown)}, "
+                             f"they are not part of the parameter trees of "
+                             f"{list(columns)}.")
+
     # loop over all the requested parameters
     for output_param in columns:
         output[output_param] = get_shaped_parameter_data_for_one_paramtree(
@@ -183,7 +218,9 @@ def get_parameter_data(conn: ConnectionPlus,
             rundescriber,
             output_param,
             start,
-            end)
+            end,
+            setpoint_ranges,
+            last)
     return output
 
 
@@ -193,7 +230,9 @@ def get_shaped_parameter_data_for_one_paramtree(
         rundescriber: RunDescriber,
         output_param: str,
         start: Optional[int],
-        end: Optional[int]
+        end: Optional[int],
+        setpoint_ranges: Optional[SetpointRanges] = None,
+        last: Optional[int] = None
 ) -> Dict[str, np.ndarray]:
     """
     Get the data for a parameter tree and reshape it according to the
@@ -210,7 +249,9 @@ def get_shaped_parameter_data_for_one_paramtree(
         rundescriber,
         output_param,
         start,
-        end
+        end,
+        setpoint_ranges,
+        last
     )
     if rundescriber.shapes is not None:
         shape = rundescriber.shapes.get(output_param)
@@ -255,104 +296,296 @@ def get_parameter_data_for_one_paramtree(
         rundescriber: RunDescriber,
         output_param: str,
         start: Optional[int],
-        end: Optional[int]
+        end: Optional[int],
+        setpoint_ranges: Optional[SetpointRanges] = None,
+        last: Optional[int] = None
 ) -> Tuple[Dict[str, np.ndarray], int]:
     interdeps = rundescriber.interdeps
-    data, paramspecs, n_rows = _get_data_for_one_param_tree(
-        conn, table_name, interdeps, output_param, start, end
+    output_param_spec = interdeps._id_to_paramspec[output_param]
+    dependency_params = list(interdeps.dependencies.get(output_param_spec, ()))
+    paramspecs = [output_param_spec] + dependency_params
+
+    condition = _build_tree_condition(
+        output_param, [ps.name for ps in paramspecs], setpoint_ranges
+    )
+    id_range, n_rows = _get_id_range_of_parameter_tree(
+        conn, table_name, condition, start, end, last
     )
-    if not paramspecs[0].name == output_param:
-        raise ValueError("output_param should always be the first "
-                         "parameter in a parameter tree. It is not")
-    _expand_data_to_arrays(data, paramspecs)
+    param_data: Dict[str, np.ndarray] = {}
+    if n_rows == 0:
+        return param_data, n_rows
+
+    # The data is loaded one column at a time to avoid creating a python
+    # object per row and to not hold a transposed copy of all the data in
+    # memory. Restricting each column to the same range of ids ensures that
+    # all columns are consistent even if rows are being inserted concurrently
+    for paramspec in paramspecs:
+        param_data[paramspec.name] = _get_column_as_array(
+            conn, table_name, paramspec, condition, id_range, n_rows
+        )
+    _expand_data_to_arrays(param_data, paramspecs)
+    return param_data, n_rows
 
-    param_data = {}
-    # Benchmarking shows that transposing the data with python types is
-    # faster than transposing the data using np.array.transpose
-    res_t = map(list, zip(*data))
 
-    for paramspec, column_data in zip(paramspecs, res_t):
+def iter_parameter_data_chunks_for_one_paramtree(
+        conn: ConnectionPlus,
+        table_name: str,
+        rundescriber: RunDescriber,
+        output_param: str,
+        chunk_size: int
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Iterate over the data of a parameter tree in chunks of at most
+    ``chunk_size`` rows, in the same format as
+    :func:`get_parameter_data_for_one_paramtree`. Each chunk continues after
+    the last id of the previous one, such that the whole run is read only
+    once no matter how many chunks it is split into.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    interdeps = rundescriber.interdeps
+    output_param_spec = interdeps._id_to_paramspec[output_param]
+    dependency_params = list(interdeps.dependencies.get(output_param_spec, ()))
+    paramspecs = [output_param_spec] + dependency_params
+
+    where, args = _build_tree_condition(
+        output_param, [ps.name for ps in paramspecs], None
+    )
+    last_id = 0
+    while True:
+        condition = (f"{where} AND id > ?", args + [last_id])
+        id_range, n_rows = _get_id_range_of_parameter_tree(
+            conn, table_name, condition, None, chunk_size
+        )
+        if n_rows == 0:
+            return
+        param_data: Dict[str, np.ndarray] = {}
+        for paramspec in paramspecs:
+            param_data[paramspec.name] = _get_column_as_array(
+                conn, table_name, paramspec, condition, id_range, n_rows
+            )
+        _expand_data_to_arrays(param_data, paramspecs)
+        yield param_data
+        last_id = id_range[1]
+
+
+def _build_tree_condition(
+        toplevel_param_name: str,
+        tree_param_names: Sequence[str],
+        setpoint_ranges: Optional[SetpointRanges]
+) -> Tuple[str, List[Any]]:
+    """
+    Build the WHERE clause and its arguments selecting the rows of a
+    parameter tree, i.e. the rows where the toplevel parameter is not NULL
+    and the parameters of the tree are within the given setpoint ranges.
+    """
+    clauses = [f"{toplevel_param_name} IS NOT NULL"]
+    args: List[Any] = []
+    for name, (lower, upper) in (setpoint_ranges or {}).items():
+        if name not in tree_param_names:
+            continue
+        if lower is not None:
+            clauses.append(f"{name} >= ?")
+            args.append(lower)
+        if upper is not None:
+            clauses.append(f"{name} <= ?")
+            args.append(upper)
+    return " AND ".join(clauses), args
+
+
+def _get_id_range_of_parameter_tree(
+        conn: ConnectionPlus,
+        table_name: str,
+        condition: Tuple[str, List[Any]],
+        start: Optional[int],
+        end: Optional[int],
+        last: Optional[int] = None
+) -> Tuple[Tuple[int, int], int]:
+    """
+    Get the first and last id and the number of rows of the results in the
+    (1-indexed) range from start to end of the rows matching the condition
+    (see :func:`_build_tree_condition`), optionally restricted to the last
+    ``last`` rows of that range.
+    """
+    where, args = condition
+
+    if last is not None and start is None and end is None:
+        # the last rows can be found by walking the table backwards without
+        # having to skip over all the other matching rows
+        ids_query = f"""
+                    SELECT id
+                    FROM "{table_name}"
+                    WHERE {where}
+                    ORDER BY id DESC
+                    LIMIT {max(last, 0)}
+                    """
+    else:
+        offset = max((start - 1), 0) if start is not None else 0
+        limit = max((end - offset), 0) if end is not None else -1
+
+        if start is not None and end is not None and start > end:
+            limit = 0
+
+        ids_query = f"""
+                    SELECT id
+                    FROM "{table_name}"
+                    WHERE {where}
+                    ORDER BY id
+                    LIMIT {limit} OFFSET {offset}
+                    """
+        if last is not None:
+            ids_query = f"""
+                        SELECT id
+                        FROM ({ids_query})
+                        ORDER BY id DESC
+                        LIMIT {max(last, 0)}
+                        """
+
+    sql = f"SELECT MIN(id), MAX(id), COUNT(id) FROM ({ids_query})"
+    first_id, last_id, n_rows = conn.cursor().execute(sql, args).fetchone()
+    return (first_id, last_id), n_rows
+
+
+def _get_column_as_array(
+        conn: ConnectionPlus,
+        table_name: str,
+        paramspec: ParamSpecBase,
+        condition: Tuple[str, List[Any]],
+        id_range: Tuple[int, int],
+        n_rows: int
+) -> np.ndarray:
+    """
+    Load the values of one column of the rows in the given id range matching
+    the condition (see :func:`_build_tree_condition`) into a numpy array.
+    """
+    where, args = condition
+    sql = f"""
+          SELECT {paramspec.name}
+          FROM "{table_name}"
+          WHERE {where}
+          AND id BETWEEN ? AND ?
+          ORDER BY id
+          """
+    query_args = list(args) + list(id_range)
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, query_args)
+    values = map(itemgetter(0), cursor)
+
+    if paramspec.type == "numeric":
+        # there is no reliable way to
+        # tell the difference between a float and and int loaded
+        # from sqlite numeric columns so always fall back to float
         try:
-            if paramspec.type == "numeric":
-                # there is no reliable way to
-                # tell the difference between a float and and int loaded
-                # from sqlite numeric columns so always fall back to float
-                dtype: Optional[type] = np.float64
-            else:
-                dtype = None
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore",
-                    category=VisibleDeprecationWarning,
-                    message="Creating an ndarray from ragged nested sequences"
-                )
-                # numpy warns here and coming versions
-                # will eventually raise
-                # for ragged arrays if you don't explicitly set
-                # dtype=object
-                # It is time consuming to detect ragged arrays here
-                # and it is expected to be a relatively rare situation
-                # so fallback to object if the regular dtype fail
-                param_data[paramspec.name] = np.array(column_data, dtype=dtype)
-        except:
-            # Not clear which error to catch here. This will only be clarified
-            # once numpy actually starts to raise here.
-            param_data[paramspec.name] = np.array(column_data, dtype=np.object)
-    return param_data, n_rows
+            return np.fromiter(values, dtype=np.float64, count=n_rows)
+        except (TypeError, ValueError):
+            # NULL or text values in a numeric column, rerun the query and
+            # let numpy figure out what to do with them below
+            cursor.execute(sql, query_args)
+            return column_values_to_array(
+                list(map(itemgetter(0), cursor)), np.float64
+            )
+    elif paramspec.type == "array":
+        return _array_column_values_to_array(values, n_rows)
+    else:
+        return column_values_to_array(list(values), None)
+
+
+def _array_column_values_to_array(values: Iterator[np.ndarray],
+                                  n_rows: int) -> np.ndarray:
+    """
+    Stack the arrays of an array type column into a preallocated array. If
+    the arrays turn out to differ in shape or dtype the remaining values are
+    collected and handed to numpy to sort out.
+    """
+    first = next(values)
+    if not isinstance(first, np.ndarray):
+        return column_values_to_array([first] + list(values), None)
+    output = np.empty((n_rows,) + first.shape, dtype=first.dtype)
+    output[0] = first
+    for i, value in enumerate(values, start=1):
+        if (not isinstance(value, np.ndarray)
+                or value.shape != first.shape
+                or value.dtype != first.dtype):
+            return column_values_to_array(
+                list(output[:i]) + [value] + list(values), None
+            )
+        output[i] = value
+    return output
 
 
-def _expand_data_to_arrays(data: List[List[Any]], paramspecs: Sequence[ParamSpecBase]) -> None:
+def column_values_to_array(column_data: List[Any],
+                           dtype: Optional[type]) -> np.ndarray:
+    """
+    Convert the values of a column to a numpy array of the given dtype,
+    falling back to an array of objects if the values do not fit into one
+    array of that dtype, e.g. arrays of different shapes.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                category=VisibleDeprecationWarning,
+                message="Creating an ndarray from ragged nested sequences"
+            )
+            # numpy warns here and coming versions
+            # will eventually raise
+            # for ragged arrays if you don't explicitly set
+            # dtype=object
+            # It is time consuming to detect ragged arrays here
+            # and it is expected to be a relatively rare situation
+            # so fallback to object if the regular dtype fail
+            return np.array(column_data, dtype=dtype)
+    except:
+        # Not clear which error to catch here. This will only be clarified
+        # once numpy actually starts to raise here.
+        return np.array(column_data, dtype=object)
+
+
+def _expand_data_to_arrays(param_data: Dict[str, np.ndarray],
+                           paramspecs: Sequence[ParamSpecBase]) -> None:
     types = [param.type for param in paramspecs]
     # if we have array type parameters expand all other parameters
     # to arrays
     if 'array' in types and ('numeric' in types or 'text' in types
                              or 'complex' in types):
         first_array_element = types.index('array')
-        numeric_elms = [i for i, x in enumerate(types)
-                        if x == "numeric"]
-        complex_elms = [i for i, x in enumerate(types)
-                        if x == 'complex']
-        text_elms = [i for i, x in enumerate(types)
-                     if x == "text"]
-        for row in data:
-            for element in numeric_elms:
-                row[element] = np.full_like(row[first_array_element],
-                                            row[element],
-                                            dtype=np.float)
-                # todo should we handle int/float types here
-                # we would in practice have to perform another
-                # loop to check that all elements of a given can be cast to
-                # int without loosing precision before choosing an integer
-                # representation of the array
-            for element in complex_elms:
-                row[element] = np.full_like(row[first_array_element],
-                                            row[element],
-                                            dtype=np.complex)
-            for element in text_elms:
-                strlen = len(row[element])
-                row[element] = np.full_like(row[first_array_element],
-                                            row[element],
-                                            dtype=f'U{strlen}')
-
-
-def _get_data_for_one_param_tree(conn: ConnectionPlus, table_name: str,
-                                 interdeps: InterDependencies_, output_param: str,
-                                 start: Optional[int], end: Optional[int]) \
-        -> Tuple[List[List[Any]], List[ParamSpecBase], int]:
-    output_param_spec = interdeps._id_to_paramspec[output_param]
-    # find all the dependencies of this param
-
-    dependency_params = list(interdeps.dependencies.get(output_param_spec, ()))
-    dependency_names = [param.name for param in dependency_params]
-    paramspecs = [output_param_spec] + dependency_params
-    res = get_parameter_tree_values(conn,
-                                    table_name,
-                                    output_param,
-                                    *dependency_names,
-                                    start=start,
-                                    end=end)
-    n_rows = len(res)
-    return res, paramspecs, n_rows
+        array_data = param_data[paramspecs[first_array_element].name]
+        t_map = {'numeric': np.float64, 'complex': np.complex128, 'text': None}
+        for paramspec in paramspecs:
+            if paramspec.type not in t_map:
+                continue
+            # todo should we handle int/float types here
+            # we would in practice have to perform another
+            # loop to check that all elements of a given can be cast to
+            # int without loosing precision before choosing an integer
+            # representation of the array
+            param_data[paramspec.name] = _expand_column_to_array_shape(
+                param_data[paramspec.name], array_data,
+                t_map[paramspec.type]
+            )
+
+
+def _expand_column_to_array_shape(column: np.ndarray,
+                                  array_data: np.ndarray,
+                                  dtype: Optional[type]) -> np.ndarray:
+    """
+    Repeat each value of a column of scalars such that it matches the shape
+    of the corresponding row of ``array_data``.
+    """
+    if array_data.dtype != object:
+        column = column.astype(dtype if dtype is not None else column.dtype,
+                               copy=False)
+        points_per_row = int(np.prod(array_data.shape[1:]))
+        return np.repeat(column, points_per_row).reshape(array_data.shape)
+
+    # the arrays differ in shape from row to row so we have no other option
+    # than expanding row by row
+    expanded = [np.full_like(array_row, value,
+                             dtype=dtype if dtype is not None
+                             else f'U{len(value)}')
+                for array_row, value in zip(array_data, column)]
+    return column_values_to_array(expanded, None)
 
 
 @deprecate('This method does not accurately represent the dataset.',
@@ -783,6 +1016,62 @@ def completed(conn: ConnectionPlus, run_id: int) -> bool:
                                  "run_id", run_id))
 
 
+def create_setpoint_indices(conn: ConnectionPlus,
+                            table_name: str,
+                            columns: Sequence[str]) -> List[str]:
+    """
+    Create an index for each of the given columns of a results table (if
+    it does not exist yet), such that rows can be selected efficiently by
+    the values of these columns, e.g. with the ``setpoint_ranges`` of
+    :func:`get_parameter_data`.
+
+    Args:
+        conn: database connection
+        table_name: name of the results table
+        columns: names of the columns to index
+
+    Returns:
+        The names of the indices
+    """
+    index_names = []
+    with atomic(conn) as conn:
+        for column in columns:
+            index_name = f"{table_name}__{column}__idx"
+            transaction(conn,
+                        f'CREATE INDEX IF NOT EXISTS "{index_name}" '
+                        f'ON "{table_name}" ({column})')
+            index_names.append(index_name)
+    return index_names
+
+
+def get_data_version(conn: ConnectionPlus) -> int:
+    """
+    Get the data version of the database, see
+    https://www.sqlite.org/pragma.html#pragma_data_version. The value
+    changes whenever a change made through another connection to the database
+    has been committed, but not for changes made through ``conn`` itself.
+
+    Args:
+        conn: database connection
+    """
+    c = atomic_transaction(conn, "PRAGMA data_version")
+    return one(c, 0)
+
+
+def get_last_rowid(conn: ConnectionPlus, table_name: str) -> int:
+    """
+    Get the largest rowid in the given results table, or 0 if the table is
+    empty.
+
+    Args:
+        conn: database connection
+        table_name: name of the results table
+    """
+    c = atomic_transaction(conn, f'SELECT MAX(id) FROM "{table_name}"')
+    last_rowid = one(c, 0)
+    return 0 if last_rowid is None else last_rowid
+
+
 def get_completed_timestamp_from_run_id(
         conn: ConnectionPlus, run_id: int) -> float:
     """
@@ -1800,12 +2089,19 @@ def append_shaped_parameter_data_to_existing_arrays(
         write_status: Dict[str, Optional[int]],
         read_status: Dict[str, int],
         data: Dict[str, Dict[str, np.ndarray]],
+        buffers: Optional[Dict[str, Dict[str, np.ndarray]]] = None
 ) -> Tuple[Dict[str, Optional[int]],
            Dict[str, int],
            Dict[str, Dict[str, np.ndarray]]]:
     """
     Append newly loaded data to an already existing cache.
 
+    Data of parameters without a known shape is appended to
+    preallocated buffers that grow geometrically such that appending is
+    amortized O(1) in the number of rows already in the cache. The arrays
+    in the returned ``data`` are then views of the filled part of these
+    buffers.
+
     Args:
         conn: The connection to the sqlite database
         table_name: The name of the table the data is stored in
@@ -1817,6 +2113,10 @@ def append_shaped_parameter_data_to_existing_arrays(
         data: Mapping from dependent parameter name to mapping
           from parameter name to numpy arrays that the data should be
           inserted into.
+        buffers: Mapping from dependent parameter name to mapping from
+          parameter name to the buffers backing the arrays in ``data``.
+          Updated in place. If not supplied, new buffers are allocated on
+          every call.
 
     Returns:
         Updated write and read status, and the updated ``data``
@@ -1824,6 +2124,8 @@ def append_shaped_parameter_data_to_existing_arrays(
     parameters = tuple(ps.name for ps in
                        rundescriber.interdeps.non_dependencies)
     merged_data = {}
+    if buffers is None:
+        buffers = {}
 
     updated_write_status = copy(write_status)
     updated_read_status = copy(read_status)
@@ -1848,6 +2150,7 @@ def append_shaped_parameter_data_to_existing_arrays(
         )
 
         existing_data = data.get(meas_parameter, {})
+        subtree_buffers = buffers.setdefault(meas_parameter, {})
 
         subtree_merged_data = {}
         subtree_parameters = set(existing_data.keys()) | set(new_data.keys())
@@ -1858,12 +2161,16 @@ def append_shaped_parameter_data_to_existing_arrays(
             new_values = new_data.get(subtree_param)
             if existing_values is not None and new_values is not None:
                 (subtree_merged_data[subtree_param],
-                 new_write_status) = _insert_into_data_dict(
+                 new_write_status,
+                 buffer) = _insert_into_data_dict(
                     existing_values,
                     new_values,
                     write_status.get(meas_parameter),
-                    shape=shape
+                    shape=shape,
+                    buffer=subtree_buffers.get(subtree_param)
                 )
+                if buffer is not None:
+                    subtree_buffers[subtree_param] = buffer
                 updated_write_status[meas_parameter] = new_write_status
             elif new_values is not None:
                 (subtree_merged_data[subtree_param],
@@ -1899,10 +2206,12 @@ def _insert_into_data_dict(
         existing_values: np.ndarray,
         new_values: np.ndarray,
         write_status: Optional[int],
-        shape: Optional[Tuple[int, ...]]
-) -> Tuple[np.ndarray, Optional[int]]:
+        shape: Optional[Tuple[int, ...]],
+        buffer: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, Optional[int], Optional[np.ndarray]]:
     if shape is None or write_status is None:
-        return np.append(existing_values, new_values, axis=0), None
+        values, buffer = _append_to_buffer(existing_values, new_values, buffer)
+        return values, None, buffer
     else:
         if existing_values.dtype.kind in ('U', 'S'):
             # string type arrays may be too small for the new data
@@ -1918,7 +2227,41 @@ def _insert_into_data_dict(
                         f"be flattened into a 1D array")
             return (np.append(existing_values.flatten(),
                               new_values.flatten(), axis=0),
-                    new_write_status)
+                    new_write_status, None)
         else:
             existing_values.ravel()[write_status:new_write_status] = new_values
-            return existing_values, new_write_status
+            return existing_values, new_write_status, None
+
+
+def _append_to_buffer(
+        existing_values: np.ndarray,
+        new_values: np.ndarray,
+        buffer: Optional[np.ndarray]
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Append ``new_values`` to ``existing_values`` along the first axis. If
+    ``existing_values`` is a view of the first rows of ``buffer`` and the
+    buffer has room for the new values they are written into the buffer,
+    otherwise a new buffer of twice the required size is allocated.
+
+    Returns:
+        A view of the filled part of the buffer and the buffer
+    """
+    if existing_values.shape[1:] != new_values.shape[1:]:
+        # let numpy decide how (and if) these can be combined
+        return np.append(existing_values, new_values, axis=0), None
+
+    n_existing = existing_values.shape[0]
+    n_total = n_existing + new_values.shape[0]
+    dtype = np.result_type(existing_values, new_values)
+
+    if (buffer is None
+            or existing_values.base is not buffer
+            or buffer.dtype != dtype
+            or buffer.shape[0] < n_total):
+        buffer = np.empty((2 * n_total,) + existing_values.shape[1:],
+                          dtype=dtype)
+        buffer[:n_existing] = existing_values
+
+    buffer[n_existing:n_total] = new_values
+    return buffer[:n_total], buffer
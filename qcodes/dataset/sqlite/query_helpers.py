@@ -152,6 +152,7 @@ def insert_many_values(conn: ConnectionPlus,
                        formatted_name: str,
                        columns: Sequence[str],
                        values: Sequence[VALUES],
+                       use_executemany: bool = False
                        ) -> int:
     """
     Inserts many values for the specified columns.
@@ -160,7 +161,18 @@ def insert_many_values(conn: ConnectionPlus,
     columns: ['xparam', 'yparam']
     values: [[x1, y1], [x2, y2], [x3, y3]]
 
+    By default the values are inserted in chunks of multi-row
+    ``INSERT ... VALUES (?,?),(?,?)...`` statements. If ``use_executemany``
+    is True a single-row statement is instead prepared once and executed for
+    every row via ``executemany``. Which of the two is faster depends on the
+    number of rows and columns inserted at a time, see the ``Adding5Params``
+    benchmark.
+
     NOTE this need to be committed before closing the connection.
+
+    Returns:
+        The id of the last row inserted by the first chunk for the multi-row
+        statements, the id of the last inserted row for ``executemany``.
     """
     # We demand that all values have the same length
     lengths = [len(val) for val in values]
@@ -168,6 +180,9 @@ def insert_many_values(conn: ConnectionPlus,
         raise ValueError('Wrong input format for values. Must specify the '
                          'same number of values for all columns. Received'
                          f' lengths {lengths}.')
+    if use_executemany:
+        return _insert_many_values_executemany(conn, formatted_name,
+                                               columns, values)
     no_of_rows = len(lengths)
     no_of_columns = lengths[0]
 
@@ -222,6 +237,33 @@ def insert_many_values(conn: ConnectionPlus,
     return return_value
 
 
+def _insert_many_values_executemany(conn: ConnectionPlus,
+                                    formatted_name: str,
+                                    columns: Sequence[str],
+                                    values: Sequence[VALUES],
+                                    ) -> int:
+    """
+    Insert the rows in ``values`` with one prepared single-row statement.
+
+    The query text only depends on the table and the columns such that
+    sqlite3's statement cache reuses the compiled statement across calls,
+    and the rows are bound directly without flattening them into a new list.
+    """
+    _columns = ",".join(columns)
+    _values = ",".join(["?"] * len(columns))
+    query = f'INSERT INTO "{formatted_name}" ({_columns}) VALUES ({_values})'
+
+    with atomic(conn) as conn:
+        c = conn.cursor()
+        c.executemany(query, values)
+        # sqlite3 does not set lastrowid for executemany
+        c.execute('SELECT last_insert_rowid()')
+        return_value = c.fetchone()[0]
+        c.close()
+
+    return return_value
+
+
 def modify_values(conn: ConnectionPlus,
                   formatted_name: str,
                   index: int,
@@ -0,0 +1,189 @@
+"""
+This module contains a content-addressed store for the snapshots of runs.
+
+Consecutive runs usually have (almost) identical snapshots of the station.
+Instead of storing the full snapshot of every run in the ``snapshot`` column
+of the ``runs`` table, the snapshots can be stored once in the
+``snapshot_bases`` table, addressed by the SHA-256 hash of their content.
+The table is only created the first time a snapshot is stored in the
+store, such that the schema of databases that do not use the store stays
+unchanged.
+The ``snapshot`` column of a run then only holds a reference to a base
+snapshot together with the delta (see
+:func:`qcodes.utils.metadata.diff_snapshots`) that turns the base snapshot
+into the snapshot of the run.
+
+Use :func:`resolve_snapshot_raw` to turn the content of the ``snapshot``
+column back into the full snapshot. Snapshots that are not references are
+returned unchanged, such that databases can contain both kinds of runs.
+Versions of QCoDeS without the store read the reference instead of the
+snapshot of runs stored in the store.
+"""
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from qcodes.dataset.sqlite.connection import (ConnectionPlus, atomic,
+                                              transaction)
+from qcodes.dataset.sqlite.queries import add_meta_data
+from qcodes.dataset.sqlite.query_helpers import one
+from qcodes.utils.metadata import apply_snapshot_diff, diff_snapshots
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_REF_KEY = "__qcodes_snapshot_ref__"
+_SNAPSHOT_REF_PREFIX = '{"' + SNAPSHOT_REF_KEY + '"'
+
+# parsed base snapshots by their hash. Since bases are addressed by their
+# content the cache can be shared between databases.
+_MAX_CACHED_BASES = 16
+_parsed_bases: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+
+
+def _create_bases_table(conn: ConnectionPlus) -> None:
+    transaction(conn, """
+    CREATE TABLE IF NOT EXISTS snapshot_bases (
+        id INTEGER PRIMARY KEY,
+        hash TEXT UNIQUE NOT NULL,
+        snapshot TEXT NOT NULL
+    )
+    """)
+
+
+def _bases_table_exists(conn: ConnectionPlus) -> bool:
+    cursor = transaction(conn, "SELECT name FROM sqlite_master "
+                               "WHERE type='table' AND name='snapshot_bases'")
+    return cursor.fetchone() is not None
+
+
+def snapshot_hash(snapshot: Dict[str, Any]) -> str:
+    """
+    The hash that addresses a snapshot in the store. It only depends on the
+    content of the snapshot, not on the order of its keys or the
+    formatting of its JSON representation.
+    """
+    canonical = json.dumps(snapshot, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def is_snapshot_ref(stored: Optional[str]) -> bool:
+    """
+    Is the content of the ``snapshot`` column of a run a reference into the
+    snapshot store (as opposed to a full snapshot)?
+    """
+    return stored is not None and stored.startswith(_SNAPSHOT_REF_PREFIX)
+
+
+def _cache_base(base_hash: str, snapshot: Dict[str, Any]) -> None:
+    _parsed_bases[base_hash] = snapshot
+    _parsed_bases.move_to_end(base_hash)
+    while len(_parsed_bases) > _MAX_CACHED_BASES:
+        _parsed_bases.popitem(last=False)
+
+
+def _load_base(conn: ConnectionPlus,
+               base_hash: str) -> Tuple[str, Dict[str, Any]]:
+    cursor = transaction(conn, "SELECT snapshot FROM snapshot_bases "
+                               "WHERE hash=?", base_hash)
+    row = cursor.fetchone()
+    if row is None:
+        raise RuntimeError(f"The snapshot base {base_hash} referenced by a "
+                           f"run does not exist in the database.")
+    base_raw = row[0]
+    base = _parsed_bases.get(base_hash)
+    if base is None:
+        base = json.loads(base_raw)
+    _cache_base(base_hash, base)
+    return base_raw, base
+
+
+def store_snapshot(conn: ConnectionPlus, run_id: int, snapshot_raw: str,
+                   max_delta_ratio: float = 0.5) -> None:
+    """
+    Store the snapshot of a run in the content-addressed snapshot store.
+
+    If a base snapshot with identical content exists, the run references it.
+    Otherwise the snapshot is compared to the most recently added base
+    snapshot, and the run references that base together with the delta if
+    the delta is small compared to the snapshot. If it is not, the snapshot
+    becomes a new base snapshot.
+
+    Args:
+        conn: Connection to the database.
+        run_id: The run to store the snapshot for.
+        snapshot_raw: The snapshot as a JSON string.
+        max_delta_ratio: The maximal size of the JSON representation of a
+            delta relative to the size of the snapshot for the delta to be
+            stored instead of a new base snapshot.
+    """
+    snapshot = json.loads(snapshot_raw)
+    new_hash = snapshot_hash(snapshot)
+
+    with atomic(conn) as conn:
+        _create_bases_table(conn)
+
+        cursor = transaction(conn, "SELECT id FROM snapshot_bases "
+                                   "WHERE hash=?", new_hash)
+        if cursor.fetchone() is not None:
+            base_hash, delta = new_hash, {}
+        else:
+            base_hash, delta = _delta_to_latest_base(
+                conn, snapshot, len(snapshot_raw) * max_delta_ratio)
+            if base_hash is None:
+                transaction(conn, "INSERT INTO snapshot_bases "
+                                  "(hash, snapshot) VALUES (?, ?)",
+                            new_hash, snapshot_raw)
+                _cache_base(new_hash, snapshot)
+                base_hash, delta = new_hash, {}
+
+        ref = json.dumps({SNAPSHOT_REF_KEY: {'base': base_hash,
+                                             'delta': delta}})
+        add_meta_data(conn, run_id, {'snapshot': ref})
+    log.debug(f"Stored snapshot of run {run_id} as reference to base "
+              f"{base_hash} with a delta of {len(ref)} characters.")
+
+
+def _delta_to_latest_base(
+        conn: ConnectionPlus, snapshot: Dict[str, Any],
+        max_delta_size: float) -> Tuple[Optional[str], Dict[str, Any]]:
+    cursor = transaction(conn, "SELECT hash FROM snapshot_bases "
+                               "ORDER BY id DESC LIMIT 1")
+    row = cursor.fetchone()
+    if row is None:
+        return None, {}
+    base_hash = row[0]
+    _, base = _load_base(conn, base_hash)
+    delta = diff_snapshots(base, snapshot)
+    if len(json.dumps(delta)) > max_delta_size:
+        return None, {}
+    return base_hash, delta
+
+
+def resolve_snapshot_raw(conn: ConnectionPlus,
+                         stored: Optional[str]) -> Optional[str]:
+    """
+    Turn the content of the ``snapshot`` column of a run into the snapshot
+    of the run as a JSON string. Full snapshots are returned as they are,
+    references into the snapshot store are reconstructed from their base
+    snapshot and delta.
+    """
+    if not is_snapshot_ref(stored):
+        return stored
+    assert stored is not None
+    ref = json.loads(stored)[SNAPSHOT_REF_KEY]
+    base_raw, base = _load_base(conn, ref['base'])
+    if not ref['delta']:
+        return base_raw
+    return json.dumps(apply_snapshot_diff(base, ref['delta']))
+
+
+def number_of_snapshot_bases(conn: ConnectionPlus) -> int:
+    """
+    The number of base snapshots in the snapshot store of a database.
+    """
+    if not _bases_table_exists(conn):
+        return 0
+    return one(transaction(conn, "SELECT COUNT(*) FROM snapshot_bases"),
+               'COUNT(*)')
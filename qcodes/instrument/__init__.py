@@ -1,5 +1,5 @@
 from .base import Instrument, find_or_create_instrument
-from .ip import IPInstrument
+from .ip import IPConnectionPool, IPInstrument
 from .visa import VisaInstrument
 from .channel import InstrumentChannel, ChannelList
 from .function import Function
@@ -12,5 +12,6 @@ from .parameter import (
     ManualParameter,
     ScaledParameter,
     combine,
-    CombinedParameter)
+    CombinedParameter,
+    deferred_post_delays)
 from .sweep_values import SweepFixedValues, SweepValues
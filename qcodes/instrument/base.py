@@ -1,10 +1,14 @@
 """Instrument base class."""
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 import weakref
 import logging
 from abc import ABC, abstractmethod
 from typing import Sequence, Optional, Dict, Union, Callable, Any, List, \
-    TYPE_CHECKING, cast, Type
+    TYPE_CHECKING, cast, Type, Iterator
 
 import numpy as np
 from qcodes.utils.helpers import DelegateAttributes, strip_attrs, full_class
@@ -13,6 +17,7 @@ from qcodes.utils.validators import Anything
 from qcodes.logger.instrument_logger import get_instrument_logger
 from .parameter import Parameter, _BaseParameter
 from .function import Function
+from .batched_get import BatchedGet
 
 if TYPE_CHECKING:
     from qcodes.instrument.channel import ChannelList
@@ -20,6 +25,11 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# When set, instruments record in the snapshot of each of their parameters
+# how long it took to snapshot it, see :meth:`.Station.snapshot_base`
+_record_snapshot_durations: ContextVar[bool] = ContextVar(
+    '_record_snapshot_durations', default=False)
+
 
 class InstrumentBase(Metadatable, DelegateAttributes):
     """
@@ -199,6 +209,7 @@ class InstrumentBase(Metadatable, DelegateAttributes):
             "__class__": full_class(self)
         }
 
+        record_durations = _record_snapshot_durations.get()
         snap['parameters'] = {}
         for name, param in self.parameters.items():
             if param.snapshot_exclude:
@@ -207,6 +218,7 @@ class InstrumentBase(Metadatable, DelegateAttributes):
                 update_par: Optional[bool] = False
             else:
                 update_par = update
+            t_start = time.perf_counter()
             try:
                 snap['parameters'][name] = param.snapshot(update=update_par)
             except:
@@ -216,6 +228,9 @@ class InstrumentBase(Metadatable, DelegateAttributes):
                                  f"parameter: {name}")
                 self.log.info(f"Details for Snapshot:", exc_info=True)
                 snap['parameters'][name] = param.snapshot(update=False)
+            if record_durations:
+                snap['parameters'][name]['snapshot_duration'] = \
+                    time.perf_counter() - t_start
 
         for attr in set(self._meta_attrs):
             if hasattr(self, attr):
@@ -413,6 +428,19 @@ class Instrument(InstrumentBase, AbstractInstrument):
 
     shared_kwargs = ()
 
+    batch_query_separator: Optional[str] = None
+    """
+    Separator used to join the query commands of several parameters into a
+    single query in :meth:`batched_get`, e.g. ``';'`` for SCPI instruments.
+    Drivers of instruments that accept such combined queries opt in to
+    batching by setting it. If None, batched gets query the parameters one
+    after the other."""
+
+    batch_response_separator: Optional[str] = None
+    """
+    Separator of the responses to a combined query. If None, the
+    ``batch_query_separator`` is used."""
+
     _all_instruments: Dict[str, weakref.ref] = {}
     _type = None
     _instances: List[weakref.ref] = []
@@ -420,6 +448,7 @@ class Instrument(InstrumentBase, AbstractInstrument):
     def __init__(self, name: str,
                  metadata: Optional[Dict] = None) -> None:
         self._t0 = time.time()
+        self._io_executor: Optional[ThreadPoolExecutor] = None
 
         super().__init__(name, metadata)
 
@@ -428,6 +457,29 @@ class Instrument(InstrumentBase, AbstractInstrument):
 
         self.record_instance(self)
 
+    @contextmanager
+    def batched_get(self) -> Iterator[BatchedGet]:
+        """
+        Context manager collecting gets of parameters of this instrument
+        (and of its channels) that are executed in a single round trip when
+        the context exits. Parameters whose ``get_cmd`` is a query string are
+        combined into one query joined with :attr:`batch_query_separator`,
+        the combined response is split and passed on to the ``get_parser``
+        and cache of each parameter. Other parameters, or all of them if the
+        driver does not set :attr:`batch_query_separator`, are gotten one
+        after the other.
+
+        Example:
+
+            >>> with instr.batched_get() as batch:
+            ...     batch.add(instr.voltage)
+            ...     batch.add(instr.current)
+            >>> voltage, current = batch.values
+        """
+        batch = BatchedGet(self)
+        yield batch
+        batch.execute()
+
     def get_idn(self) -> Dict[str, Optional[str]]:
         """
         Parse a standard VISA ``*IDN?`` response into an ID dict.
@@ -515,6 +567,10 @@ class Instrument(InstrumentBase, AbstractInstrument):
         if hasattr(self, 'connection') and hasattr(self.connection, 'close'):
             self.connection.close()
 
+        io_executor = getattr(self, '_io_executor', None)
+        if io_executor is not None:
+            io_executor.shutdown(wait=False)
+
         strip_attrs(self, whitelist=['_name'])
         self.remove_instance(self)
 
@@ -753,6 +809,51 @@ class Instrument(InstrumentBase, AbstractInstrument):
             e.args = e.args + ('asking ' + repr(cmd) + ' to ' + inst,)
             raise e
 
+    @property
+    def io_executor(self) -> ThreadPoolExecutor:
+        """
+        Executor with a single thread in which the asynchronous methods of
+        this instrument (:meth:`aask`, :meth:`awrite`) and of its parameters
+        (:meth:`.Parameter.aget`, :meth:`.Parameter.aset`) communicate with
+        the hardware. Using one thread per instrument keeps the commands sent
+        to each instrument in order while different instruments are
+        communicated with concurrently. Do not communicate with the
+        instrument synchronously from other threads while it is in use
+        asynchronously.
+        """
+        if getattr(self, '_io_executor', None) is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f'{self.name}_io')
+        assert self._io_executor is not None
+        return self._io_executor
+
+    async def awrite(self, cmd: str) -> None:
+        """
+        Asynchronous version of :meth:`write`, which is run in the
+        :attr:`io_executor` of the instrument such that the event loop is
+        not blocked while waiting for the hardware.
+
+        Args:
+            cmd: The string to send to the instrument.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.io_executor, self.write, cmd)
+
+    async def aask(self, cmd: str) -> str:
+        """
+        Asynchronous version of :meth:`ask`, which is run in the
+        :attr:`io_executor` of the instrument such that the event loop is
+        not blocked while waiting for the hardware.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Returns:
+            response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.io_executor, self.ask, cmd)
+
     def ask_raw(self, cmd: str) -> str:
         """
         Low level method to write to the hardware and return a response.
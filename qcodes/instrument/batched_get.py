@@ -0,0 +1,146 @@
+"""
+Batched queries of parameters of one instrument, see
+:meth:`.Instrument.batched_get`.
+"""
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from qcodes.utils.command import Command
+
+if TYPE_CHECKING:
+    from .base import Instrument
+    from .parameter import _BaseParameter
+
+
+class BatchedGet:
+    """
+    Collects gets of parameters of one instrument that are executed
+    together. The query commands of the parameters are joined with the
+    ``batch_query_separator`` of the instrument (e.g. ``;`` for SCPI) and sent
+    in a single query. The response is split with the
+    ``batch_response_separator`` of the instrument and each part is passed
+    to the parameter it belongs to, which parses and validates it and
+    updates its cache exactly as a regular ``get`` would.
+
+    Parameters that can not be batched, i.e. those that do not have a plain
+    query string as ``get_cmd``, and all parameters of instruments that do
+    not declare a ``batch_query_separator`` are simply gotten one after the
+    other.
+
+    Use :meth:`.Instrument.batched_get` to create a batch.
+
+    Args:
+        instrument: The instrument whose parameters are batched.
+    """
+
+    def __init__(self, instrument: 'Instrument'):
+        self._instrument = instrument
+        self._parameters: List['_BaseParameter'] = []
+        self._values: Optional[List[Any]] = None
+
+    def add(self, parameter: '_BaseParameter') -> None:
+        """
+        Add a parameter to the batch.
+
+        Raises:
+            ValueError: If the parameter does not belong to the instrument.
+            RuntimeError: If the batch has already been executed.
+        """
+        if self._values is not None:
+            raise RuntimeError("Cannot add parameters to a batch that has "
+                               "already been executed.")
+        if parameter.root_instrument is not self._instrument:
+            raise ValueError(f"Cannot batch {parameter.full_name}, it does "
+                             f"not belong to {self._instrument.name}.")
+        self._parameters.append(parameter)
+
+    @property
+    def parameters(self) -> List['_BaseParameter']:
+        """
+        The parameters in the batch in the order they were added.
+        """
+        return list(self._parameters)
+
+    @property
+    def values(self) -> List[Any]:
+        """
+        The values of the parameters in the order they were added.
+
+        Raises:
+            RuntimeError: If the batch has not been executed yet.
+        """
+        if self._values is None:
+            raise RuntimeError("The batch has not been executed yet.")
+        return self._values
+
+    def execute(self) -> List[Any]:
+        """
+        Get the values of the parameters of the batch and update their
+        caches.
+
+        Returns:
+            The values of the parameters in the order they were added.
+
+        Raises:
+            ValueError: If the number of parts of the response does not
+                match the number of batched queries.
+        """
+        values: List[Any] = [None] * len(self._parameters)
+        batched = [i for i, param in enumerate(self._parameters)
+                   if self._query_string(param) is not None]
+        query_separator = self._instrument.batch_query_separator
+        if query_separator is None or len(batched) < 2:
+            batched = []
+
+        if batched:
+            responses = self._query(
+                [self._query_string(self._parameters[i]) for i in batched])
+            for i, response in zip(batched, responses):
+                param = self._parameters[i]
+                try:
+                    values[i] = param._update_from_raw_value(response)
+                except Exception as e:
+                    e.args = e.args + (f'getting {param}',)
+                    raise e
+
+        batched_set = set(batched)
+        for i, param in enumerate(self._parameters):
+            if i not in batched_set:
+                values[i] = param.get()
+
+        self._values = values
+        return values
+
+    def _query(self, commands: List[Optional[str]]) -> List[str]:
+        instrument = self._instrument
+        query_separator = instrument.batch_query_separator
+        assert query_separator is not None
+        response_separator = instrument.batch_response_separator
+        if response_separator is None:
+            response_separator = query_separator
+
+        response = instrument.ask(
+            query_separator.join(cmd for cmd in commands if cmd is not None))
+        parts = [part.strip() for part in
+                 response.strip().split(response_separator)]
+        if len(parts) != len(commands):
+            raise ValueError(f"Expected {len(commands)} responses to the "
+                             f"batched query {commands} of "
+                             f"{instrument.name}, got {len(parts)}: "
+                             f"{response!r}")
+        return parts
+
+    @staticmethod
+    def _query_string(parameter: '_BaseParameter') -> Optional[str]:
+        """
+        The query string of a parameter if its ``get_cmd`` is a plain query
+        sent with ``ask``, None otherwise.
+        """
+        get_raw = getattr(parameter, 'get_raw', None)
+        if not isinstance(get_raw, Command):
+            return None
+        cmd = getattr(get_raw, 'cmd_str', None)
+        if not isinstance(cmd, str) or get_raw.arg_count != 0 or \
+                getattr(get_raw, 'output_parser', None) is not None or \
+                getattr(get_raw.exec_str, '__name__', None) != 'ask':
+            return None
+        return cmd
@@ -0,0 +1,95 @@
+"""
+The interface through which drivers declare that a measured parameter can
+acquire a whole sweep of another parameter into a buffer of the instrument,
+see :class:`BufferedSweep`.
+"""
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .parameter import _BaseParameter
+
+
+class BufferedSweep:
+    """
+    Base class for the buffered acquisition of a measured parameter during a
+    sweep of another parameter. Drivers attach an instance to the measured
+    parameter as its ``buffered_sweep`` attribute; sweep functions such as
+    :func:`qcodes.utils.dataset.doNd.do1d` use it for sweeps it supports
+    when asked to (``use_buffered_sweep=True``), see
+    :func:`get_buffered_sweep`.
+
+    A buffered sweep of a line of ``setpoints`` proceeds as follows:
+
+    1. :meth:`arm` prepares the instrument to acquire one value per setpoint.
+    2. If the sweep is :attr:`hardware_timed` the instrument steps the swept
+       parameter through the setpoints itself. Otherwise the caller sets
+       each setpoint (including its delays) and calls :meth:`trigger` after
+       each of them.
+    3. :meth:`fetch` returns the values of all points of the line.
+
+    :meth:`disarm` is called if the sweep is aborted before :meth:`fetch`.
+    Subclasses implement :meth:`supports`, :meth:`arm` and :meth:`fetch`
+    and, for sweeps that are not hardware timed, :meth:`trigger`.
+    """
+
+    #: Whether the instrument sets the setpoints of the swept parameter
+    #: itself, such that the caller must not set them.
+    hardware_timed: bool = False
+
+    def supports(self, param_set: '_BaseParameter',
+                 setpoints: np.ndarray) -> bool:
+        """
+        Can the values of the parameter be acquired in a buffered sweep of
+        ``param_set`` through ``setpoints``?
+        """
+        raise NotImplementedError
+
+    def arm(self, param_set: '_BaseParameter', setpoints: np.ndarray,
+            delay: float) -> None:
+        """
+        Prepare the acquisition of one value per setpoint.
+
+        Args:
+            param_set: The swept parameter.
+            setpoints: The values ``param_set`` is swept through.
+            delay: The time to wait after setting each setpoint before
+                acquiring a value. Only used by hardware timed sweeps, for
+                other sweeps the caller waits.
+        """
+        raise NotImplementedError
+
+    def trigger(self) -> None:
+        """
+        Acquire the value at the current setpoint. Called after each
+        setpoint is set for sweeps that are not hardware timed.
+        """
+        raise NotImplementedError
+
+    def fetch(self) -> np.ndarray:
+        """
+        Return the values of all points of the sweep, running the sweep
+        first if it is hardware timed.
+        """
+        raise NotImplementedError
+
+    def disarm(self) -> None:
+        """
+        Return the instrument to its state before :meth:`arm` if the sweep
+        is aborted before :meth:`fetch` is called.
+        """
+
+
+def get_buffered_sweep(parameter: '_BaseParameter',
+                       param_set: '_BaseParameter',
+                       setpoints: np.ndarray) -> Optional[BufferedSweep]:
+    """
+    Return the :class:`BufferedSweep` of ``parameter`` if it supports a
+    sweep of ``param_set`` through ``setpoints``, else None.
+    """
+    buffered_sweep = getattr(parameter, 'buffered_sweep', None)
+    if (isinstance(buffered_sweep, BufferedSweep)
+            and buffered_sweep.supports(param_set, setpoints)):
+        return buffered_sweep
+    return None
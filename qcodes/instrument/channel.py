@@ -106,10 +106,21 @@ class MultiChannelInstrumentParameter(MultiParameter):
     def get_raw(self) -> Tuple[ParamRawDataType, ...]:
         """
         Return a tuple containing the data from each of the channels in the
-        list.
-        """
-        return tuple(chan.parameters[self._param_name].get() for chan
-                     in self._channels)
+        list. If the channels belong to an instrument that supports batched
+        queries (see :meth:`.Instrument.batched_get`), the channels are
+        queried in a single round trip.
+        """
+        params = [chan.parameters[self._param_name]
+                  for chan in self._channels]
+        root = params[0].root_instrument if params else None
+        if (isinstance(root, Instrument)
+                and root.batch_query_separator is not None
+                and all(param.root_instrument is root for param in params)):
+            with root.batched_get() as batch:
+                for param in params:
+                    batch.add(param)
+            return tuple(batch.values)
+        return tuple(param.get() for param in params)
 
     def set_raw(self, value: ParamRawDataType) -> None:
         """
@@ -1,7 +1,10 @@
 """Ethernet instrument driver class based on sockets."""
+import select
 import socket
 import logging
-from typing import Dict, Sequence, Optional, Any, Type
+import threading
+import time
+from typing import Dict, List, Sequence, Optional, Any, Tuple, Type
 from types import TracebackType
 
 from .base import Instrument
@@ -9,6 +12,154 @@ from .base import Instrument
 log = logging.getLogger(__name__)
 
 
+def _open_socket(address: Optional[str], port: Optional[int],
+                 timeout: float) -> socket.socket:
+    log.info("Opening socket")
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        log.info("Connecting socket to {}:{}".format(address, port))
+        sock.connect((address, port))
+        sock.settimeout(float(timeout))
+    except (ConnectionError, socket.timeout):
+        log.warning("Socket connection failed")
+        sock.close()
+        raise
+    return sock
+
+
+def _close_socket(sock: socket.socket) -> None:
+    log.info("Socket shutdown")
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        # the other end may already have closed the connection
+        pass
+    log.info("Socket closing")
+    sock.close()
+    log.info("Socket closed")
+
+
+class IPConnectionPool:
+    """
+    A pool of open socket connections to ethernet instruments, which can be
+    shared between :class:`IPInstrument` s (see their ``connection_pool``
+    argument).
+
+    Instead of being closed, connections that are released by
+    non-persistent instruments are kept open for ``keep_alive`` seconds and
+    are reused by the next instrument that connects to the same address and
+    port, such that these instruments do not pay for a TCP handshake per
+    command. Idle connections that have been closed by the instrument in the
+    meantime are detected and discarded.
+
+    New connections are opened with up to ``reconnect_attempts`` retries
+    with exponential backoff, starting at ``reconnect_backoff`` seconds. An
+    instrument that uses a pool also reconnects automatically if it finds
+    its connection broken when sending a command.
+
+    Args:
+        keep_alive: Seconds to keep idle connections open. If 0, released
+            connections are closed immediately.
+        reconnect_attempts: Number of times to retry opening a connection
+            that is refused or times out.
+        reconnect_backoff: Seconds to wait before the first retry, the
+            time is doubled for every further retry.
+    """
+
+    def __init__(self, keep_alive: float = 30,
+                 reconnect_attempts: int = 3,
+                 reconnect_backoff: float = 0.1):
+        self.keep_alive = keep_alive
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_backoff = reconnect_backoff
+        self._idle: Dict[Tuple[Optional[str], Optional[int]],
+                         List[Tuple[socket.socket, float]]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, address: Optional[str], port: Optional[int],
+                timeout: float) -> Tuple[socket.socket, bool]:
+        """
+        Get a connection to the given address and port, either an idle one
+        from the pool or a new one.
+
+        Returns:
+            The connected socket and whether it is a new connection.
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get((address, port), [])
+            expired = [sock for sock, released in idle
+                       if now - released > self.keep_alive]
+            idle[:] = [(sock, released) for sock, released in idle
+                       if now - released <= self.keep_alive]
+        for sock in expired:
+            _close_socket(sock)
+
+        while True:
+            with self._lock:
+                if not idle:
+                    break
+                sock, _ = idle.pop()
+            if self._is_alive(sock):
+                log.debug(f"Reusing connection to {address}:{port}")
+                sock.settimeout(float(timeout))
+                return sock, False
+            _close_socket(sock)
+
+        return self._open(address, port, timeout), True
+
+    def release(self, address: Optional[str], port: Optional[int],
+                sock: socket.socket) -> None:
+        """
+        Return a connection that is no longer used to the pool.
+        """
+        if self.keep_alive <= 0:
+            _close_socket(sock)
+            return
+        with self._lock:
+            self._idle.setdefault((address, port), []).append(
+                (sock, time.monotonic()))
+
+    def close_idle(self) -> None:
+        """
+        Close all idle connections of the pool.
+        """
+        with self._lock:
+            idle = [sock for connections in self._idle.values()
+                    for sock, _ in connections]
+            self._idle.clear()
+        for sock in idle:
+            _close_socket(sock)
+
+    def _open(self, address: Optional[str], port: Optional[int],
+              timeout: float) -> socket.socket:
+        for attempt in range(self.reconnect_attempts + 1):
+            try:
+                sock = _open_socket(address, port, timeout)
+                break
+            except (ConnectionError, socket.timeout):
+                if attempt == self.reconnect_attempts:
+                    raise
+                delay = self.reconnect_backoff * 2 ** attempt
+                log.warning(f"Connecting to {address}:{port} failed, "
+                            f"retrying in {delay} s")
+                time.sleep(delay)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    @staticmethod
+    def _is_alive(sock: socket.socket) -> bool:
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return True
+            # a readable socket without data has been closed by the other end
+            return sock.recv(1, socket.MSG_PEEK) != b''
+        except (OSError, ValueError):
+            return False
+
+
 class IPInstrument(Instrument):
     r"""
     Bare socket ethernet instrument implementation. Use of `VisaInstrument`
@@ -33,6 +184,18 @@ class IPInstrument(Instrument):
         write_confirmation: Whether the instrument acknowledges writes
             with some response we should read. Default True.
 
+        read_terminator: Character(s) that terminate each response. If
+            given, responses are read until (and stripped of) this
+            terminator, even if they arrive in several packets, and data
+            received after it is kept for the next read. If None (default),
+            whatever a single read from the socket returns is the response.
+
+        connection_pool: A :class:`IPConnectionPool` to get connections
+            from. Non-persistent instruments return their connection to the
+            pool instead of closing it, and broken connections are
+            reopened automatically. If None (default), a new connection is
+            opened for every connect.
+
         kwargs: additional static metadata to add to this
             instrument's JSON snapshot.
 
@@ -47,6 +210,8 @@ class IPInstrument(Instrument):
                  terminator: str = '\n',
                  persistent: bool = True,
                  write_confirmation: bool = True,
+                 read_terminator: Optional[str] = None,
+                 connection_pool: Optional[IPConnectionPool] = None,
                  **kwargs: Any):
         super().__init__(name, **kwargs)
 
@@ -54,12 +219,19 @@ class IPInstrument(Instrument):
         self._port = port
         self._timeout = timeout
         self._terminator = terminator
+        self._read_terminator = read_terminator
         self._confirmation = write_confirmation
+        self._connection_pool = connection_pool
 
         self._ensure_connection = EnsureConnection(self)
         self._buffer_size = 1400
+        self._read_buffer = bytearray()
 
         self._socket: Optional[socket.socket] = None
+        # whether the socket has been freshly opened, as opposed to being
+        # reused from the connection pool
+        self._socket_is_new = False
+        self._socket_key: Tuple[Optional[str], Optional[int]] = (None, None)
 
         self.set_persistent(persistent)
 
@@ -100,35 +272,45 @@ class IPInstrument(Instrument):
             self._disconnect()
 
     def flush_connection(self) -> None:
+        self._read_buffer.clear()
         self._recv()
 
     def _connect(self) -> None:
         if self._socket is not None:
             self._disconnect()
 
-        try:
-            log.info("Opening socket")
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            log.info("Connecting socket to {}:{}".format(self._address,
-                                                         self._port))
-            self._socket.connect((self._address, self._port))
-            self.set_timeout(self._timeout)
-        except ConnectionRefusedError:
-            log.warning("Socket connection failed")
-            if self._socket is not None:
-                self._socket.close()
-            self._socket = None
-            raise
-
-    def _disconnect(self) -> None:
+        self._read_buffer.clear()
+        if self._connection_pool is None:
+            self._socket = _open_socket(self._address, self._port,
+                                        self._timeout)
+            self._socket_is_new = True
+        else:
+            self._socket, self._socket_is_new = \
+                self._connection_pool.acquire(self._address, self._port,
+                                              self._timeout)
+        self._socket_key = (self._address, self._port)
+
+    def _disconnect(self, discard: bool = False) -> None:
+        """
+        Close the connection or, if the instrument uses a connection pool,
+        return it to the pool.
+
+        Args:
+            discard: Close the connection even if the instrument uses a
+                connection pool, e.g. because its state is unknown after an
+                error.
+        """
         if self._socket is None:
             return
-        log.info("Socket shutdown")
-        self._socket.shutdown(socket.SHUT_RDWR)
-        log.info("Socket closing")
-        self._socket.close()
-        log.info("Socket closed")
-        self._socket = None
+        sock, self._socket = self._socket, None
+        if self._read_buffer:
+            # unread data would end up in the response of the next user
+            discard = True
+            self._read_buffer.clear()
+        if self._connection_pool is None or discard:
+            _close_socket(sock)
+        else:
+            self._connection_pool.release(*self._socket_key, sock)
 
     def set_timeout(self, timeout: float) -> None:
         """
@@ -157,21 +339,62 @@ class IPInstrument(Instrument):
             raise RuntimeError(f'IPInstrument {self.name} is not connected')
         data = cmd + self._terminator
         log.debug(f"Writing {data} to instrument {self.name}")
-        self._socket.sendall(data.encode())
+        try:
+            self._socket.sendall(data.encode())
+        except ConnectionError:
+            if self._connection_pool is None:
+                raise
+            log.warning(f"Connection of {self.name} broken, reconnecting")
+            self._disconnect(discard=True)
+            self._connect()
+            assert self._socket is not None
+            self._socket.sendall(data.encode())
 
     def _recv(self) -> str:
         if self._socket is None:
             raise RuntimeError(f'IPInstrument {self.name} is not connected')
-        result = self._socket.recv(self._buffer_size)
+        if self._read_terminator is not None:
+            return self._recv_until(self._read_terminator.encode()).decode()
+
+        if self._read_buffer:
+            result = bytes(self._read_buffer)
+            self._read_buffer.clear()
+        else:
+            result = self._socket.recv(self._buffer_size)
         log.debug(f"Got {result!r} from instrument {self.name}")
         if result == b'':
             log.warning("Got empty response from Socket recv() "
                         "Connection broken.")
         return result.decode()
 
+    def _recv_until(self, terminator: bytes) -> bytes:
+        """
+        Read from the socket until the terminator is found and return the
+        data before it. Data received after the terminator stays in the
+        buffer for the next read.
+        """
+        assert self._socket is not None
+        buffer = self._read_buffer
+        start = 0
+        while True:
+            index = buffer.find(terminator, start)
+            if index >= 0:
+                result = bytes(buffer[:index])
+                del buffer[:index + len(terminator)]
+                log.debug(f"Got {result!r} from instrument {self.name}")
+                return result
+            # only scan the new data (and a possible partial terminator at
+            # the end of the old data) next time
+            start = max(0, len(buffer) - len(terminator) + 1)
+            chunk = self._socket.recv(self._buffer_size)
+            if chunk == b'':
+                raise ConnectionError(f"Connection of {self.name} closed by "
+                                      f"the instrument while reading.")
+            buffer += chunk
+
     def close(self) -> None:
         """Disconnect and irreversibly tear down the instrument."""
-        self._disconnect()
+        self._disconnect(discard=True)
         super().close()
 
     def write_raw(self, cmd: str) -> None:
@@ -234,6 +457,7 @@ class IPInstrument(Instrument):
         snap['confirmation'] = self._confirmation
         snap['address'] = self._address
         snap['terminator'] = self._terminator
+        snap['read_terminator'] = self._read_terminator
         snap['timeout'] = self._timeout
         snap['persistent'] = self._persistent
 
@@ -266,4 +490,6 @@ class EnsureConnection:
                  traceback: Optional[TracebackType]) -> None:
         """Possibly disconnect on exiting the context."""
         if not self.instrument._persistent:
-            self.instrument._disconnect()
+            # after an error the connection may have a pending response, so
+            # it must not be reused
+            self.instrument._disconnect(discard=exc_type is not None)
@@ -47,7 +47,7 @@ class IPToVisa(VisaInstrument, IPInstrument):  # type: ignore[misc]
                  **kwargs: Any):
 
         # remove IPInstrument-specific kwargs
-        ipkwargs = ['write_confirmation']
+        ipkwargs = ['write_confirmation', 'read_terminator', 'connection_pool']
         newkwargs = {kw: val for (kw, val) in kwargs.items()
                      if kw not in ipkwargs}
 
@@ -72,9 +72,12 @@ more specialized ones:
 # create an ABC for Parameter and MultiParameter - or just remove this statement
 # if everyone is happy to use these classes.
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import copy
 from operator import xor
+import asyncio
 import time
 import logging
 import os
@@ -85,7 +88,7 @@ from typing import Optional, Sequence, TYPE_CHECKING, Union, Callable, List, \
     Dict, Any, Sized, Iterable, cast, Type, Tuple, Iterator
 from typing_extensions import Protocol
 from types import TracebackType
-from functools import wraps
+from functools import partial, wraps
 
 import numpy
 
@@ -111,6 +114,76 @@ ParamRawDataType = Any
 
 log = logging.getLogger(__name__)
 
+# a step of setting a parameter, see :meth:`_BaseParameter._set_actions`
+_SetAction = Union[float, Tuple[Callable[..., Any], Tuple[Any, ...]]]
+
+
+class DeferredPostDelays:
+    """
+    A group of parameter sets whose ``post_delay`` s are waited for once,
+    at the end of the group, instead of after each set. Each parameter set
+    within the group records the time at which it is ready, i.e. when its
+    ``post_delay`` has passed, and the group waits until the latest of these.
+    Use :func:`deferred_post_delays` to create a group.
+    """
+
+    def __init__(self) -> None:
+        self.ready_at: float = 0.0
+        """
+        The ``time.perf_counter`` time at which all parameters set within the
+        group are ready."""
+
+    def defer(self, parameter: '_BaseParameter', ready_at: float) -> None:
+        """
+        Record that a parameter set within the group is ready at the
+        ``time.perf_counter`` time ``ready_at``.
+        """
+        parameter._ready_at = ready_at
+        self.ready_at = max(self.ready_at, ready_at)
+
+    def wait(self) -> None:
+        """
+        Wait until all parameters set within the group are ready.
+        """
+        remaining = self.ready_at - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+_deferred_post_delays: ContextVar[Optional[DeferredPostDelays]] = \
+    ContextVar('_deferred_post_delays', default=None)
+
+
+@contextmanager
+def deferred_post_delays() -> Iterator[DeferredPostDelays]:
+    """
+    Context manager in which the ``post_delay`` of the parameters that are
+    set is not waited for after each set. Instead all hardware writes are
+    issued first and the context waits once for the largest outstanding
+    delay when it exits, such that the settling of the parameters overlaps.
+    A parameter that is set several times within the context (e.g. when
+    ramping it in steps) still waits for its own ``post_delay`` before it is
+    set again. Nested contexts join the outermost one.
+
+    Example:
+
+        >>> with deferred_post_delays():
+        ...     for gate in gates:
+        ...         gate.set(0.1)
+        >>> # all gates have settled here
+    """
+    group = _deferred_post_delays.get()
+    if group is not None:
+        yield group
+        return
+    group = DeferredPostDelays()
+    token = _deferred_post_delays.set(group)
+    try:
+        yield group
+    finally:
+        _deferred_post_delays.reset(token)
+    group.wait()
+
 
 class _SetParamContext:
     """
@@ -193,7 +266,12 @@ class _BaseParameter(Metadatable):
 
         step: max increment of parameter value.
             Larger changes are broken into multiple steps this size.
-            When combined with delays, this acts as a ramp.
+            When combined with delays, this acts as a ramp. The steps of a
+            ramp are started ``inter_delay`` apart. If the parameter has a
+            ``ramp_raw`` method (see ``ramp_cmd`` of :class:`Parameter`),
+            all raw steps are passed to it at once instead, such that
+            instruments with hardware ramps or list modes can run the whole
+            ramp as a single program.
 
         scale: Scale to multiply value with before
             performing set. the internally multiplied value is stored in
@@ -277,6 +355,7 @@ class _BaseParameter(Metadatable):
             vals = Enum(*val_mapping.keys())
         self.vals = vals
 
+        self._invalidate_conversions()
         self.step = step
         self.scale = scale
         self.offset = offset
@@ -341,6 +420,10 @@ class _BaseParameter(Metadatable):
         # Specify time of last set operation, used when comparing to delay to
         # check if additional waiting time is needed before next set
         self._t_last_set = time.perf_counter()
+        # time at which the post delay of the last set has passed, only
+        # tracked for sets whose post delay is deferred, see
+        # :func:`deferred_post_delays`
+        self._ready_at = 0.0
         # should we call validate when getting data. default to False
         # intended to be changed in a subclass if you want the subclass
         # to perform a validation on get
@@ -484,87 +567,204 @@ class _BaseParameter(Metadatable):
         """
         return self._snapshot_value
 
-    def _from_value_to_raw_value(self, value: ParamDataType
-                                 ) -> ParamRawDataType:
-        raw_value: ParamRawDataType
+    @property
+    def scale(self) -> Optional[Union[float, Iterable[float]]]:
+        """
+        Scale to multiply value with before performing set, see the
+        ``scale`` argument of :class:`Parameter`.
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: Optional[Union[float, Iterable[float]]]) -> None:
+        self._scale = scale
+        self._invalidate_conversions()
 
-        if self.val_mapping is not None:
+    @property
+    def offset(self) -> Optional[Union[float, Iterable[float]]]:
+        """
+        Offset to add to value before performing set, see the ``offset``
+        argument of :class:`Parameter`.
+        """
+        return self._offset
+
+    @offset.setter
+    def offset(self, offset: Optional[Union[float, Iterable[float]]]
+               ) -> None:
+        self._offset = offset
+        self._invalidate_conversions()
+
+    @property
+    def val_mapping(self) -> Optional[Dict[Any, Any]]:
+        """
+        Mapping from values to the raw values sent to the instrument, see
+        the ``val_mapping`` argument of :class:`Parameter`.
+        """
+        return self._val_mapping
+
+    @val_mapping.setter
+    def val_mapping(self, val_mapping: Optional[Dict[Any, Any]]) -> None:
+        self._val_mapping = val_mapping
+        self._invalidate_conversions()
+
+    @property
+    def inverse_val_mapping(self) -> Optional[Dict[Any, Any]]:
+        """
+        Mapping from the raw values returned by the instrument to values.
+        """
+        return self._inverse_val_mapping
+
+    @inverse_val_mapping.setter
+    def inverse_val_mapping(self,
+                            inverse_val_mapping: Optional[Dict[Any, Any]]
+                            ) -> None:
+        self._inverse_val_mapping = inverse_val_mapping
+        self._invalidate_conversions()
+
+    @property
+    def get_parser(self) -> Optional[Callable[..., Any]]:
+        """
+        Function to transform the response from get to the final output
+        value, see the ``get_parser`` argument of :class:`Parameter`.
+        """
+        return self._get_parser
+
+    @get_parser.setter
+    def get_parser(self, get_parser: Optional[Callable[..., Any]]) -> None:
+        self._get_parser = get_parser
+        self._invalidate_conversions()
+
+    @property
+    def set_parser(self) -> Optional[Callable[..., Any]]:
+        """
+        Function to transform the input set value to an encoded value sent
+        to the instrument, see the ``set_parser`` argument of
+        :class:`Parameter`.
+        """
+        return self._set_parser
+
+    @set_parser.setter
+    def set_parser(self, set_parser: Optional[Callable[..., Any]]) -> None:
+        self._set_parser = set_parser
+        self._invalidate_conversions()
+
+    def _invalidate_conversions(self) -> None:
+        """
+        Discard the conversion pipelines such that they are rebuilt from the
+        current ``scale``, ``offset``, mappings and parsers on next use.
+        """
+        self._to_raw_value_steps: Optional[
+            Tuple[Callable[[Any], Any], ...]] = None
+        self._from_raw_value_steps: Optional[
+            Tuple[Callable[[Any], Any], ...]] = None
+
+    def _build_to_raw_value_steps(self) -> Tuple[Callable[[Any], Any], ...]:
+        steps: List[Callable[[Any], Any]] = []
+
+        val_mapping = self._val_mapping
+        if val_mapping is not None:
             # Convert set values using val_mapping dictionary
-            raw_value = self.val_mapping[value]
-        else:
-            raw_value = value
+            steps.append(val_mapping.__getitem__)
 
         # transverse transformation in reverse order as compared to
         # getter: apply scale first
-        if self.scale is not None:
-            if isinstance(self.scale, collections.abc.Iterable):
+        scale = self._scale
+        if scale is not None:
+            if isinstance(scale, collections.abc.Iterable):
                 # Scale contains multiple elements, one for each value
-                raw_value = tuple(val * scale for val, scale
-                                  in zip(raw_value, self.scale))
+                steps.append(lambda raw_value: tuple(
+                    val * s for val, s in zip(raw_value, scale)))
             else:
                 # Use single scale for all values
-                raw_value *= self.scale
+                steps.append(lambda raw_value: raw_value * scale)
 
         # apply offset next
-        if self.offset is not None:
-            if isinstance(self.offset, collections.abc.Iterable):
+        offset = self._offset
+        if offset is not None:
+            if isinstance(offset, collections.abc.Iterable):
                 # offset contains multiple elements, one for each value
-                raw_value = tuple(val + offset for val, offset
-                                  in zip(raw_value, self.offset))
+                steps.append(lambda raw_value: tuple(
+                    val + o for val, o in zip(raw_value, offset)))
             else:
                 # Use single offset for all values
-                raw_value += self.offset
+                steps.append(lambda raw_value: raw_value + offset)
 
         # parser last
-        if self.set_parser is not None:
-            raw_value = self.set_parser(raw_value)
+        if self._set_parser is not None:
+            steps.append(self._set_parser)
 
-        return raw_value
+        return tuple(steps)
 
-    def _from_raw_value_to_value(self, raw_value: ParamRawDataType
-                                 ) -> ParamDataType:
-        value: ParamDataType
+    def _build_from_raw_value_steps(self
+                                    ) -> Tuple[Callable[[Any], Any], ...]:
+        steps: List[Callable[[Any], Any]] = []
 
-        if self.get_parser is not None:
-            value = self.get_parser(raw_value)
-        else:
-            value = raw_value
+        if self._get_parser is not None:
+            steps.append(self._get_parser)
 
         # apply offset first (native scale)
-        if self.offset is not None:
-            # offset values
-            if isinstance(self.offset, collections.abc.Iterable):
+        offset = self._offset
+        if offset is not None:
+            if isinstance(offset, collections.abc.Iterable):
                 # offset contains multiple elements, one for each value
-                value = tuple(val - offset for val, offset
-                              in zip(value, self.offset))
-            elif isinstance(value, collections.abc.Iterable):
-                # Use single offset for all values
-                value = tuple(val - self.offset for val in value)
+                steps.append(lambda value: tuple(
+                    val - o for val, o in zip(value, offset)))
             else:
-                value -= self.offset
+                def subtract_offset(value: Any) -> Any:
+                    if isinstance(value, collections.abc.Iterable):
+                        # Use single offset for all values
+                        return tuple(val - offset for val in value)
+                    return value - offset
+                steps.append(subtract_offset)
 
         # scale second
-        if self.scale is not None:
-            # Scale values
-            if isinstance(self.scale, collections.abc.Iterable):
+        scale = self._scale
+        if scale is not None:
+            if isinstance(scale, collections.abc.Iterable):
                 # Scale contains multiple elements, one for each value
-                value = tuple(val / scale for val, scale
-                              in zip(value, self.scale))
-            elif isinstance(value, collections.abc.Iterable):
-                # Use single scale for all values
-                value = tuple(val / self.scale for val in value)
-            else:
-                value /= self.scale
-
-        if self.inverse_val_mapping is not None:
-            if value in self.inverse_val_mapping:
-                value = self.inverse_val_mapping[value]
+                steps.append(lambda value: tuple(
+                    val / s for val, s in zip(value, scale)))
             else:
+                def divide_scale(value: Any) -> Any:
+                    if isinstance(value, collections.abc.Iterable):
+                        # Use single scale for all values
+                        return tuple(val / scale for val in value)
+                    return value / scale
+                steps.append(divide_scale)
+
+        inverse_val_mapping = self._inverse_val_mapping
+        if inverse_val_mapping is not None:
+            def map_inverse(value: Any) -> Any:
+                if value in inverse_val_mapping:
+                    return inverse_val_mapping[value]
                 try:
-                    value = self.inverse_val_mapping[int(value)]
+                    return inverse_val_mapping[int(value)]
                 except (ValueError, KeyError):
                     raise KeyError(f"'{value}' not in val_mapping")
+            steps.append(map_inverse)
+
+        return tuple(steps)
+
+    def _from_value_to_raw_value(self, value: ParamDataType
+                                 ) -> ParamRawDataType:
+        steps = self._to_raw_value_steps
+        if steps is None:
+            steps = self._to_raw_value_steps = \
+                self._build_to_raw_value_steps()
+        raw_value = value
+        for step in steps:
+            raw_value = step(raw_value)
+        return raw_value
 
+    def _from_raw_value_to_value(self, raw_value: ParamRawDataType
+                                 ) -> ParamDataType:
+        steps = self._from_raw_value_steps
+        if steps is None:
+            steps = self._from_raw_value_steps = \
+                self._build_from_raw_value_steps()
+        value = raw_value
+        for step in steps:
+            value = step(value)
         return value
 
     def _wrap_get(self, get_function: Callable[..., ParamDataType]) ->\
@@ -578,14 +778,7 @@ class _BaseParameter(Metadatable):
                 # There might be cases where a .get also has args/kwargs
                 raw_value = get_function(*args, **kwargs)
 
-                value = self._from_raw_value_to_value(raw_value)
-
-                if self._validate_on_get:
-                    self.validate(value)
-
-                self.cache._update_with(value=value, raw_value=raw_value)
-
-                return value
+                return self._update_from_raw_value(raw_value)
 
             except Exception as e:
                 e.args = e.args + (f'getting {self}',)
@@ -593,6 +786,23 @@ class _BaseParameter(Metadatable):
 
         return get_wrapper
 
+    def _update_from_raw_value(self, raw_value: ParamRawDataType
+                               ) -> ParamDataType:
+        """
+        Parse and validate a raw value obtained from the instrument, update
+        the cache with it and return the value, as done by ``get`` after
+        calling ``get_raw``. Used to distribute the responses of a batched
+        query, see :meth:`.Instrument.batched_get`.
+        """
+        value = self._from_raw_value_to_value(raw_value)
+
+        if self._validate_on_get:
+            self.validate(value)
+
+        self.cache._update_with(value=value, raw_value=raw_value)
+
+        return value
+
     def _wrap_set(self, set_function: Callable[..., None]) -> \
             Callable[..., None]:
         @wraps(set_function)
@@ -602,43 +812,13 @@ class _BaseParameter(Metadatable):
                     raise TypeError("Trying to set a parameter"
                                     " that is not settable.")
 
-                self.validate(value)
-
-                # In some cases intermediate sweep values must be used.
-                # Unless `self.step` is defined, get_sweep_values will return
-                # a list containing only `value`.
-                steps = self.get_ramp_values(value, step=self.step)
-
-                for step_index, val_step in enumerate(steps):
-                    # even if the final value is valid we may be generating
-                    # steps that are not so validate them too
-                    self.validate(val_step)
-
-                    raw_val_step = self._from_value_to_raw_value(val_step)
-
-                    # Check if delay between set operations is required
-                    t_elapsed = time.perf_counter() - self._t_last_set
-                    if t_elapsed < self.inter_delay:
-                        # Sleep until time since last set is larger than
-                        # self.inter_delay
-                        time.sleep(self.inter_delay - t_elapsed)
-
-                    # Start timer to measure execution time of set_function
-                    t0 = time.perf_counter()
-
-                    set_function(raw_val_step, **kwargs)
-
-                    # Update last set time (used for calculating delays)
-                    self._t_last_set = time.perf_counter()
-
-                    # Check if any delay after setting is required
-                    t_elapsed = self._t_last_set - t0
-                    if t_elapsed < self.post_delay:
-                        # Sleep until total time is larger than self.post_delay
-                        time.sleep(self.post_delay - t_elapsed)
-
-                    self.cache._update_with(value=val_step,
-                                            raw_value=raw_val_step)
+                for action in self._set_actions(set_function, value,
+                                                 kwargs):
+                    if action.__class__ is tuple:
+                        function, args = action
+                        function(*args)
+                    else:
+                        time.sleep(action)
 
             except Exception as e:
                 e.args = e.args + (f'setting {self} to {value}',)
@@ -646,6 +826,198 @@ class _BaseParameter(Metadatable):
 
         return set_wrapper
 
+    def _set_actions(self, set_function: Callable[..., None],
+                     value: ParamDataType, kwargs: Dict[str, Any]
+                     ) -> Iterator[_SetAction]:
+        """
+        The steps of setting the parameter to ``value`` with
+        ``set_function``, shared by ``set`` and ``aset``. Yields either the
+        number of seconds to wait, or a tuple of a function that
+        communicates with the instrument and the arguments to call it
+        with. The caller waits or calls the function, blocking or
+        asynchronously, before resuming the iteration.
+        """
+        self.validate(value)
+        if kwargs:
+            set_function = partial(set_function, **kwargs)
+
+        # In some cases intermediate sweep values must be used.
+        # Unless `self.step` is defined, get_sweep_values will return
+        # a list containing only `value`.
+        steps = self.get_ramp_values(value, step=self.step)
+
+        ramp_raw = getattr(self, 'ramp_raw', None)
+        if ramp_raw is not None:
+            steps = list(steps)
+            if len(steps) > 1:
+                yield from self._ramp_in_hardware_actions(ramp_raw, steps)
+                return
+
+        deferred = _deferred_post_delays.get()
+        inter_delay = self.inter_delay
+        post_delay = self.post_delay
+        # the steps of a ramp are timed from the start of the
+        # previous step, such that the time the instrument takes to
+        # process a step is not added to the inter_delay
+        next_step_at = self._t_last_set + inter_delay
+
+        for val_step in steps:
+            # even if the final value is valid we may be generating
+            # steps that are not so validate them too
+            self.validate(val_step)
+
+            raw_val_step = self._from_value_to_raw_value(val_step)
+
+            # Check if delay between set operations is required
+            if inter_delay:
+                t_remaining = next_step_at - time.perf_counter()
+                if t_remaining > 0:
+                    # Wait until time since last set is larger than
+                    # self.inter_delay
+                    yield t_remaining
+                next_step_at = time.perf_counter() + inter_delay
+
+            if deferred is not None:
+                # Wait for the deferred post delay of the previous
+                # set of this parameter
+                t_remaining = self._ready_at - time.perf_counter()
+                if t_remaining > 0:
+                    yield t_remaining
+
+            # Start timer to measure execution time of set_function
+            if post_delay:
+                t0 = time.perf_counter()
+
+            yield set_function, (raw_val_step,)
+
+            # Update last set time (used for calculating delays)
+            self._t_last_set = time.perf_counter()
+
+            # Check if any delay after setting is required
+            if post_delay:
+                t_elapsed = self._t_last_set - t0
+                if t_elapsed < post_delay:
+                    if deferred is not None:
+                        deferred.defer(self, t0 + post_delay)
+                    else:
+                        # Wait until total time is larger than
+                        # self.post_delay
+                        yield post_delay - t_elapsed
+
+            self.cache._update_with(value=val_step,
+                                    raw_value=raw_val_step)
+
+    def _ramp_in_hardware_actions(
+            self, ramp_raw: Callable[..., Any],
+            steps: Sequence[ParamDataType]
+    ) -> Iterator[_SetAction]:
+        """
+        The steps of setting the parameter to the steps of a ramp by passing
+        all of them to ``ramp_raw`` at once, which programs the instrument
+        to ramp through them with ``inter_delay`` seconds per step, and
+        waiting until the ramp is finished. See :meth:`_set_actions`.
+        """
+        for val_step in steps:
+            self.validate(val_step)
+        raw_steps = [self._from_value_to_raw_value(val_step)
+                     for val_step in steps]
+
+        step_time = self.inter_delay
+        t_remaining = self._t_last_set + step_time - time.perf_counter()
+        if t_remaining > 0:
+            yield t_remaining
+        deferred = _deferred_post_delays.get()
+        if deferred is not None:
+            t_remaining = self._ready_at - time.perf_counter()
+            if t_remaining > 0:
+                yield t_remaining
+
+        t0 = time.perf_counter()
+        yield ramp_raw, (raw_steps, step_time)
+        # the instrument may return as soon as the ramp has been started
+        t_remaining = t0 + len(raw_steps) * step_time - time.perf_counter()
+        if t_remaining > 0:
+            yield t_remaining
+        self._t_last_set = time.perf_counter()
+
+        post_delay = self.post_delay
+        if post_delay:
+            if deferred is not None:
+                deferred.defer(self, self._t_last_set + post_delay)
+            else:
+                yield post_delay
+
+        self.cache._update_with(value=steps[-1], raw_value=raw_steps[-1])
+
+    async def _run_in_io_executor(self, function: Callable[..., Any],
+                                  *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking function in the ``io_executor`` of the root instrument
+        of the parameter, or in the default executor of the event loop if
+        the parameter does not belong to an instrument that has one.
+        """
+        root_instrument = self.root_instrument
+        executor = getattr(root_instrument, 'io_executor', None)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(function, *args, **kwargs))
+
+    async def aget(self) -> ParamDataType:
+        """
+        Asynchronous version of ``get``. The communication with the
+        instrument runs in the ``io_executor`` of its root instrument, such
+        that the parameters of different instruments can be gotten
+        concurrently, e.g. with :func:`asyncio.gather`, while the commands
+        sent to each instrument stay in order.
+        """
+        if not self.gettable:
+            raise TypeError("Trying to get a parameter"
+                            " that is not gettable.")
+        get_raw = getattr(self, 'get_raw', None)
+        if get_raw is None or \
+                getattr(self.get, '__wrapped__', None) != get_raw:
+            # get is not the standard wrapper of get_raw
+            return await self._run_in_io_executor(self.get)
+        try:
+            raw_value = await self._run_in_io_executor(get_raw)
+            return self._update_from_raw_value(raw_value)
+        except Exception as e:
+            e.args = e.args + (f'getting {self}',)
+            raise e
+
+    async def aset(self, value: ParamDataType, **kwargs: Any) -> None:
+        """
+        Asynchronous version of ``set``, going through the same steps,
+        ramps and delays. The communication with the instrument runs in
+        the ``io_executor`` of its root instrument and the delays are
+        awaited with :func:`asyncio.sleep`, such that several parameters
+        can be set and settle concurrently, e.g. with
+        :func:`asyncio.gather`.
+
+        Args:
+            value: The value to set the parameter to.
+            **kwargs: Passed on to ``set_raw``.
+        """
+        if not self.settable:
+            raise TypeError("Trying to set a parameter"
+                            " that is not settable.")
+        set_raw = getattr(self, 'set_raw', None)
+        if set_raw is None or \
+                getattr(self.set, '__wrapped__', None) != set_raw:
+            # set is not the standard wrapper of set_raw
+            await self._run_in_io_executor(self.set, value, **kwargs)
+            return
+        try:
+            for action in self._set_actions(set_raw, value, kwargs):
+                if action.__class__ is tuple:
+                    function, args = action
+                    await self._run_in_io_executor(function, *args)
+                else:
+                    await asyncio.sleep(action)
+        except Exception as e:
+            e.args = e.args + (f'setting {self} to {value}',)
+            raise e
+
     def get_ramp_values(self, value: Union[float, Sized],
                         step: Optional[float] = None
                         ) -> Sequence[Union[float, Sized]]:
@@ -695,13 +1067,14 @@ class _BaseParameter(Metadatable):
             ValueError: If the value is outside the bounds specified by the
                validator.
         """
+        if self.vals is None:
+            return
         if self._instrument:
             context = (getattr(self._instrument, 'name', '') or
                        str(self._instrument.__class__)) + '.' + self.name
         else:
             context = self.name
-        if self.vals is not None:
-            self.vals.validate(value, 'Parameter: ' + context)
+        self.vals.validate(value, 'Parameter: ' + context)
 
     @property
     def step(self) -> Optional[float]:
@@ -1006,6 +1379,13 @@ class Parameter(_BaseParameter):
             Larger changes are broken into multiple steps this size.
             When combined with delays, this acts as a ramp.
 
+        ramp_cmd: A function ``ramp_cmd(raw_values, step_time)`` that
+            programs the instrument to ramp through the raw values of the
+            steps of a ramp (see ``step``), one every ``step_time`` seconds
+            (the ``inter_delay``). It is used instead of one ``set_cmd`` per
+            step, and may return as soon as the ramp is started, the
+            parameter waits until the ramp is finished.
+
         scale: Scale to multiply value with before
             performing set. the internally multiplied value is stored in
             ``cache.raw_value``. Can account for a voltage divider.
@@ -1077,10 +1457,14 @@ class Parameter(_BaseParameter):
                  vals: Optional[Validator] = None,
                  docstring: Optional[str] = None,
                  initial_cache_value: Optional[Union[float, str]] = None,
+                 ramp_cmd: Optional[Callable[[List[Any], float], Any]] = None,
                  **kwargs: Any) -> None:
         super().__init__(name=name, instrument=instrument, vals=vals,
                          max_val_age=max_val_age, **kwargs)
 
+        if ramp_cmd is not None:
+            self.ramp_raw = ramp_cmd
+
         no_instrument_get = not self.gettable and \
             (get_cmd is None or get_cmd is False)
         # TODO: a matching check should be in _BaseParameter but
@@ -2029,6 +2413,9 @@ class _Cache:
         self._parameter = parameter
         self._value: ParamDataType = None
         self._raw_value: ParamRawDataType = None
+        # time of the last update as seconds since the epoch, the datetime
+        # of the timestamp is only created when it is asked for
+        self._update_time: Optional[float] = None
         self._timestamp: Optional[datetime] = None
         self._max_val_age = max_val_age
         self._marked_valid: bool = False
@@ -2046,6 +2433,8 @@ class _Cache:
         If ``None``, the cache hasn't been updated yet and shall be seen as
         "invalid".
         """
+        if self._timestamp is None and self._update_time is not None:
+            self._timestamp = datetime.fromtimestamp(self._update_time)
         return self._timestamp
 
     @property
@@ -2119,21 +2508,21 @@ class _Cache:
         self._value = value
         self._raw_value = raw_value
         if timestamp is None:
-            self._timestamp = datetime.now()
+            self._update_time = time.time()
+            self._timestamp = None
         else:
+            self._update_time = timestamp.timestamp()
             self._timestamp = timestamp
         self._marked_valid = True
 
     def _timestamp_expired(self) -> bool:
-        if self._timestamp is None:
+        if self._update_time is None:
             # parameter has never been captured
             return True
         if self._max_val_age is None:
             # parameter cannot expire
             return False
-        oldest_accepted_timestamp = (
-                datetime.now() - timedelta(seconds=self._max_val_age))
-        if self._timestamp < oldest_accepted_timestamp:
+        if time.time() - self._update_time > self._max_val_age:
             # Time of last get exceeds max_val_age seconds, need to
             # perform new .get()
             return True
@@ -2173,7 +2562,7 @@ class _Cache:
                 return self._value
 
     def _construct_error_msg(self) -> str:
-        if self._timestamp is None:
+        if self._update_time is None:
             error_msg = (f"Value of parameter "
                          f"{self._parameter.full_name} "
                          f"is unknown and the Parameter "
@@ -2362,8 +2751,10 @@ class CombinedParameter(Metadatable):
             list of values that where actually set
         """
         values = self.setpoints[index]
-        for setFunction, value in zip(self.sets, values):
-            setFunction(value)
+        # set all parameters before waiting for their post delays
+        with deferred_post_delays():
+            for setFunction, value in zip(self.sets, values):
+                setFunction(value)
         return values
 
     def sweep(self, *array: numpy.ndarray) -> 'CombinedParameter':
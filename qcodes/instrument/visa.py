@@ -4,6 +4,7 @@ import warnings
 import logging
 from packaging.version import Version
 
+import numpy as np
 import pyvisa as visa
 import pyvisa.constants as vi_const
 import pyvisa.resources
@@ -245,6 +246,74 @@ class VisaInstrument(Instrument):
             self.visa_log.debug(f"Response: {response}")
         return response
 
+    def ask_binary_block(self, cmd: str,
+                         datatype: Union[str, np.dtype] = 'f',
+                         is_big_endian: bool = False,
+                         expect_termination: bool = True,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Send a query whose response is an IEEE 488.2 binary block (e.g. a
+        trace or waveform) and decode the block into a numpy array.
+
+        The block is read with its length given by its header, so binary
+        data that contains the read termination is read correctly, and the
+        values are decoded with ``numpy.frombuffer`` instead of one by one.
+
+        Args:
+            cmd: The query to send to the instrument.
+            datatype: The type of the values in the block, as numpy dtype or
+                a string that numpy understands, e.g. ``'f'``, ``'h'`` or
+                ``'u2'``.
+            is_big_endian: Whether the values in the block are big endian.
+            expect_termination: Whether the block is followed by the read
+                termination, which is then read as well.
+            out: An array to decode the values into, e.g. to reuse the
+                same buffer for repeated reads of a trace. It must have at
+                least as many elements as the block has values.
+
+        Returns:
+            The values in native byte order. If ``out`` is given, a view of
+            ``out`` with the number of values in the block.
+        """
+        dtype = np.dtype(datatype).newbyteorder('>' if is_big_endian
+                                                else '<')
+        with DelayedKeyboardInterrupt():
+            self.visa_log.debug(f"Querying binary block: {cmd}")
+            self.visa_handle.write(cmd)
+            block = self._read_binary_block(expect_termination)
+            self.visa_log.debug(f"Response: binary block of {len(block)} "
+                                f"bytes")
+
+        values = np.frombuffer(block, dtype=dtype,
+                               count=len(block) // dtype.itemsize)
+        if out is None:
+            return values.astype(dtype.newbyteorder('='))
+        if len(out) < len(values):
+            raise ValueError(f"Cannot read {len(values)} values into an "
+                             f"array of length {len(out)}")
+        out = out[:len(values)]
+        out[...] = values
+        return out
+
+    def _read_binary_block(self, expect_termination: bool) -> bytes:
+        handle = self.visa_handle
+        # skip anything that precedes the block, e.g. a command header
+        while handle.read_bytes(1) != b'#':
+            pass
+        n_digits = int(handle.read_bytes(1))
+        if n_digits == 0:
+            # a block of indefinite length ends with the message
+            block = handle.read_raw()
+            termination = (handle.read_termination or '').encode()
+            if termination and block.endswith(termination):
+                block = block[:-len(termination)]
+            return block
+        length = int(handle.read_bytes(n_digits))
+        block = handle.read_bytes(length) if length > 0 else b''
+        if expect_termination and handle.read_termination:
+            handle.read_bytes(len(handle.read_termination))
+        return block
+
     def snapshot_base(self, update: Optional[bool] = True,
                       params_to_skip_update: Optional[Sequence[str]] = None
                       ) -> Dict:
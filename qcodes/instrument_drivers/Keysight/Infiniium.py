@@ -115,7 +115,7 @@ class RawTrace(ArrayParameter):
         instr.write(':WAVeform:STReaming OFF')
 
         # request the actual transfer
-        data = instr._parent.visa_handle.query_binary_values(
+        data = instr._parent.ask_binary_block(
             'WAV:DATA?', datatype='h', is_big_endian=False,
             expect_termination=False)
         # the Infiniium does not include an extra termination char on binary
@@ -614,9 +614,8 @@ class Infiniium(VisaInstrument):
             self.write(":waveform:byteorder LSBFirst")
             self.write(':WAVeform:STReaming OFF')
 
-            data = self.visa_handle.query_binary_values(
+            all_data['ch%d' % i] = self.ask_binary_block(
                 'WAV:DATA?', datatype='h', is_big_endian=False)
-            all_data['ch%d' % i] = np.array(data)
 
         x_incr = float(self.ask(":WAVeform:XINCrement?"))
         y_incr = float(self.ask(":WAVeform:YINCrement?"))
@@ -1,4 +1,5 @@
 import textwrap
+import time
 from contextlib import ExitStack
 from functools import partial
 from typing import Sequence, Tuple, Any, Optional
@@ -11,8 +12,10 @@ import qcodes.utils.validators as vals
 from qcodes import VisaInstrument, InstrumentChannel
 from qcodes.instrument_drivers.Keysight.private.error_handling import \
     KeysightErrorQueueMixin
-from qcodes.instrument.parameter import Parameter, ParameterWithSetpoints
+from qcodes.instrument.parameter import (Parameter, ParameterWithSetpoints,
+                                         _BaseParameter)
 from qcodes.instrument.base import Instrument
+from qcodes.instrument.buffered_sweep import BufferedSweep
 
 
 class Trigger(InstrumentChannel):
@@ -304,6 +307,92 @@ class Display(InstrumentChannel):
         self.text.get()  # also update the parameter value
 
 
+class BusTriggeredSweep(BufferedSweep):
+    """
+    Buffered sweep that takes one reading per setpoint into the reading
+    memory. The instrument is armed with a trigger count equal to the number
+    of setpoints and "BUS" as trigger source, each point is triggered with
+    ``*TRG`` after the swept parameter has been set and all readings are
+    fetched at once at the end of the sweep. The settings changed for the
+    sweep are restored afterwards.
+
+    Args:
+        instrument: The instrument that measures.
+        sense_function: The ``sense_function`` that is measured.
+    """
+
+    def __init__(self, instrument: '_Keysight_344xxA',
+                 sense_function: str) -> None:
+        self._instrument = instrument
+        self._sense_function = sense_function
+        self._settings: Optional[ExitStack] = None
+        self._n_triggered = 0
+        # time between polls of the number of stored readings
+        self._poll_interval = 0.001
+
+    def supports(self, param_set: _BaseParameter,
+                 setpoints: np.ndarray) -> bool:
+        return param_set.root_instrument is not self._instrument
+
+    def arm(self, param_set: _BaseParameter, setpoints: np.ndarray,
+            delay: float) -> None:
+        instrument = self._instrument
+        param_settings = [(instrument.sense_function, self._sense_function),
+                          (instrument.trigger.source, "BUS"),
+                          (instrument.trigger.count, len(setpoints)),
+                          (instrument.sample.count, 1)]
+        if instrument.has_DIG:
+            param_settings.append((instrument.sample.pretrigger_count, 0))
+
+        settings = ExitStack()
+        try:
+            for parameter, value in param_settings:
+                settings.enter_context(parameter.set_to(value))
+            instrument.init_measurement()
+        except BaseException:
+            settings.close()
+            raise
+        self._settings = settings
+        self._n_triggered = 0
+
+    def trigger(self) -> None:
+        """
+        Trigger a reading and wait until it is stored such that it is taken
+        at the current setpoint.
+
+        Raises:
+            TimeoutError: If the reading is not stored within the timeout
+                of the instrument.
+        """
+        instrument = self._instrument
+        instrument.trigger.force()
+        self._n_triggered += 1
+        timeout = instrument.timeout()
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while int(instrument.ask('DATA:POINts?')) < self._n_triggered:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise TimeoutError(f"Reading {self._n_triggered} of the "
+                                   f"buffered sweep of {instrument.name} "
+                                   f"was not stored within {timeout} s.")
+            time.sleep(self._poll_interval)
+
+    def fetch(self) -> np.ndarray:
+        try:
+            return self._instrument.fetch()
+        finally:
+            self._restore_settings()
+
+    def disarm(self) -> None:
+        if self._settings is not None:
+            self._instrument.abort_measurement()
+        self._restore_settings()
+
+    def _restore_settings(self) -> None:
+        if self._settings is not None:
+            self._settings.close()
+            self._settings = None
+
+
 class TimeTrace(ParameterWithSetpoints): # pylint: disable=abstract-method
     """
     A parameter class that holds the data for a time trace type measurement,
@@ -709,6 +798,15 @@ class _Keysight_344xxA(KeysightErrorQueueMixin, VisaInstrument):
                            unit='Ohms',
                            snapshot_get=False)
 
+        for name, sense_function in (('volt', "DC Voltage"),
+                                     ('curr', "DC Current"),
+                                     ('ac_volt', "AC Voltage"),
+                                     ('ac_curr', "AC Current"),
+                                     ('res', "2 Wire Resistance"),
+                                     ('four_wire_res', "4 Wire Resistance")):
+            self.parameters[name].buffered_sweep = BusTriggeredSweep(
+                self, sense_function)
+
         #####################################
         # Time trace parameters
 
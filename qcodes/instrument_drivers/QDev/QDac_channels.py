@@ -10,6 +10,7 @@ from qcodes.instrument.channel import (ChannelList, InstrumentChannel,
                                        MultiChannelInstrumentParameter)
 from qcodes.instrument.visa import VisaInstrument
 from qcodes.utils import validators as vals
+from qcodes.utils.helpers import is_linear_ramp
 
 log = logging.getLogger(__name__)
 
@@ -43,6 +44,8 @@ class QDacChannel(InstrumentChannel):
                            unit='V',
                            set_cmd=partial(self._parent._set_voltage, channum),
                            get_cmd=partial(self._parent._get_voltage, channum),
+                           ramp_cmd=partial(self._parent._ramp_voltage,
+                                            channum),
                            get_parser=float,
                            vals=vals.Numbers(-10, 10)
                            )
@@ -302,6 +305,49 @@ class QDac(VisaInstrument):
             # and then set the voltage
             self.write(f'wav {chan} 0 0 0;set {chan} {v_dac:.6f}')
 
+    def _ramp_voltage(self, chan, v_steps, step_time):
+        """
+        ramp_cmd for the chXX_v parameter, used if the parameter has a step.
+
+        If the steps of the parameter are a linear ramp, the ramp is run by
+        a free function generator of the QDac in
+        ``len(v_steps) * step_time`` seconds instead of setting every step.
+        Otherwise, e.g. for custom ramp values or when all function
+        generators are assigned, the steps are set one by one,
+        ``step_time`` apart.
+
+        Args:
+            chan (int): The 1-indexed channel number
+            v_steps (List[float]): The voltages of the steps of the ramp
+            step_time (float): The time per step in seconds
+        """
+        ramptime = len(v_steps) * step_time
+        free_fgs = self._fgs.difference(set(self._assigned_fgs.values()))
+        # We need .get and not get_latest in case a ramp was interrupted
+        v_start = self.channels[chan-1].v.get()
+        # too short ramps are not possible with a function generator, see
+        # _rampvoltage
+        if (ramptime <= 0.002 or not free_fgs
+                or not is_linear_ramp(v_start, v_steps)):
+            self._set_voltage_steps(chan, v_steps, step_time)
+            return
+        fg = min(free_fgs)
+        self._assigned_fgs[chan] = fg
+        self._rampvoltage(chan, fg, v_start, v_steps[-1], ramptime)
+
+    def _set_voltage_steps(self, chan, v_steps, step_time):
+        """
+        Set the voltages of the steps of a ramp one by one, starting each
+        step ``step_time`` after the previous one.
+        """
+        next_step_at = time.perf_counter()
+        for v_step in v_steps:
+            t_remaining = next_step_at - time.perf_counter()
+            if t_remaining > 0:
+                time.sleep(t_remaining)
+            next_step_at = time.perf_counter() + step_time
+            self._set_voltage(chan, v_step)
+
     def _get_voltage(self, chan):
         """
         get_cmd for the chXX_v parameter
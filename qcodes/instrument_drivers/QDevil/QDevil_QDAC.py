@@ -12,6 +12,7 @@ from qcodes.instrument.channel import InstrumentChannel, ChannelList
 from qcodes.instrument.channel import MultiChannelInstrumentParameter
 from qcodes.instrument.visa import VisaInstrument
 from qcodes.utils import validators as vals
+from qcodes.utils.helpers import is_linear_ramp
 from enum import Enum
 from collections import namedtuple
 
@@ -81,6 +82,8 @@ class QDacChannel(InstrumentChannel):
                            unit='V',
                            set_cmd=partial(self._parent._set_voltage, channum),
                            get_cmd=f'set {channum}',
+                           ramp_cmd=partial(self._parent._ramp_voltage,
+                                            channum),
                            get_parser=float,
                            # Initial range. Updated on init and during
                            # operation:
@@ -456,6 +459,29 @@ class QDac(VisaInstrument):
             self.write('wav {ch} 0 0 0;set {ch} {voltage:.6f}'
                        .format(ch=chan, voltage=v_set))
 
+    def _ramp_voltage(self, chan, v_steps, step_time):
+        """
+        ramp_cmd for the QDAC's voltage, used if the parameter has a step.
+
+        If the steps of the parameter are a linear ramp, the ramp is run by
+        a function generator of the QDAC in ``len(v_steps) * step_time``
+        seconds instead of setting every step. Otherwise, e.g. for custom
+        ramp values, the steps are set one by one, ``step_time`` apart.
+        """
+        # the ramp time of a function generator is a multiple of 1 ms
+        ramptime = round(len(v_steps) * step_time, 3)
+        v_start = self.channels[chan-1].v.get()
+        if ramptime < 0.002 or not is_linear_ramp(v_start, v_steps):
+            next_step_at = time.perf_counter()
+            for v_step in v_steps:
+                t_remaining = next_step_at - time.perf_counter()
+                if t_remaining > 0:
+                    time.sleep(t_remaining)
+                next_step_at = time.perf_counter() + step_time
+                self._set_voltage(chan, v_step)
+            return
+        self.ramp_voltages([chan], [v_start], [v_steps[-1]], ramptime)
+
     def _set_mode(self, chan, new_mode):
         """
         set_cmd for the QDAC's mode (combined voltage and current sense range).
@@ -366,11 +366,13 @@ class AMI430(IPInstrument):
     def _connect(self) -> None:
         """
         Append the IPInstrument connect to flush the welcome message of the AMI
-        430 programmer
+        430 programmer. Connections reused from a connection pool have
+        already been flushed.
         :return: None
         """
         super()._connect()
-        self.flush_connection()
+        if self._socket_is_new:
+            self.flush_connection()
 
     def _update_ramp_rate_limit(self,
                                 new_current_rate_limit: float,
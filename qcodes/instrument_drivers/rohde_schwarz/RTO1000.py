@@ -101,23 +101,10 @@ class ScopeTrace(ArrayParameter):
                 completed_acquisitions = instr.completed_acquisitions()
 
         log.info('Acquisition completed. Polling trace from instrument.')
-        vh = instr.visa_handle
-        vh.write(f'CHANnel{self.channum}:DATA?')
-        raw_vals = vh.read_raw()
-
-        num_length = int(raw_vals[1:2])
-        no_points = int(raw_vals[2:2+num_length])
-
-        # cut of the header and the trailing '\n'
-        raw_vals = raw_vals[2+num_length:-1]
-
         dataformat = instr.dataformat.get_latest()
-
-        if dataformat == 'INT,8':
-            int_vals = np.fromstring(raw_vals, dtype=np.int8, count=no_points)
-        else:
-            int_vals = np.fromstring(raw_vals, dtype=np.int16,
-                                     count=no_points//2)
+        datatype = np.int8 if dataformat == 'INT,8' else np.int16
+        int_vals = instr.ask_binary_block(f'CHANnel{self.channum}:DATA?',
+                                          datatype=datatype)
 
         # now the integer values must be converted to physical
         # values
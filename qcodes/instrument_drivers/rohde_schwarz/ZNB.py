@@ -408,14 +408,23 @@ class ZNBChannel(InstrumentChannel):
                         self.write(f'INIT{self._instrument_channel}:IMM; *WAI')
                     self.write(f"CALC{self._instrument_channel}:PAR:SEL "
                                f"'{self._tracename}'")
-                    data_str = self.ask(
+                    # transfer the trace as little endian binary block,
+                    # which is much faster than ASCII for long traces.
+                    # REAL,64 keeps the full precision of the instrument.
+                    self.write('FORM:DATA REAL,64')
+                    self.write('FORM:BORD SWAP')
+                    data = self.root_instrument.ask_binary_block(
                         f'CALC{self._instrument_channel}:DATA?'
-                        f' {data_format_command}')
-                data = np.array(data_str.rstrip().split(',')).astype('float64')
+                        f' {data_format_command}',
+                        datatype='d',
+                        is_big_endian=False)
                 if self.format() in ['Polar', 'Complex',
                                      'Smith', 'Inverse Smith']:
                     data = data[0::2] + 1j * data[1::2]
             finally:
+                # other queries of the data (e.g. by the user) expect the
+                # default ASCII format
+                self.write('FORM:DATA ASC')
                 self.root_instrument.cont_meas_on()
         return data
 
@@ -319,21 +319,17 @@ class TekronixDPOWaveform(InstrumentChannel):
                 container=np.array
             )
         else:
-            bytes_per_sample = waveform.bytes_per_sample()
-            data_type = {1: "b", 2: "h", 4: "f", 8: "d"}[
-                bytes_per_sample
-            ]
-
-            if waveform.data_format() == "unsigned_integer":
-                data_type = data_type.upper()
-
-            is_big_endian = waveform.is_big_endian()
-
-            raw_data = self.root_instrument.visa_handle.query_binary_values(
+            kind = {
+                "signed_integer": "i",
+                "unsigned_integer": "u",
+                "floating_point": "f"
+            }[waveform.data_format()]
+            data_type = f"{kind}{waveform.bytes_per_sample()}"
+
+            raw_data = self.root_instrument.ask_binary_block(
                 "CURVE?",
                 datatype=data_type,
-                is_big_endian=is_big_endian,
-                container=np.array
+                is_big_endian=waveform.is_big_endian()
             )
 
         return (raw_data - self.raw_data_offset()) * self.scale() \
@@ -2,14 +2,17 @@ import logging
 import struct
 import numpy as np
 import warnings
-from typing import List, Dict, Optional, Any
+from functools import partial
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 
 import qcodes as qc
 from qcodes import VisaInstrument
 from qcodes.data.data_set import DataSet
 from qcodes.instrument.channel import InstrumentChannel
 from qcodes.instrument.base import Instrument, Parameter
-from qcodes.instrument.parameter import ArrayParameter, ParameterWithSetpoints
+from qcodes.instrument.buffered_sweep import BufferedSweep
+from qcodes.instrument.parameter import (ArrayParameter, ParameterWithSetpoints,
+                                         _BaseParameter)
 import qcodes.utils.validators as vals
 from qcodes.utils.helpers import create_on_off_val_mapping
 from qcodes.measure import Measure
@@ -82,6 +85,63 @@ class LuaSweepParameter(ArrayParameter):
         return data
 
 
+class LuaBufferedSweep(BufferedSweep):
+    """
+    Hardware timed buffered sweep of the source level of a channel, measuring
+    the current (for a voltage sweep) or the voltage (for a current sweep)
+    of the same channel at each step with a deployed Lua script. The sweep
+    must be linear, all setpoints must be valid values of the swept
+    parameter, and the swept parameter must not have a ``step``, since the
+    script does not ramp between the setpoints. The source level is set to
+    the first setpoint with the swept parameter before the sweep starts.
+
+    Args:
+        channel: The channel that is swept and measured.
+        mode: 'IV' for the current of a voltage sweep or 'VI' for the voltage
+            of a current sweep.
+    """
+
+    hardware_timed = True
+
+    def __init__(self, channel: 'KeithleyChannel', mode: str) -> None:
+        if mode not in ['IV', 'VI']:
+            raise ValueError('mode must be either "VI" or "IV"')
+        self._channel = channel
+        self._mode = mode
+        self._sweep: Optional[Tuple[float, float, int, float]] = None
+
+    def supports(self, param_set: _BaseParameter,
+                 setpoints: np.ndarray) -> bool:
+        swept = self._channel.volt if self._mode == 'IV' else self._channel.curr
+        if (param_set is not swept or len(setpoints) < 2
+                or param_set.step is not None):
+            return False
+        try:
+            for value in setpoints:
+                param_set.validate(value)
+        except (TypeError, ValueError):
+            return False
+        linear = np.linspace(setpoints[0], setpoints[-1], len(setpoints))
+        return bool(np.allclose(setpoints, linear))
+
+    def arm(self, param_set: _BaseParameter, setpoints: np.ndarray,
+            delay: float) -> None:
+        param_set.set(setpoints[0])
+        self._sweep = (float(setpoints[0]), float(setpoints[-1]),
+                       len(setpoints), delay)
+
+    def fetch(self) -> np.ndarray:
+        if self._sweep is None:
+            raise RuntimeError("The buffered sweep has not been armed.")
+        start, stop, steps, delay = self._sweep
+        self._sweep = None
+        return self._channel._fast_sweep(start, stop, steps, self._mode,
+                                         delay=delay)
+
+    def disarm(self) -> None:
+        self._sweep = None
+
+
 class TimeTrace(ParameterWithSetpoints):
     """
     A parameter class that holds the data corresponding to the time dependence of
@@ -212,6 +272,7 @@ class KeithleyChannel(InstrumentChannel):
                            get_cmd=f'{channel}.measure.v()',
                            get_parser=float,
                            set_cmd=f'{channel}.source.levelv={{:.12f}}',
+                           ramp_cmd=partial(self._ramp_source_level, 'v'),
                            label='Voltage',
                            unit='V')
 
@@ -219,6 +280,7 @@ class KeithleyChannel(InstrumentChannel):
                            get_cmd=f'{channel}.measure.i()',
                            get_parser=float,
                            set_cmd=f'{channel}.source.leveli={{:.12f}}',
+                           ramp_cmd=partial(self._ramp_source_level, 'i'),
                            label='Current',
                            unit='A')
 
@@ -373,6 +435,10 @@ class KeithleyChannel(InstrumentChannel):
         self.add_parameter('fastsweep',
                            parameter_class=LuaSweepParameter)
 
+        # measure sweeps of the source level with a Lua script
+        self.curr.buffered_sweep = LuaBufferedSweep(self, 'IV')
+        self.volt.buffered_sweep = LuaBufferedSweep(self, 'VI')
+
         self.add_parameter('timetrace_npts',
                            initial_value=500,
                            label='Number of points',
@@ -438,7 +504,7 @@ class KeithleyChannel(InstrumentChannel):
         return data
 
     def _fast_sweep(self, start: float, stop: float, steps: int,
-                    mode: str='IV') -> np.ndarray:
+                    mode: str='IV', delay: float = 0.0) -> np.ndarray:
         """
         Perform a fast sweep using a deployed Lua script.
         This is the engine that forms the script, uploads it,
@@ -450,6 +516,8 @@ class KeithleyChannel(InstrumentChannel):
             steps: number of steps
             mode: What kind of sweep to make.
                 'IV' (I versus V) or 'VI' (V versus I)
+            delay: Time in seconds to wait after setting each step before
+                measuring.
         """
 
         channel = self.channel
@@ -483,6 +551,7 @@ class KeithleyChannel(InstrumentChannel):
                   f'for index = 1, {steps} do',
                   '  target = startX + (index-1)*dX',
                   f'  {channel}.source.level{sour} = target',
+                  *([f'  delay({delay:.12f})'] if delay > 0 else []),
                   '  {}.measure.{}({}.nvbuffer1)'.format(channel, meas,
                                                          channel),
                   'end',
@@ -491,9 +560,34 @@ class KeithleyChannel(InstrumentChannel):
                   'printbuffer(1, {}, {}.nvbuffer1.readings)'.format(steps,
                                                                      channel)]
 
-        return self._execute_lua(script, steps)
+        return self._execute_lua(script, steps, step_delay=delay)
+
+    def _ramp_source_level(self, sour: str, raw_values: Sequence[float],
+                           step_time: float) -> None:
+        """
+        Ramp the source level through the steps of a ramp of the ``volt``
+        or ``curr`` parameter with a deployed Lua script, such that the
+        steps are timed by the instrument instead of one write per step.
+        The script is only started, the parameter waits for the ramp.
 
-    def _execute_lua(self, _script: List[str], steps: int) -> np.ndarray:
+        Args:
+            sour: 'v' to ramp the voltage or 'i' to ramp the current.
+            raw_values: The source levels of the steps of the ramp.
+            step_time: Time in seconds between the steps.
+        """
+        channel = self.channel
+        script = ['levels = {',
+                  *(f'  {value:.12f},' for value in raw_values),
+                  '}',
+                  f'{channel}.source.level{sour} = levels[1]',
+                  f'for index = 2, {len(raw_values)} do',
+                  *([f'  delay({step_time:.12f})'] if step_time > 0 else []),
+                  f'  {channel}.source.level{sour} = levels[index]',
+                  'end']
+        self.write(self.root_instrument._scriptwrapper(program=script))
+
+    def _execute_lua(self, _script: List[str], steps: int,
+                     step_delay: float = 0.0) -> np.ndarray:
         """
         This is the function that sends the Lua script to be executed and
         returns the corresponding data from the buffer.
@@ -501,12 +595,15 @@ class KeithleyChannel(InstrumentChannel):
         Args:
             _script: The Lua script to be executed.
             steps: Number of points.
+            step_delay: Time in seconds the script waits at each point in
+                addition to the measurement.
         """
         nplc = self.nplc()
         linefreq = self.linefreq()
         _time_trace_extra_visa_timeout = self._extra_visa_timeout
         _factor = self._measurement_duration_factor
-        estimated_measurement_duration = _factor*1000*steps*nplc/linefreq
+        estimated_measurement_duration = \
+            _factor*1000*steps*(nplc/linefreq + step_delay)
         new_visa_timeout = (estimated_measurement_duration
                           + _time_trace_extra_visa_timeout)
 
@@ -3,6 +3,7 @@ Station objects - collect all the equipment you use to do an experiment.
 """
 
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import suppress
 from typing import (
     Dict, List, Optional, Sequence, Any, cast, AnyStr, IO, Tuple)
@@ -15,6 +16,8 @@ import itertools
 import json
 import pkgutil
 import inspect
+import time
+import threading
 from copy import deepcopy, copy
 from collections import UserDict
 from typing import Union
@@ -28,7 +31,8 @@ from qcodes.utils.helpers import (
     get_qcodes_user_path)
 from qcodes.utils.deprecate import issue_deprecation_warning
 
-from qcodes.instrument.base import Instrument, InstrumentBase
+from qcodes.instrument.base import (Instrument, InstrumentBase,
+                                    _record_snapshot_durations)
 from qcodes.instrument.channel import ChannelList
 from qcodes.instrument.parameter import (
     Parameter, ManualParameter,
@@ -65,6 +69,18 @@ def get_config_use_monitor() -> Optional[str]:
     return qcodes.config["station"]["use_monitor"]
 
 
+def get_config_snapshot_concurrently() -> bool:
+    return qcodes.config["station"]["snapshot_concurrently"]
+
+
+def get_config_snapshot_max_workers() -> Optional[int]:
+    return qcodes.config["station"]["snapshot_max_workers"]
+
+
+def get_config_snapshot_timeout() -> Optional[float]:
+    return qcodes.config["station"]["snapshot_timeout"]
+
+
 ChannelOrInstrumentBase = Union[InstrumentBase, ChannelList]
 
 
@@ -140,7 +156,9 @@ class Station(Metadatable, DelegateAttributes):
         self.load_config_file(self.config_file)
 
     def snapshot_base(self, update: Optional[bool] = True,
-                      params_to_skip_update: Optional[Sequence[str]] = None
+                      params_to_skip_update: Optional[Sequence[str]] = None,
+                      concurrent: Optional[bool] = None,
+                      timeout: Optional[float] = None
                       ) -> Dict:
         """
         State of the station as a JSON-compatible dictionary (everything that
@@ -159,10 +177,23 @@ class Station(Metadatable, DelegateAttributes):
                 If ``False``, just use the latest
                 values in memory and never update the state.
             params_to_skip_update: Not used.
+            concurrent: If ``True``, snapshot the components concurrently,
+                see :meth:`_snapshot_components_concurrently`. If None
+                (default), use the ``snapshot_concurrently`` setting of the
+                station section of the qcodes config.
+            timeout: Only used when snapshotting concurrently. Time in
+                seconds after which to stop waiting for the components. If
+                None (default), use the ``snapshot_timeout`` setting of the
+                station section of the qcodes config.
 
         Returns:
             dict: Base snapshot.
         """
+        if concurrent is None:
+            concurrent = get_config_snapshot_concurrently()
+        if timeout is None:
+            timeout = get_config_snapshot_timeout()
+
         snap: Dict = {
             'instruments': {},
             'parameters': {},
@@ -171,28 +202,127 @@ class Station(Metadatable, DelegateAttributes):
         }
 
         components_to_remove = []
+        components: Dict[str, Metadatable] = {}
 
         for name, itm in self.components.items():
+            # instruments can be closed during the lifetime of the
+            # station object, hence this 'if' allows to avoid
+            # snapshotting instruments that are already closed
+            if isinstance(itm, Instrument) and not Instrument.is_valid(itm):
+                components_to_remove.append(name)
+            else:
+                components[name] = itm
+
+        if concurrent:
+            component_snaps, timing = self._snapshot_components_concurrently(
+                components, update, timeout)
+            snap['snapshot_timing'] = timing
+        else:
+            component_snaps = {name: itm.snapshot(update=update)
+                               for name, itm in components.items()}
+
+        for name, itm in components.items():
             if isinstance(itm, Instrument):
-                # instruments can be closed during the lifetime of the
-                # station object, hence this 'if' allows to avoid
-                # snapshotting instruments that are already closed
-                if Instrument.is_valid(itm):
-                    snap['instruments'][name] = itm.snapshot(update=update)
-                else:
-                    components_to_remove.append(name)
+                section = 'instruments'
             elif isinstance(itm, (Parameter,
                                   ManualParameter
                                   )):
-                snap['parameters'][name] = itm.snapshot(update=update)
+                section = 'parameters'
             else:
-                snap['components'][name] = itm.snapshot(update=update)
+                section = 'components'
+            snap[section][name] = component_snaps[name]
 
         for c in components_to_remove:
             self.remove_component(c)
 
         return snap
 
+    @staticmethod
+    def _snapshot_components_concurrently(
+            components: Dict[str, Metadatable],
+            update: Optional[bool],
+            timeout: Optional[float]
+    ) -> Tuple[Dict[str, Dict], Dict[str, Any]]:
+        """
+        Snapshot the given components with one thread per root instrument,
+        such that instruments on independent connections are queried at the
+        same time. The components that share a root instrument are
+        snapshotted one after the other in the same thread in the order of
+        the station, such that the commands sent to each instrument stay in
+        order. The duration of the snapshot of each parameter of an
+        instrument is recorded as ``snapshot_duration`` in its snapshot.
+
+        If the snapshot is not done within ``timeout`` seconds, the
+        components whose snapshot has not started by then are snapshotted
+        from the values in memory (``update=False``) and a warning is
+        logged. The snapshots that are running at the timeout are waited
+        for, such that no thread is left querying an instrument when this
+        method returns.
+
+        Returns:
+            The snapshots of the components and a dictionary holding the
+            total duration, the duration of the snapshot of each component
+            and the names of the components that timed out.
+        """
+        groups: Dict[int, List[str]] = {}
+        for name, itm in components.items():
+            root = getattr(itm, 'root_instrument', None)
+            key = id(root) if root is not None else id(itm)
+            groups.setdefault(key, []).append(name)
+
+        component_snaps: Dict[str, Dict] = {}
+        durations: Dict[str, float] = {}
+        timed_out_event = threading.Event()
+
+        def snapshot_group(names: List[str]) -> None:
+            token = _record_snapshot_durations.set(True)
+            try:
+                for name in names:
+                    if timed_out_event.is_set():
+                        break
+                    t_start = time.perf_counter()
+                    snap = components[name].snapshot(update=update)
+                    durations[name] = time.perf_counter() - t_start
+                    component_snaps[name] = snap
+            finally:
+                _record_snapshot_durations.reset(token)
+
+        max_workers = get_config_snapshot_max_workers() or len(groups)
+        t_start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=max(max_workers, 1),
+                                      thread_name_prefix='station_snapshot')
+        futures = []
+        try:
+            for names in groups.values():
+                futures.append(executor.submit(snapshot_group, names))
+            _, not_done = wait(futures, timeout=timeout)
+            if not_done:
+                # skip the components not started yet and wait for the
+                # running ones to keep the commands to each instrument in
+                # order
+                timed_out_event.set()
+                wait(not_done)
+            # raise the errors of the components that have failed
+            for future in futures:
+                future.result()
+        finally:
+            timed_out_event.set()
+            executor.shutdown(wait=True)
+
+        timed_out = [name for name in components
+                     if name not in component_snaps]
+        if timed_out:
+            log.warning(f"Snapshot of {timed_out} did not start within "
+                        f"{timeout} s, using the values in memory instead.")
+            for name in timed_out:
+                component_snaps[name] = components[name].snapshot(
+                    update=False)
+
+        timing = {'duration': time.perf_counter() - t_start,
+                  'components': durations,
+                  'timed_out': timed_out}
+        return component_snaps, timing
+
     def add_component(self, component: Metadatable, name: Optional[str] = None,
                       update_snapshot: bool = True) -> str:
         """
@@ -230,6 +230,33 @@ def test_mixing_array_and_numeric(DAC, bg_writing):
                              (DAC.ch2, np.array([DAC.ch2(), DAC.ch1()])))
 
 
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("bg_writing", [True, False])
+def test_raw_array_format(DAC, bg_writing):
+    meas = Measurement()
+    meas.register_parameter(DAC.ch1)
+    meas.register_parameter(DAC.ch2, paramtype='array',
+                            setpoints=(DAC.ch1,))
+    meas.set_array_format('raw')
+
+    with meas.run(write_in_background=bg_writing) as datasaver:
+        for i in range(5):
+            datasaver.add_result((DAC.ch1, i),
+                                 (DAC.ch2, np.arange(3) * i))
+
+    ds = datasaver.dataset
+    assert load_by_id(ds.run_id).description.array_format == 'raw'
+    assert_array_equal(ds.get_parameter_data()['dummy_dac_ch2']
+                       ['dummy_dac_ch2'],
+                       np.arange(3) * np.arange(5)[:, np.newaxis])
+
+
+def test_invalid_array_format_raises():
+    meas = Measurement()
+    with pytest.raises(ValueError, match="Invalid array_format"):
+        meas.set_array_format('hdf5')
+
+
 def test_measurement_name_default(experiment, DAC, DMM):
     fmt = experiment.format_string
     exp_id = experiment.exp_id
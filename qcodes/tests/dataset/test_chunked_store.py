@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from qcodes.dataset.chunked_store import (ChunkedArray,
+                                          export_to_chunked_store,
+                                          load_from_chunked_store)
+from qcodes.dataset.measurements import Measurement
+
+
+def _array_dataset(values, paramtype='array'):
+    meas = Measurement()
+    meas.register_custom_parameter('x', paramtype=paramtype)
+    meas.register_custom_parameter('y', paramtype=paramtype,
+                                   setpoints=('x',))
+    with meas.run() as datasaver:
+        for value in values:
+            datasaver.add_result(('x', value), ('y', value))
+            datasaver.flush_data_to_database()
+    return datasaver.dataset
+
+
+@pytest.mark.parametrize("compress", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 300, 10**4])
+def test_chunked_store_roundtrip(scalar_dataset, tmp_path, compress,
+                                 chunk_size):
+    path = str(tmp_path / 'store')
+    export_to_chunked_store(scalar_dataset, path, chunk_size=chunk_size,
+                            compress=compress)
+    store = load_from_chunked_store(path)
+
+    assert store.run_id == scalar_dataset.run_id
+    assert store.guid == scalar_dataset.guid
+    assert store.description == scalar_dataset.description
+    assert store.snapshot_raw == scalar_dataset.snapshot_raw
+
+    expected = scalar_dataset.get_parameter_data()
+    assert store.data.keys() == expected.keys()
+    for tree, tree_data in expected.items():
+        assert store.data[tree].keys() == tree_data.keys()
+        for name, values in tree_data.items():
+            chunked = store.data[tree][name]
+            assert isinstance(chunked, ChunkedArray)
+            assert chunked.shape == values.shape
+            assert chunked.n_chunks == -(-1000 // chunk_size)
+            assert_array_equal(np.asarray(chunked), values)
+            assert_array_equal(chunked[295:605], values[295:605])
+            assert_array_equal(chunked[-3:], values[-3:])
+            assert_array_equal(chunked[::7], values[::7])
+            assert chunked[-1] == values[-1]
+            assert_array_equal(chunked[[3, 999, 0]], values[[3, 999, 0]])
+
+
+def test_chunked_store_memory_maps_chunks(scalar_dataset, tmp_path):
+    path = str(tmp_path / 'store')
+    export_to_chunked_store(scalar_dataset, path, chunk_size=100)
+    chunked = load_from_chunked_store(path).data['param_3']['param_0']
+    assert isinstance(chunked[100:150], np.memmap)
+    assert isinstance(chunked.chunk(3), np.memmap)
+    assert_array_equal(chunked.chunk(3), np.arange(300, 400))
+
+
+def test_chunked_store_array_dataset(array_dataset, tmp_path):
+    path = str(tmp_path / 'store')
+    export_to_chunked_store(array_dataset, path, chunk_size=1)
+    store = load_from_chunked_store(path)
+    expected = array_dataset.get_parameter_data()
+    for tree, tree_data in expected.items():
+        for name, values in tree_data.items():
+            assert_array_equal(store.data[tree][name][:], values)
+            index = (0, 2) if values.ndim == 2 else (2,)
+            assert store.data[tree][name][index] == values[index]
+
+
+def test_chunked_store_errors(scalar_dataset, tmp_path):
+    path = str(tmp_path / 'store')
+    export_to_chunked_store(scalar_dataset, path)
+    with pytest.raises(FileExistsError):
+        export_to_chunked_store(scalar_dataset, path)
+
+    with pytest.raises(ValueError, match="does not contain a complete"):
+        load_from_chunked_store(str(tmp_path))
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("values, match", [
+    ([np.zeros(3), np.zeros(4)], "shape of its values changes"),
+    ([np.zeros(3), np.zeros(3, dtype=complex)],
+     "dtype of its values changes"),
+])
+def test_chunked_store_inconsistent_chunks_raise(tmp_path, values, match):
+    dataset = _array_dataset(values)
+    with pytest.raises(ValueError, match=match):
+        export_to_chunked_store(dataset, str(tmp_path / 'store'),
+                                chunk_size=1)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_chunked_store_strings_of_varying_length(tmp_path):
+    dataset = _array_dataset(['a', 'abc', 'ab'], paramtype='text')
+    path = str(tmp_path / 'store')
+    export_to_chunked_store(dataset, path, chunk_size=1)
+    chunked = load_from_chunked_store(path).data['y']['y']
+    assert chunked.dtype == np.dtype('<U3')
+    assert_array_equal(np.asarray(chunked), ['a', 'abc', 'ab'])
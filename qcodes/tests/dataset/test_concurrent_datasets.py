@@ -1,10 +1,15 @@
 """
 Test that multiple datasets can coexist as expected
 """
+from queue import Queue
+
+import numpy as np
 import pytest
 
 from qcodes import new_experiment
-from qcodes.dataset.data_set import DataSet
+from qcodes.dataset.data_set import DataSet, _BackgroundWriter
+from qcodes.dataset.descriptions.dependencies import InterDependencies_
+from qcodes.dataset.descriptions.param_spec import ParamSpecBase
 
 
 def test_foreground_after_background_raises(empty_temp_db_connection):
@@ -58,3 +63,80 @@ def test_foreground_after_background_non_concurrent(empty_temp_db_connection):
     ds3 = DataSet(conn=empty_temp_db_connection)
     ds3.mark_started(start_bg_writer=True)
     ds3.mark_completed()
+
+
+def _started_dataset(conn):
+    ds = DataSet(conn=conn)
+    x = ParamSpecBase("x", "numeric")
+    y = ParamSpecBase("y", "numeric")
+    ds.set_interdependencies(InterDependencies_(dependencies={y: (x,)}))
+    ds.mark_started(start_bg_writer=False)
+    return ds
+
+
+@pytest.mark.parametrize("max_batch_size,n_batches", [(100, 1), (3, 4)])
+def test_background_writer_groups_datasets(empty_temp_db_connection,
+                                           max_batch_size, n_batches):
+    new_experiment("test", "test1", conn=empty_temp_db_connection)
+    ds1 = _started_dataset(empty_temp_db_connection)
+    ds2 = _started_dataset(empty_temp_db_connection)
+
+    queue = Queue()
+    for i in range(5):
+        for ds in (ds1, ds2):
+            queue.put({'keys': ['x', 'y'],
+                       'values': [[float(i), float(ds.run_id * i)]],
+                       'table_name': ds.table_name})
+    queue.put({'keys': 'stop', 'values': []})
+
+    writer = _BackgroundWriter(queue, empty_temp_db_connection,
+                               max_batch_size=max_batch_size)
+    assert writer.queue_depth == 11
+    writer.start()
+    writer.join(timeout=10)
+    assert not writer.is_alive()
+
+    for ds in (ds1, ds2):
+        data = ds.get_parameter_data()['y']
+        np.testing.assert_array_equal(data['x'], np.arange(5.))
+        np.testing.assert_array_equal(data['y'], ds.run_id * np.arange(5.))
+
+    assert writer.queue_depth == 0
+    assert writer.metrics.batches_committed == n_batches
+    assert writer.metrics.items_written == 10
+    assert writer.metrics.max_queue_depth == 11
+    assert writer.metrics.max_batch_size == min(max_batch_size, 10)
+    assert writer.metrics.max_commit_latency > 0
+    assert (writer.metrics.total_commit_time
+            >= writer.metrics.max_commit_latency)
+
+
+def test_background_writer_survives_failing_item(empty_temp_db_connection):
+    new_experiment("test", "test1", conn=empty_temp_db_connection)
+    ds = _started_dataset(empty_temp_db_connection)
+
+    queue = Queue()
+    queue.put({'keys': ['x', 'y'], 'values': [[0., 1.]],
+               'table_name': ds.table_name})
+    queue.put({'keys': ['x', 'no_such_column'], 'values': [[1., 2.]],
+               'table_name': ds.table_name})
+    queue.put({'keys': ['x', 'y'], 'values': [[2., 3.]],
+               'table_name': ds.table_name})
+
+    writer = _BackgroundWriter(queue, empty_temp_db_connection,
+                               max_batch_size=100, max_latency=0.1)
+    writer.start()
+    # all items are marked as done although one of them fails
+    queue.join()
+
+    queue.put({'keys': ['x', 'y'], 'values': [[3., 4.]],
+               'table_name': ds.table_name})
+    queue.put({'keys': 'stop', 'values': []})
+    writer.join(timeout=10)
+    assert not writer.is_alive()
+
+    data = ds.get_parameter_data()['y']
+    np.testing.assert_array_equal(data['x'], [0., 2., 3.])
+    np.testing.assert_array_equal(data['y'], [1., 3., 4.])
+    assert writer.metrics.items_failed == 1
+    assert writer.metrics.items_written == 3
@@ -11,7 +11,7 @@ from qcodes.dataset.descriptions.versioning.converters import (new_to_old,
                                                                v2_to_v1)
 from qcodes.dataset.descriptions.versioning.rundescribertypes import (
     RunDescriberV0Dict, RunDescriberV1Dict, RunDescriberV2Dict,
-    RunDescriberV3Dict)
+    RunDescriberV3Dict, RunDescriberV4Dict)
 from qcodes.dataset.descriptions.versioning.serialization import \
     from_dict_to_current
 from qcodes.dataset.descriptions.versioning.v0 import InterDependencies
@@ -84,15 +84,16 @@ def test_construct_current_rundescriber_from_v0(some_paramspecs):
 
     rds_upgraded = from_dict_to_current(v0)
 
-    expected_v3_dict = RunDescriberV3Dict(
+    expected_v4_dict = RunDescriberV4Dict(
         interdependencies=interdeps._to_dict(),
         interdependencies_=old_to_new(interdeps)._to_dict(),
-        version=3,
+        version=4,
         shapes=None,
+        array_format='npy',
     )
-    assert DeepDiff(rds1._to_dict(), expected_v3_dict,
+    assert DeepDiff(rds1._to_dict(), expected_v4_dict,
                     ignore_order=True) == {}
-    assert DeepDiff(rds_upgraded._to_dict(), expected_v3_dict,
+    assert DeepDiff(rds_upgraded._to_dict(), expected_v4_dict,
                     ignore_order=True) == {}
 
 
@@ -105,14 +106,15 @@ def test_construct_current_rundescriber_from_v1(some_interdeps):
     rds1 = RunDescriber._from_dict(v1)
     rds_upgraded = from_dict_to_current(v1)
 
-    expected_v3_dict = RunDescriberV3Dict(
+    expected_v4_dict = RunDescriberV4Dict(
         interdependencies=interdeps._to_dict(),
         interdependencies_=interdeps_._to_dict(),
-        version=3,
+        version=4,
         shapes=None,
+        array_format='npy',
     )
-    assert rds1._to_dict() == expected_v3_dict
-    assert rds_upgraded._to_dict() == expected_v3_dict
+    assert rds1._to_dict() == expected_v4_dict
+    assert rds_upgraded._to_dict() == expected_v4_dict
 
 
 def test_construct_current_rundescriber_from_v2(some_interdeps):
@@ -123,17 +125,18 @@ def test_construct_current_rundescriber_from_v2(some_interdeps):
                             interdependencies_=interdeps_._to_dict(),
                             version=2)
 
-    expected_v3_dict = RunDescriberV3Dict(
+    expected_v4_dict = RunDescriberV4Dict(
         interdependencies=interdeps._to_dict(),
         interdependencies_=interdeps_._to_dict(),
-        version=3,
+        version=4,
         shapes=None,
+        array_format='npy',
     )
     rds1 = RunDescriber._from_dict(v2)
     rds_upgraded = from_dict_to_current(v2)
 
-    assert rds1._to_dict() == expected_v3_dict
-    assert rds_upgraded._to_dict() == expected_v3_dict
+    assert rds1._to_dict() == expected_v4_dict
+    assert rds_upgraded._to_dict() == expected_v4_dict
 
 
 def test_construct_current_rundescriber_from_v3(some_interdeps):
@@ -146,23 +149,47 @@ def test_construct_current_rundescriber_from_v3(some_interdeps):
                             shapes=None)
     rds1 = RunDescriber._from_dict(v3)
     rds_upgraded = from_dict_to_current(v3)
-    assert rds1._to_dict() == v3
-    assert rds_upgraded._to_dict() == v3
+
+    expected_v4_dict = RunDescriberV4Dict(
+        interdependencies=interdeps._to_dict(),
+        interdependencies_=interdeps_._to_dict(),
+        version=4,
+        shapes=None,
+        array_format='npy',
+    )
+    assert rds1._to_dict() == expected_v4_dict
+    assert rds_upgraded._to_dict() == expected_v4_dict
 
 
-def test_construct_current_rundescriber_from_fake_v4(some_interdeps):
+def test_construct_current_rundescriber_from_v4(some_interdeps):
     interdeps_ = some_interdeps[0]
     interdeps = new_to_old(interdeps_)
 
-    v4 = RunDescriberV3Dict(interdependencies=interdeps._to_dict(),
+    v4 = RunDescriberV4Dict(interdependencies=interdeps._to_dict(),
                             interdependencies_=interdeps_._to_dict(),
                             version=4,
-                            shapes=None)
-    v4['foobar'] = {"foo": ["bar"]}
+                            shapes=None,
+                            array_format='raw')
     rds1 = RunDescriber._from_dict(v4)
     rds_upgraded = from_dict_to_current(v4)
-    v3 = v4.copy()
-    v3.pop('foobar')
-    v3['version'] = 3
-    assert rds1._to_dict() == v3
-    assert rds_upgraded._to_dict() == v3
+    assert rds1._to_dict() == v4
+    assert rds_upgraded._to_dict() == v4
+
+
+def test_construct_current_rundescriber_from_fake_v5(some_interdeps):
+    interdeps_ = some_interdeps[0]
+    interdeps = new_to_old(interdeps_)
+
+    v5 = RunDescriberV4Dict(interdependencies=interdeps._to_dict(),
+                            interdependencies_=interdeps_._to_dict(),
+                            version=5,
+                            shapes=None,
+                            array_format='npy')
+    v5['foobar'] = {"foo": ["bar"]}
+    rds1 = RunDescriber._from_dict(v5)
+    rds_upgraded = from_dict_to_current(v5)
+    v4 = v5.copy()
+    v4.pop('foobar')
+    v4['version'] = 4
+    assert rds1._to_dict() == v4
+    assert rds_upgraded._to_dict() == v4
@@ -582,6 +582,30 @@ def _assert_partial_cache_is_as_expected(
             )
 
 
+def test_cache_without_shape_appends_to_buffer(experiment, DAC, DMM):
+    meas = Measurement()
+    meas.register_parameter(DAC.ch1)
+    meas.register_parameter(DMM.v1, setpoints=(DAC.ch1,))
+
+    previous_views = []
+    with meas.run() as datasaver:
+        dataset = datasaver.dataset
+        for i in range(10):
+            datasaver.add_result((DAC.ch1, i), (DMM.v1, 2 * i))
+            datasaver.flush_data_to_database(block=True)
+            data = dataset.cache.data()['dummy_dmm_v1']
+            assert_array_equal(data['dummy_dac_ch1'], np.arange(i + 1))
+            assert_array_equal(data['dummy_dmm_v1'], 2 * np.arange(i + 1))
+            previous_views.append(data['dummy_dac_ch1'])
+
+    # earlier views are not affected by data appended later
+    for i, view in enumerate(previous_views):
+        assert_array_equal(view, np.arange(i + 1))
+    # the buffer grows geometrically so most loads do not reallocate
+    buffers = {id(view.base) for view in previous_views[1:]}
+    assert len(buffers) <= 3
+
+
 def _assert_parameter_data_is_identical(expected: Dict[str, Dict[str, np.ndarray]],
                                         actual: Dict[str, Dict[str, np.ndarray]]):
     assert expected.keys() == actual.keys()
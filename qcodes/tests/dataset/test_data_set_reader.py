@@ -0,0 +1,87 @@
+import threading
+import time
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from qcodes.dataset.data_set import DataSet, load_by_id
+from qcodes.dataset.data_set_reader import DataSetReader
+from qcodes.dataset.descriptions.dependencies import InterDependencies_
+from qcodes.dataset.descriptions.param_spec import ParamSpecBase
+from qcodes.dataset.sqlite.database import connect
+
+
+def _new_started_dataset(conn):
+    x = ParamSpecBase("x", "numeric")
+    y = ParamSpecBase("y", "numeric")
+    ds = DataSet(conn=conn)
+    ds.set_interdependencies(InterDependencies_(dependencies={y: (x,)}))
+    ds.mark_started()
+    return ds
+
+
+def test_reader_only_loads_on_changes(experiment):
+    ds = _new_started_dataset(experiment.conn)
+    reader_conn = connect(ds.path_to_db)
+    reader = DataSetReader(load_by_id(ds.run_id, conn=reader_conn))
+
+    assert reader.data_version is None
+    assert reader.update()
+    assert reader.last_seen_rowid == 0
+    assert not reader.has_changed()
+
+    ds.add_results([{'x': float(i), 'y': float(i**2)} for i in range(5)])
+    assert reader.has_changed()
+    assert reader.last_seen_rowid == 5
+    # the change has been seen but the data has not been loaded yet
+    assert reader.has_changed()
+    assert reader.update()
+    assert not reader.has_changed()
+
+    ds.add_results([{'x': 5., 'y': 25.}])
+    assert_array_equal(reader.data()['y']['y'], np.arange(6.)**2)
+    # modifying the returned data leaves the cache intact
+    reader.data()['y'].clear()
+    reader.data()['y']['y'][:] = 0
+    assert_array_equal(reader.data()['y']['y'], np.arange(6.)**2)
+    assert reader.last_seen_rowid == 6
+    assert not reader.update()
+
+    # a change of the database that does not touch the run is ignored
+    other_ds = _new_started_dataset(experiment.conn)
+    other_ds.add_results([{'x': 0., 'y': 0.}])
+    assert not reader.update()
+    assert reader.last_seen_rowid == 6
+
+    ds.mark_completed()
+    assert reader.update()
+    assert reader.completed
+    assert not reader.has_changed()
+    assert reader.wait_for_new_data(timeout=1) is False
+    reader_conn.close()
+
+
+def test_reader_waits_for_new_data(experiment):
+    ds = _new_started_dataset(experiment.conn)
+    reader_conn = connect(ds.path_to_db)
+    reader = DataSetReader(load_by_id(ds.run_id, conn=reader_conn),
+                           poll_interval=0.01)
+    reader.update()
+
+    t_start = time.perf_counter()
+    assert reader.wait_for_new_data(timeout=0.1) is False
+    assert time.perf_counter() - t_start >= 0.1
+
+    def write():
+        time.sleep(0.2)
+        conn = connect(ds.path_to_db)
+        writer_ds = load_by_id(ds.run_id, conn=conn)
+        writer_ds.add_results([{'x': 1., 'y': 2.}])
+        conn.close()
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    assert reader.wait_for_new_data(timeout=10)
+    thread.join()
+    assert_array_equal(reader.data()['y']['x'], [1.])
+    reader_conn.close()
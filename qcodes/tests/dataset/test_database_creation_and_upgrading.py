@@ -690,7 +690,7 @@ def test_perform_actual_upgrade_5_to_6():
             assert deser['version'] == 0
 
             desc = serial.from_json_to_current(json_str)
-            assert desc._version == 3
+            assert desc._version == 4
 
 
 def test_perform_upgrade_6_7():
@@ -785,6 +785,55 @@ def test_atomicity(two_empty_temp_db_connections, some_interdeps):
             extract_runs_into_db(source_path, target_path, 1, 2)
 
 
+def test_runs_per_transaction(two_empty_temp_db_connections, some_interdeps):
+    """
+    Test that runs are committed batch by batch when extracting with
+    runs_per_transaction, such that the runs of the batches preceding a
+    failing batch end up in the target
+    """
+    source_conn, target_conn = two_empty_temp_db_connections
+
+    source_path = path_to_dbfile(source_conn)
+    target_path = path_to_dbfile(target_conn)
+
+    source_exp = Experiment(conn=source_conn)
+    source_datasets = [DataSet(conn=source_conn, exp_id=source_exp.exp_id)
+                       for _ in range(3)]
+
+    for i, ds in enumerate(source_datasets):
+        ds.set_interdependencies(some_interdeps[1])
+        ds.mark_started()
+        ds.add_results([{name: float(i + j)
+                         for name in some_interdeps[1].names}
+                        for j in range(5)])
+
+    # the last run is NOT marked as completed
+    source_datasets[0].mark_completed()
+    source_datasets[1].mark_completed()
+
+    with pytest.raises(ValueError, match='runs_per_transaction'):
+        extract_runs_into_db(source_path, target_path, 1, 2, 3,
+                             runs_per_transaction=0)
+
+    with pytest.raises(RuntimeError):
+        extract_runs_into_db(source_path, target_path, 1, 2, 3,
+                             runs_per_transaction=2)
+
+    target_exp = Experiment(conn=target_conn, exp_id=1)
+    assert len(target_exp) == 2
+
+    for source_ds in source_datasets[:2]:
+        target_ds = load_by_guid(source_ds.guid, conn=target_conn)
+        assert target_ds.number_of_results == 5
+        source_data = source_ds.get_parameter_data()
+        target_data = target_ds.get_parameter_data()
+        assert target_data.keys() == source_data.keys()
+        for tree_name, tree_data in source_data.items():
+            for name, values in tree_data.items():
+                np.testing.assert_array_equal(target_data[tree_name][name],
+                                              values)
+
+
 def test_column_mismatch(two_empty_temp_db_connections, some_interdeps, inst):
     """
     Test insertion of runs with no metadata and no snapshot into a DB already
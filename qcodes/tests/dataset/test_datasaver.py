@@ -128,3 +128,191 @@ def test_saving_numeric_values_as_text(numeric_type, bg_writing):
     finally:
         data_saver.dataset.mark_completed()
         data_saver.dataset.conn.close()
+
+
+@pytest.mark.usefixtures("experiment")
+@pytest.mark.parametrize("bg_writing", [True, False])
+def test_results_are_buffered_as_columns(bg_writing):
+    x = ParamSpecBase("x", "numeric")
+    y = ParamSpecBase("y", "numeric")
+    t = ParamSpecBase("t", "text")
+    z = ParamSpecBase("z", "numeric")
+    s = ParamSpecBase("s", "numeric")
+    idps = InterDependencies_(dependencies={z: (x, y)},
+                              inferences={z: (t,)},
+                              standalones=(s,))
+
+    test_set = qc.new_data_set("test-dataset")
+    test_set.set_interdependencies(idps)
+    test_set.mark_started(start_bg_writer=bg_writing)
+    data_saver = DataSaver(dataset=test_set, write_period=float('inf'),
+                           interdeps=idps)
+
+    ys = np.linspace(0, 1, 5)
+    for x_value in range(3):
+        data_saver.add_result(("x", x_value), ("y", ys),
+                              ("z", x_value + ys), ("t", "tag"))
+    data_saver.add_result(("s", np.arange(2)))
+
+    # one block of columns per parameter tree and add_result, no rows
+    assert len(test_set._results) == 4
+    block = test_set._results[0]
+    assert set(block) == {"x", "y", "z", "t"}
+    assert all(isinstance(column, np.ndarray) and len(column) == 5
+               for column in block.values())
+    np.testing.assert_array_equal(block["t"], ["tag"] * 5)
+
+    data_saver.flush_data_to_database(block=True)
+    assert test_set._results == []
+    test_set.mark_completed()
+
+    data = test_set.get_parameter_data()
+    np.testing.assert_array_equal(data["z"]["x"],
+                                  np.repeat(np.arange(3), 5))
+    np.testing.assert_array_equal(data["z"]["y"], np.tile(ys, 3))
+    np.testing.assert_array_equal(data["z"]["z"],
+                                  np.repeat(np.arange(3), 5) + np.tile(ys, 3))
+    np.testing.assert_array_equal(data["s"]["s"], [0, 1])
+
+
+@pytest.mark.usefixtures("experiment")
+def test_result_plans_are_reused():
+    x = ParamSpecBase("x", "numeric")
+    y = ParamSpecBase("y", "numeric")
+    idps = InterDependencies_(dependencies={y: (x,)})
+
+    test_set = qc.new_data_set("test-dataset")
+    test_set.set_interdependencies(idps)
+    test_set.mark_started()
+    data_saver = DataSaver(dataset=test_set, write_period=float('inf'),
+                           interdeps=idps)
+    try:
+        for value in range(3):
+            data_saver.add_result(("x", value), ("y", value))
+        data_saver.add_result(("y", np.arange(3)), ("x", np.arange(3)))
+        assert len(data_saver._result_plans) == 2
+
+        # the checks of the values still run with a cached plan
+        with pytest.raises(ValueError, match="Incompatible shapes"):
+            data_saver.add_result(("y", np.arange(3)), ("x", np.arange(2)))
+        with pytest.raises(ValueError, match="is of type"):
+            data_saver.add_result(("x", 0), ("y", "text"))
+        # and failing dependency checks are not cached
+        for _ in range(2):
+            with pytest.raises(ValueError, match="some required parameters"):
+                data_saver.add_result(("y", 0))
+        with pytest.raises(ValueError, match="no such parameter"):
+            data_saver.add_result(("x", 0), ("z", 0))
+
+        data_saver.flush_data_to_database()
+        data = test_set.get_parameter_data()["y"]
+        np.testing.assert_array_equal(data["x"], [0, 1, 2, 0, 1, 2])
+    finally:
+        test_set.mark_completed()
+        test_set.conn.close()
+
+
+def _make_block_dataset(*paramtypes):
+    x = ParamSpecBase("x", paramtypes[0])
+    y = ParamSpecBase("y", paramtypes[1])
+    z = ParamSpecBase("z", paramtypes[2])
+    idps = InterDependencies_(dependencies={z: (x, y)})
+    test_set = qc.new_data_set("test-dataset")
+    test_set.set_interdependencies(idps)
+    test_set.mark_started()
+    data_saver = DataSaver(dataset=test_set, write_period=float('inf'),
+                           interdeps=idps)
+    return test_set, data_saver
+
+
+@pytest.mark.usefixtures("experiment")
+def test_add_results_block_matches_add_result():
+    block_set, block_saver = _make_block_dataset("numeric", "numeric",
+                                                 "numeric")
+    point_set, point_saver = _make_block_dataset("numeric", "numeric",
+                                                 "numeric")
+    ys = np.linspace(0, 1, 7)
+    for x_value in range(3):
+        block_saver.add_results_block(("x", x_value), ("y", ys),
+                                      ("z", x_value * ys))
+        for y_value in ys:
+            point_saver.add_result(("x", x_value), ("y", y_value),
+                                   ("z", x_value * y_value))
+    for data_set, data_saver in ((block_set, block_saver),
+                                 (point_set, point_saver)):
+        data_saver.flush_data_to_database()
+        data_set.mark_completed()
+
+    block_data = block_set.get_parameter_data()["z"]
+    point_data = point_set.get_parameter_data()["z"]
+    assert block_data.keys() == point_data.keys()
+    for name in block_data:
+        np.testing.assert_array_equal(block_data[name], point_data[name])
+
+
+@pytest.mark.usefixtures("experiment")
+def test_add_results_block_array_type():
+    test_set, data_saver = _make_block_dataset("numeric", "array", "array")
+    ys = np.tile(np.linspace(0, 1, 5), (3, 1))
+    traces = np.random.rand(3, 5)
+    data_saver.add_results_block(("x", np.arange(3)), ("y", ys), ("z", traces))
+    data_saver.flush_data_to_database()
+    test_set.mark_completed()
+
+    assert test_set.number_of_results == 3
+    data = test_set.get_parameter_data()["z"]
+    np.testing.assert_array_equal(data["z"], traces)
+    np.testing.assert_array_equal(data["y"], ys)
+    np.testing.assert_array_equal(data["x"], np.repeat(np.arange(3), 5)
+                                  .reshape(3, 5))
+
+
+@pytest.mark.usefixtures("experiment")
+def test_add_results_block_validates():
+    test_set, data_saver = _make_block_dataset("numeric", "array", "array")
+    try:
+        with pytest.raises(ValueError, match="different numbers of points"):
+            data_saver.add_results_block(("x", np.arange(3)),
+                                         ("y", np.zeros(4)),
+                                         ("z", np.zeros((4, 5))))
+        with pytest.raises(ValueError, match="Incompatible shapes"):
+            data_saver.add_results_block(("x", np.arange(3)),
+                                         ("y", np.zeros((3, 4))),
+                                         ("z", np.zeros((3, 5))))
+        with pytest.raises(ValueError, match="some required parameters"):
+            data_saver.add_results_block(("z", np.zeros((3, 5))))
+        with pytest.raises(ValueError, match="is of type"):
+            data_saver.add_results_block(("x", ["a", "b"]),
+                                         ("y", np.zeros(2)),
+                                         ("z", np.zeros(2)))
+        assert test_set._results == []
+    finally:
+        test_set.mark_completed()
+        test_set.conn.close()
+
+
+@pytest.mark.usefixtures("experiment")
+def test_add_results_block_rejects_shaped_numeric_values():
+    test_set, data_saver = _make_block_dataset("numeric", "numeric",
+                                               "numeric")
+    try:
+        match = "must have a scalar value at each point"
+        with pytest.raises(ValueError, match=match):
+            data_saver.add_results_block(
+                ("x", 0), ("y", np.arange(6.).reshape(3, 2)),
+                ("z", np.arange(6.).reshape(3, 2)))
+        with pytest.raises(ValueError, match=match):
+            data_saver.add_results_block(
+                ("x", np.arange(6.).reshape(3, 2)),
+                ("y", np.arange(6.).reshape(3, 2)),
+                ("z", np.arange(6.).reshape(3, 2)))
+        assert test_set._results == []
+
+        data_saver.add_results_block(("x", 0), ("y", np.arange(3.)),
+                                     ("z", np.arange(3.)))
+        data_saver.flush_data_to_database()
+        data = test_set.get_parameter_data()["z"]
+        np.testing.assert_array_equal(data["z"], np.arange(3.))
+    finally:
+        test_set.mark_completed()
+        test_set.conn.close()
@@ -413,6 +413,48 @@ def test_add_data_array():
     np.testing.assert_allclose(y_data, expected_y)
 
 
+@pytest.mark.usefixtures("experiment")
+def test_add_data_array_raw_format():
+    idps = InterDependencies_(
+        dependencies={ParamSpecBase("y", "array"):
+                      (ParamSpecBase("x", "numeric"),)})
+    mydataset = DataSet(specs=idps, array_format='raw')
+    mydataset.mark_started()
+
+    expected_x = np.arange(10)
+    expected_y = [np.random.random_sample(5) for _ in expected_x]
+    mydataset.add_results([{"x": x, "y": y}
+                           for x, y in zip(expected_x, expected_y)])
+
+    raw_y = mydataset.conn.execute(
+        f'SELECT CAST(y AS BLOB) FROM "{mydataset.table_name}"').fetchone()[0]
+    assert raw_y.startswith(b'\x93QCRAW')
+
+    shadow_ds = make_shadow_dataset(mydataset)
+    assert shadow_ds.description.array_format == 'raw'
+
+    for ds in (mydataset, shadow_ds):
+        data = ds.get_parameter_data()['y']
+        np.testing.assert_array_equal(data['y'], expected_y)
+        np.testing.assert_array_equal(data['x'],
+                                      np.repeat(expected_x, 5).reshape(10, 5))
+        np.testing.assert_array_equal(ds.cache.data()['y']['y'], expected_y)
+
+
+@pytest.mark.parametrize("array", (np.arange(6, dtype='>i4').reshape(2, 3),
+                                   np.array([1+1j, 2-2j]),
+                                   np.array(['a', 'bcd']),
+                                   np.array(1.5),
+                                   np.zeros(2, dtype=[('a', 'f8'),
+                                                      ('b', 'i2')])))
+def test_raw_array_format_roundtrip(array):
+    from qcodes.dataset.sqlite.database import (_adapt_array_raw,
+                                                _convert_array)
+    converted = _convert_array(bytes(_adapt_array_raw(array)))
+    assert converted.dtype == array.dtype
+    np.testing.assert_array_equal(converted, array)
+
+
 @pytest.mark.usefixtures("experiment")
 def test_adding_too_many_results():
     """
@@ -823,6 +865,58 @@ def test_get_parameter_data(scalar_dataset, start, end):
                           end)
 
 
+@pytest.mark.parametrize("start,end,last,expected", [
+    (None, None, 10, np.arange(990, 1000)),
+    (None, 995, 10, np.arange(985, 995)),
+    (5, None, 2000, np.arange(4, 1000)),
+    (None, 2, 1, np.arange(1, 2)),
+    (None, None, 0, np.arange(0)),
+])
+def test_get_parameter_data_last(scalar_dataset, start, end, last,
+                                 expected):
+    data = scalar_dataset.get_parameter_data('param_3', start=start, end=end,
+                                             last=last)
+    if len(expected) == 0:
+        assert data['param_3'] == {}
+        return
+    np.testing.assert_array_equal(data['param_3']['param_0'], expected)
+    np.testing.assert_array_equal(data['param_3']['param_3'],
+                                  expected + 30000)
+
+
+@pytest.mark.parametrize("create_indices", [True, False])
+def test_get_parameter_data_setpoint_ranges(scalar_dataset, create_indices):
+    if create_indices:
+        index_names = scalar_dataset.create_setpoint_indices()
+        assert len(index_names) == 3
+        # creating the indices again is a noop
+        assert scalar_dataset.create_setpoint_indices('param_0') == \
+            index_names[:1]
+
+    data = scalar_dataset.get_parameter_data(
+        'param_3', setpoint_ranges={'param_0': (100, 199),
+                                    'param_1': (10150, None)})['param_3']
+    np.testing.assert_array_equal(data['param_0'], np.arange(150, 200))
+    np.testing.assert_array_equal(data['param_2'], np.arange(20150, 20200))
+
+    data = scalar_dataset.get_parameter_data(
+        'param_3', last=5,
+        setpoint_ranges={'param_0': (None, 99.5)})['param_3']
+    np.testing.assert_array_equal(data['param_0'], np.arange(95, 100))
+
+    data = scalar_dataset.get_parameter_data(
+        'param_3', setpoint_ranges={'param_0': (2000, 3000)})
+    assert data['param_3'] == {}
+
+
+def test_setpoint_ranges_of_unknown_parameter_raises(scalar_dataset):
+    with pytest.raises(ValueError, match="not part of the parameter trees"):
+        scalar_dataset.get_parameter_data(
+            'param_3', setpoint_ranges={'param_5; DROP TABLE runs': (0, 1)})
+    with pytest.raises(ValueError, match="Cannot index unknown"):
+        scalar_dataset.create_setpoint_indices('param_5')
+
+
 def test_get_scalar_parameter_data_no_nulls(scalar_dataset_with_nulls):
 
     expected_names = {}
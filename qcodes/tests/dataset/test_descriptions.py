@@ -34,6 +34,26 @@ def test_equality(some_paramspecbases):
     assert desc_3 != desc_2
 
 
+def test_invalid_array_format_raises(some_interdeps):
+
+    with pytest.raises(ValueError, match="Invalid array_format"):
+        RunDescriber(interdeps=some_interdeps[0], array_format='hdf5')
+
+
+def test_array_format_roundtrip(some_interdeps):
+
+    desc = RunDescriber(interdeps=some_interdeps[0], array_format='raw')
+
+    json_str = serial.to_json_for_storage(desc)
+    assert json.loads(json_str)['version'] == 4
+    new_desc = serial.from_json_to_current(json_str)
+    assert new_desc.array_format == 'raw'
+
+    v3_json = serial.to_json_as_version(desc, 3)
+    assert 'array_format' not in json.loads(v3_json)
+    assert serial.from_json_to_current(v3_json).array_format == 'npy'
+
+
 def test_keys_of_result_of_to_dict(some_interdeps):
 
     for idps in some_interdeps:
@@ -43,7 +63,8 @@ def test_keys_of_result_of_to_dict(some_interdeps):
         assert list(ser_desc.keys()) == ['version',
                                          'interdependencies',
                                          'interdependencies_',
-                                         'shapes']
+                                         'shapes',
+                                         'array_format']
 
 
 def test_to_and_from_dict_roundtrip(some_interdeps):
@@ -151,8 +172,9 @@ def test_dictization_of_current_version(some_interdeps):
         idps_old = new_to_old(desc.interdeps)
 
         ser = desc._to_dict()
-        assert ser['version'] == 3
+        assert ser['version'] == 4
         assert ser['interdependencies'] == idps_old._to_dict()
         assert ser['interdependencies_'] == idps._to_dict()
         assert ser['shapes'] is None
-        assert len(ser.keys()) == 4
+        assert ser['array_format'] == 'npy'
+        assert len(ser.keys()) == 5
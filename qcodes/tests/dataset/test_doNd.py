@@ -1,6 +1,8 @@
 """
 These are the basic black box tests for the doNd functions.
 """
+import threading
+
 import hypothesis.strategies as hst
 import matplotlib.pyplot as plt
 import numpy as np
@@ -9,6 +11,7 @@ from hypothesis import given, settings
 
 from qcodes import config
 from qcodes.dataset.data_set import DataSet
+from qcodes.instrument.buffered_sweep import BufferedSweep
 from qcodes.instrument.parameter import Parameter
 from qcodes.tests.dataset.conftest import empty_temp_db, experiment
 from qcodes.tests.instrument_mocks import (ArraySetPointParam,
@@ -595,3 +598,177 @@ def test_do2d_additional_setpoints_shape(
         'simple_parameter': (1, 1, num_points_p1, num_points_p2)
     }
     assert results[0].description.shapes == expected_shapes
+
+
+class _RecordingSweep(BufferedSweep):
+    """
+    Buffered sweep of a parameter that measures twice the value of the
+    swept parameter and records the calls it receives.
+    """
+
+    def __init__(self, hardware_timed=False):
+        self.hardware_timed = hardware_timed
+        self.calls = []
+        self._param_set = None
+        self._values = []
+
+    def supports(self, param_set, setpoints):
+        return True
+
+    def arm(self, param_set, setpoints, delay):
+        self.calls.append('arm')
+        self._param_set = param_set
+        if self.hardware_timed:
+            self._values = list(2 * setpoints)
+        else:
+            self._values = []
+
+    def trigger(self):
+        self.calls.append('trigger')
+        self._values.append(2 * self._param_set.cache.get())
+
+    def fetch(self):
+        self.calls.append('fetch')
+        return np.array(self._values)
+
+    def disarm(self):
+        self.calls.append('disarm')
+
+
+@pytest.mark.usefixtures("temp_exp", "temp_db")
+@pytest.mark.parametrize("hardware_timed", [False, True])
+def test_do1d_buffered_sweep(hardware_timed):
+    sweep = _RecordingSweep(hardware_timed)
+    meas_param = Parameter('buffered_parameter', get_cmd=lambda: 0,
+                           set_cmd=False)
+    meas_param.buffered_sweep = sweep
+    set_calls = []
+    _param_set = Parameter('recording_setter_parameter', get_cmd=None,
+                           set_cmd=set_calls.append)
+
+    data, _, _ = do1d(_param_set, 0, 1, 5, 0, meas_param, do_plot=False,
+                      use_buffered_sweep=True)
+
+    if hardware_timed:
+        assert sweep.calls == ['arm', 'fetch']
+        assert set_calls == []
+        assert _param_set.cache.get() == 1
+    else:
+        assert sweep.calls == ['arm'] + ['trigger'] * 5 + ['fetch']
+        assert set_calls == list(np.linspace(0, 1, 5))
+    loaded_data = data.get_parameter_data()['buffered_parameter']
+    np.testing.assert_array_equal(loaded_data[_param_set.name],
+                                  np.linspace(0, 1, 5))
+    np.testing.assert_array_equal(loaded_data['buffered_parameter'],
+                                  2 * np.linspace(0, 1, 5))
+
+
+@pytest.mark.usefixtures("temp_exp", "temp_db")
+@pytest.mark.parametrize("hardware_timed", [False, True])
+def test_do1d_buffered_sweep_only_on_request(_param_set, hardware_timed):
+    sweep = _RecordingSweep(hardware_timed)
+    meas_param = Parameter('buffered_parameter', get_cmd=lambda: 3,
+                           set_cmd=False)
+    meas_param.buffered_sweep = sweep
+
+    data, _, _ = do1d(_param_set, 0, 1, 5, 0, meas_param, do_plot=False)
+
+    assert sweep.calls == []
+    loaded_data = data.get_parameter_data()['buffered_parameter']
+    np.testing.assert_array_equal(loaded_data['buffered_parameter'],
+                                  np.full(5, 3))
+
+
+@pytest.mark.usefixtures("temp_exp", "temp_db")
+def test_do2d_buffered_sweep(_param_set, _param_set_2):
+    sweep = _RecordingSweep()
+    meas_param = Parameter('buffered_parameter', get_cmd=lambda: 0,
+                           set_cmd=False)
+    meas_param.buffered_sweep = sweep
+
+    data, _, _ = do2d(_param_set, 0, 1, 3, 0, _param_set_2, 0, 1, 4, 0,
+                      meas_param, do_plot=False, use_buffered_sweep=True)
+
+    assert sweep.calls == (['arm'] + ['trigger'] * 4 + ['fetch']) * 3
+    loaded_data = data.get_parameter_data()['buffered_parameter']
+    np.testing.assert_array_equal(loaded_data[_param_set.name].ravel(),
+                                  np.repeat(np.linspace(0, 1, 3), 4))
+    np.testing.assert_allclose(loaded_data['buffered_parameter'].ravel(),
+                               2 * np.tile(np.linspace(0, 1, 4), 3))
+
+
+@pytest.mark.usefixtures("temp_exp", "temp_db")
+def test_do1d_buffered_sweep_unsupported(_param_set, _param):
+    sweep = _RecordingSweep()
+    meas_param = Parameter('buffered_parameter', get_cmd=lambda: 3,
+                           set_cmd=False)
+    meas_param.buffered_sweep = sweep
+
+    # _param does not support a buffered sweep
+    with pytest.raises(ValueError, match="do not support a buffered sweep"):
+        do1d(_param_set, 0, 1, 5, 0, meas_param, _param, do_plot=False,
+             use_buffered_sweep=True)
+    assert sweep.calls == []
+
+    # a hardware timed sweep must be the only measured parameter
+    other_param = Parameter('other_parameter', get_cmd=lambda: 0,
+                            set_cmd=False)
+    other_param.buffered_sweep = _RecordingSweep()
+    meas_param.buffered_sweep = _RecordingSweep(hardware_timed=True)
+    with pytest.raises(ValueError, match="do not support a buffered sweep"):
+        do1d(_param_set, 0, 1, 5, 0, meas_param, other_param,
+             do_plot=False, use_buffered_sweep=True)
+
+
+@pytest.mark.usefixtures("temp_exp", "temp_db")
+def test_do1d_buffered_sweep_disarms_on_error(_param_set):
+    sweep = _RecordingSweep()
+    meas_param = Parameter('buffered_parameter', get_cmd=lambda: 0,
+                           set_cmd=False)
+    meas_param.buffered_sweep = sweep
+
+    def fail():
+        raise RuntimeError("trigger failed")
+    sweep.trigger = fail
+
+    with pytest.raises(RuntimeError, match="trigger failed"):
+        do1d(_param_set, 0, 1, 5, 0, meas_param, do_plot=False,
+             use_buffered_sweep=True)
+    assert sweep.calls == ['arm', 'disarm']
+
+
+@pytest.mark.usefixtures("temp_exp", "temp_db")
+def test_do1d_and_do2d_use_threads(_param_set, _param_set_2):
+    threads = []
+
+    def get_and_record_thread(value):
+        threads.append(threading.current_thread().name)
+        return value
+
+    meas_param_1 = Parameter('threaded_parameter_1',
+                             get_cmd=lambda: get_and_record_thread(1),
+                             set_cmd=False)
+    meas_param_2 = Parameter('threaded_parameter_2',
+                             get_cmd=lambda: get_and_record_thread(2),
+                             set_cmd=False)
+
+    data, _, _ = do1d(_param_set, 0, 1, 5, 0, meas_param_1, meas_param_2,
+                      do_plot=False, use_threads=True)
+    loaded_data = data.get_parameter_data()
+    np.testing.assert_array_equal(
+        loaded_data['threaded_parameter_1']['threaded_parameter_1'],
+        np.full(5, 1))
+    np.testing.assert_array_equal(
+        loaded_data['threaded_parameter_2']['threaded_parameter_2'],
+        np.full(5, 2))
+
+    data, _, _ = do2d(_param_set, 0, 1, 3, 0, _param_set_2, 0, 1, 4, 0,
+                      meas_param_1, meas_param_2, do_plot=False,
+                      use_threads=True)
+    loaded_data = data.get_parameter_data()
+    np.testing.assert_array_equal(
+        loaded_data['threaded_parameter_2']['threaded_parameter_2'].ravel(),
+        np.full(12, 2))
+
+    assert len(threads) == 2 * (5 + 12)
+    assert all(name.startswith('params_call') for name in threads)
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+import qcodes as qc
+from qcodes.dataset.data_set import load_by_id, new_data_set
+from qcodes.dataset.sqlite.db_upgrades.version import get_user_version
+from qcodes.dataset.sqlite.query_helpers import select_one_where
+from qcodes.dataset.sqlite.snapshot_store import (is_snapshot_ref,
+                                                  number_of_snapshot_bases,
+                                                  resolve_snapshot_raw,
+                                                  store_snapshot)
+from qcodes.utils.metadata import diff_param_values_by_id
+
+
+def make_snapshot(value, n_parameters=50):
+    parameters = {f'p{i}': {'value': i, 'unit': 'V', 'label': f'P {i}'}
+                  for i in range(n_parameters)}
+    parameters['p0']['value'] = value
+    return {'station': {'parameters': {},
+                        'instruments': {'dac': {'parameters': parameters}}}}
+
+
+def stored_snapshot(dataset):
+    return select_one_where(dataset.conn, "runs", "snapshot",
+                            "run_id", dataset.run_id)
+
+
+@pytest.fixture(name='deduplicate_snapshots')
+def _deduplicate_snapshots():
+    qc.config['core']['db_deduplicate_snapshots'] = True
+    try:
+        yield
+    finally:
+        qc.config['core']['db_deduplicate_snapshots'] = False
+
+
+@pytest.mark.usefixtures('experiment', 'deduplicate_snapshots')
+def test_identical_snapshots_are_stored_once():
+    snapshot_raw = json.dumps(make_snapshot(0))
+    datasets = [new_data_set(f'ds{i}') for i in range(3)]
+    for dataset in datasets:
+        dataset.add_snapshot(snapshot_raw)
+
+    conn = datasets[0].conn
+    assert number_of_snapshot_bases(conn) == 1
+    for dataset in datasets:
+        assert is_snapshot_ref(stored_snapshot(dataset))
+        assert dataset.snapshot_raw == snapshot_raw
+        assert load_by_id(dataset.run_id).snapshot == make_snapshot(0)
+
+
+@pytest.mark.usefixtures('experiment', 'deduplicate_snapshots')
+def test_similar_snapshots_are_stored_as_delta():
+    first = new_data_set('first')
+    first.add_snapshot(json.dumps(make_snapshot(0)))
+    second = new_data_set('second')
+    second.add_snapshot(json.dumps(make_snapshot(1)))
+
+    assert number_of_snapshot_bases(first.conn) == 1
+    assert len(stored_snapshot(second)) < len(first.snapshot_raw) / 10
+    assert second.snapshot == make_snapshot(1)
+
+    diff = diff_param_values_by_id(first.run_id, second.run_id)
+    assert diff.changed == {('dac', 'p0'): (0, 1)}
+
+
+@pytest.mark.usefixtures('experiment', 'deduplicate_snapshots')
+def test_different_snapshot_becomes_new_base():
+    first = new_data_set('first')
+    first.add_snapshot(json.dumps(make_snapshot(0)))
+    second = new_data_set('second')
+    second.add_snapshot(json.dumps({'station': {'components': {}}}))
+
+    assert number_of_snapshot_bases(first.conn) == 2
+    assert first.snapshot == make_snapshot(0)
+    assert second.snapshot == {'station': {'components': {}}}
+
+
+@pytest.mark.usefixtures('experiment', 'deduplicate_snapshots')
+def test_overwrite_deduplicated_snapshot():
+    dataset = new_data_set('ds')
+    dataset.add_snapshot(json.dumps(make_snapshot(0)))
+    dataset.add_snapshot(json.dumps(make_snapshot(1)))
+    assert dataset.snapshot == make_snapshot(0)
+
+    dataset.add_snapshot(json.dumps(make_snapshot(1)), overwrite=True)
+    assert dataset.snapshot == make_snapshot(1)
+
+
+def test_full_snapshots_are_not_resolved(dataset):
+    snapshot_raw = json.dumps(make_snapshot(0))
+    dataset.add_snapshot(snapshot_raw)
+
+    assert stored_snapshot(dataset) == snapshot_raw
+    assert not is_snapshot_ref(snapshot_raw)
+    assert resolve_snapshot_raw(dataset.conn, snapshot_raw) == snapshot_raw
+    assert resolve_snapshot_raw(dataset.conn, None) is None
+    assert number_of_snapshot_bases(dataset.conn) == 0
+
+
+def test_max_delta_ratio(dataset):
+    conn = dataset.conn
+    store_snapshot(conn, dataset.run_id, json.dumps(make_snapshot(0)))
+    store_snapshot(conn, dataset.run_id, json.dumps(make_snapshot(1)),
+                   max_delta_ratio=0)
+
+    assert number_of_snapshot_bases(conn) == 2
+    assert dataset.snapshot == make_snapshot(1)
+
+
+
+def test_store_does_not_change_schema_version(dataset):
+    conn = dataset.conn
+    version = get_user_version(conn)
+    assert number_of_snapshot_bases(conn) == 0
+
+    store_snapshot(conn, dataset.run_id, json.dumps(make_snapshot(0)))
+
+    assert number_of_snapshot_bases(conn) == 1
+    assert get_user_version(conn) == version
@@ -12,7 +12,7 @@ import unicodedata
 import numpy as np
 from unittest.mock import patch
 
-from qcodes.dataset.descriptions.param_spec import ParamSpec
+from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
 from qcodes.dataset.descriptions.rundescriber import RunDescriber
 from qcodes.dataset.descriptions.dependencies import InterDependencies_
 import qcodes.dataset.descriptions.versioning.serialization as serial
@@ -93,6 +93,31 @@ def test_insert_many_values_raises(experiment):
                                     values=[[1], [1, 3]])
 
 
+@pytest.mark.parametrize("use_executemany", [True, False])
+def test_insert_many_values_executemany(experiment, use_executemany):
+    conn = experiment.conn
+    mut_conn.atomic_transaction(
+        conn, 'CREATE TABLE "bulk" (id INTEGER PRIMARY KEY, x REAL, y REAL)')
+
+    values = [[float(i), float(i)**2] for i in range(2500)]
+    return_value = mut_help.insert_many_values(
+        conn, 'bulk', ['x', 'y'], values, use_executemany=use_executemany)
+    if use_executemany:
+        assert return_value == 2500
+
+    rows = mut_conn.atomic_transaction(
+        conn, 'SELECT x, y FROM "bulk" ORDER BY id').fetchall()
+    assert [list(row) for row in rows] == values
+
+    with pytest.raises(ValueError):
+        mut_help.insert_many_values(conn, 'bulk', ['x', 'y'],
+                                    values=[[1, 2], [1]],
+                                    use_executemany=use_executemany)
+
+    assert mut_help.insert_many_values(conn, 'bulk', ['x', 'y'], [[0., 0.]],
+                                       use_executemany=use_executemany) == 2501
+
+
 def test_get_metadata_raises(experiment):
     with pytest.raises(RuntimeError) as excinfo:
         mut_queries.get_metadata(experiment.conn, 'something', 'results')
@@ -277,6 +302,33 @@ def test_get_parameter_data_independent_parameters(
                      expected_shapes, expected_values)
 
 
+def test_get_parameter_data_expands_scalars_column_wise(experiment):
+    x = ParamSpecBase('x', 'numeric')
+    t = ParamSpecBase('t', 'text')
+    y = ParamSpecBase('y', 'array')
+    idps = InterDependencies_(dependencies={y: (x, t)})
+    ds = DataSet(specs=idps)
+    ds.mark_started()
+    ds.add_results([{'y': np.ones((2, 3)) * i, 'x': i, 't': 'a' * i}
+                    for i in range(1, 5)])
+    # a NULL setpoint must not break loading the numeric column
+    ds.add_results([{'y': np.zeros((2, 3)), 't': 'b'}])
+
+    data = mut_queries.get_parameter_data(ds.conn, ds.table_name)['y']
+
+    assert data['y'].shape == (5, 2, 3)
+    assert data['x'].shape == (5, 2, 3)
+    assert data['x'].dtype == np.float64
+    np.testing.assert_array_equal(data['x'][:4, 1, 2], [1, 2, 3, 4])
+    assert np.isnan(data['x'][4]).all()
+    assert data['t'].shape == (5, 2, 3)
+    assert (data['t'][2] == 'aaa').all()
+
+    data = mut_queries.get_parameter_data(ds.conn, ds.table_name,
+                                          start=2, end=3)['y']
+    np.testing.assert_array_equal(data['x'][:, 0, 0], [2, 3])
+
+
 def test_is_run_id_in_db(empty_temp_db):
     conn = mut_db.connect(get_DB_location())
     mut_queries.new_experiment(conn, 'test_exp', 'no_sample')
@@ -3,6 +3,7 @@ from typing import List, Tuple, Dict, Union
 from numbers import Number
 
 import pytest
+import numpy as np
 from numpy import ndarray
 import logging
 
@@ -211,3 +212,40 @@ def test_subscription_from_config_wrong_name(dataset):
         assert 'test_subscriber' not in qcodes.config.subscription.subscribers
         with pytest.raises(RuntimeError):
             sub_id_c = dataset.subscribe_from_config('test_subscriber')
+
+
+def test_in_process_subscription(dataset):
+    xparam = ParamSpecBase(name='x', paramtype='numeric')
+    yparam = ParamSpecBase(name='y', paramtype='array')
+    idps = InterDependencies_(dependencies={yparam: (xparam,)})
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+
+    def subscriber(columns, length, state):
+        state.append((length, columns))
+
+    sub_id = dataset.subscribe(subscriber, min_wait=0, min_count=1,
+                               state=[], in_process=True)
+    assert list(dataset.subscribers.keys()) == [sub_id]
+
+    # no trigger is needed for an in-process subscriber
+    get_triggers_sql = "SELECT * FROM sqlite_master WHERE TYPE = 'trigger';"
+    triggers = atomic_transaction(dataset.conn, get_triggers_sql).fetchall()
+    assert len(triggers) == 0
+
+    for x in range(3):
+        dataset.add_results([{'x': x, 'y': np.full(4, -x)},
+                             {'x': x + 0.5, 'y': np.full(4, x)}])
+    dataset.mark_completed()
+
+    state = dataset.subscribers[sub_id].state
+    assert state[-1][0] == 6
+    x_received = np.concatenate([columns['x'] for _, columns in state])
+    y_received = np.concatenate([columns['y'] for _, columns in state])
+    np.testing.assert_array_equal(x_received,
+                                  [0, 0.5, 1, 1.5, 2, 2.5])
+    assert y_received.shape == (6, 4)
+    np.testing.assert_array_equal(y_received[:, 0], [0, 0, -1, 1, -2, 2])
+
+    dataset.unsubscribe(sub_id)
+    assert len(dataset.subscribers) == 0
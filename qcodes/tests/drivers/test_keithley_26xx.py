@@ -6,6 +6,7 @@ from qcodes.instrument_drivers.tektronix.Keithley_2600_channels import \
     Keithley_2600
 
 import qcodes.instrument.sims as sims
+from qcodes.utils import validators as vals
 visalib = sims.__file__.replace('__init__.py', 'Keithley_2600.yaml@sim')
 
 
@@ -169,3 +170,57 @@ def test_setting_measure_current_range_disables_autorange(smus):
         some_valid_measurerange_i = smu.root_instrument._iranges[smu.model][2]
         smu.measurerange_i(some_valid_measurerange_i)
         assert smu.measure_autorange_i_enabled() is False
+
+
+def test_buffered_sweep_of_source_level(smus):
+    smu = smus[0]
+    sweep = smu.curr.buffered_sweep
+    assert sweep.hardware_timed
+    setpoints = np.linspace(0, 1, 11)
+    assert sweep.supports(smu.volt, setpoints)
+    assert not sweep.supports(smu.curr, setpoints)
+    assert not sweep.supports(smus[1].volt, setpoints)
+    assert not sweep.supports(smu.volt, setpoints[:1])
+    assert not sweep.supports(smu.volt, setpoints ** 2)
+    assert smu.volt.buffered_sweep.supports(smu.curr, setpoints)
+
+    smu.volt.vals = vals.Numbers(-0.5, 0.5)
+    assert not sweep.supports(smu.volt, setpoints)
+    smu.volt.vals = None
+    smu.volt.step = 0.1
+    assert not sweep.supports(smu.volt, setpoints)
+    smu.volt.step = None
+
+    calls = []
+
+    def fast_sweep(*args, **kwargs):
+        calls.append((args, kwargs))
+        return np.zeros(11)
+
+    smu._fast_sweep = fast_sweep
+    smu.volt.cache.set(0.5)
+    sweep.arm(smu.volt, setpoints, 0.01)
+    assert len(sweep.fetch()) == 11
+    assert calls == [((0.0, 1.0, 11, 'IV'), {'delay': 0.01})]
+    assert smu.volt.cache.get(get_if_invalid=False) == 0
+    with pytest.raises(RuntimeError, match="not been armed"):
+        sweep.fetch()
+
+
+def test_ramp_of_source_level_runs_in_lua(smus):
+    smu = smus[0]
+    writes = []
+    smu.write = writes.append
+    smu.volt.step = 0.1
+    smu.volt.inter_delay = 0.01
+    smu.volt.cache.set(0)
+
+    smu.volt(0.3)
+
+    assert len(writes) == 1
+    script = writes[0].split('\r\n')
+    assert script[0] == 'loadandrunscript'
+    assert script[1:6] == ['levels = {', '  0.100000000000,',
+                           '  0.200000000000,', '  0.300000000000,', '}']
+    assert '  delay(0.010000000000)' in script
+    assert smu.volt.cache.get(get_if_invalid=False) == 0.3
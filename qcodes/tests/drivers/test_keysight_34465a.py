@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 
 import qcodes.instrument.sims as sims
+from qcodes.instrument.parameter import Parameter
 from qcodes.instrument_drivers.Keysight.Keysight_34465A_submodules import \
     Keysight_34465A
 visalib = sims.__file__.replace('__init__.py', 'Keysight_34465A.yaml@sim')
@@ -144,3 +145,77 @@ def test_display_text(driver):
     driver.display.text(original_text)
     restored_text = driver.display.text()
     assert restored_text == original_text
+
+
+def test_bus_triggered_buffered_sweep(driver):
+    commands = []
+    n_points = 0
+    original_write = driver.write
+    original_ask = driver.ask
+
+    def write(cmd):
+        nonlocal n_points
+        if cmd in ('INIT', '*TRG', 'ABORt'):
+            commands.append(cmd)
+            n_points += cmd == '*TRG'
+        else:
+            original_write(cmd)
+
+    def ask(cmd):
+        if cmd == 'DATA:POINts?':
+            return str(n_points)
+        if cmd == 'FETCH?':
+            return ','.join(['1.5'] * n_points)
+        return original_ask(cmd)
+
+    driver.write = write
+    driver.ask = ask
+    driver.trigger.source('IMM')
+    driver.trigger.count(1)
+
+    sweep = driver.volt.buffered_sweep
+    assert not sweep.hardware_timed
+    assert sweep.supports(Parameter('x', set_cmd=None), np.arange(3))
+    assert not sweep.supports(driver.NPLC, np.arange(3))
+
+    sweep.arm(Parameter('x', set_cmd=None), np.arange(3), 0)
+    assert driver.trigger.source() == 'BUS'
+    assert driver.trigger.count() == 3
+    for _ in range(3):
+        sweep.trigger()
+    np.testing.assert_array_equal(sweep.fetch(), [1.5, 1.5, 1.5])
+    assert commands == ['INIT', '*TRG', '*TRG', '*TRG']
+    # the settings are restored after the sweep
+    assert driver.trigger.source() == 'IMM'
+    assert driver.trigger.count() == 1
+
+    sweep.arm(Parameter('x', set_cmd=None), np.arange(3), 0)
+    sweep.disarm()
+    assert commands[-2:] == ['INIT', 'ABORt']
+    assert driver.trigger.count() == 1
+
+
+def test_bus_triggered_buffered_sweep_times_out(driver):
+    original_write = driver.write
+    original_ask = driver.ask
+
+    def write(cmd):
+        if cmd not in ('INIT', '*TRG', 'ABORt'):
+            original_write(cmd)
+
+    def ask(cmd):
+        # the reading is never stored
+        if cmd == 'DATA:POINts?':
+            return '0'
+        return original_ask(cmd)
+
+    driver.write = write
+    driver.ask = ask
+
+    sweep = driver.volt.buffered_sweep
+    sweep.arm(Parameter('x', set_cmd=None), np.arange(3), 0)
+    with driver.timeout.set_to(0.05):
+        with pytest.raises(TimeoutError, match="was not stored within"):
+            sweep.trigger()
+    sweep.disarm()
+    assert driver.trigger.source() != 'BUS'
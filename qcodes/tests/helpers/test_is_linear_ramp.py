@@ -0,0 +1,26 @@
+import pytest
+
+from qcodes.utils.helpers import is_linear_ramp, permissive_range
+
+
+@pytest.mark.parametrize("start, stop, step", [
+    (0, 1, 0.1),
+    (0, 1.05, 0.1),
+    (1, -1, 0.3),
+    (0, 1, 2),
+])
+def test_stepped_ramps_are_linear(start, stop, step):
+    steps = permissive_range(start, stop, step)[1:] + [stop]
+    assert is_linear_ramp(start, steps)
+
+
+@pytest.mark.parametrize("start, steps", [
+    (0, []),
+    (0, [0, 0]),
+    (0, [1, 2, 4]),
+    (0, [1, 3, 4]),
+    (0, [1, 2, 1.5]),
+    (0, [0.1, 0.2, 0.4, 1]),
+])
+def test_other_steps_are_not_linear(start, steps):
+    assert not is_linear_ramp(start, steps)
@@ -3,7 +3,7 @@ import json
 
 import numpy as np
 import pytest
-from qcodes.utils.helpers import NumpyJSONEncoder
+from qcodes.utils.helpers import NumpyJSONEncoder, SnapshotJSONEncoder
 
 
 def test_python_types():
@@ -161,3 +161,39 @@ def test_numpy_encoder_examplemetadata():
         'myuserdict': {'a': 1}
     }
     assert metadata == data_dict
+
+
+@pytest.mark.parametrize('value', [
+    EXAMPLEMETADATA,
+    np.arange(12).reshape(3, 4),
+    np.linspace(0, 1, 5, dtype=np.float32),
+    np.array([1 + 2j, 3.5 - 1j], dtype=np.complex64),
+    np.arange(6).reshape(2, 3) * (1 + 1j),
+    np.array(2 + 3j),
+    [np.int32(3), np.float16(2.5), np.bool_(True)],
+])
+def test_snapshot_encoder_matches_numpy_encoder(value):
+    assert json.dumps(value, cls=SnapshotJSONEncoder) == \
+        json.dumps(value, cls=NumpyJSONEncoder)
+    assert json.dumps(value, cls=SnapshotJSONEncoder, indent=4) == \
+        json.dumps(value, cls=NumpyJSONEncoder, indent=4)
+
+
+def test_snapshot_encoder_summarizes_large_arrays():
+    snapshot = {'small': np.arange(3), 'large': np.arange(10.).reshape(2, 5),
+                'waveform': np.ones(20, dtype=complex)}
+    encoded = json.loads(json.dumps(snapshot, cls=SnapshotJSONEncoder,
+                                    max_array_size=5))
+
+    assert encoded['small'] == [0, 1, 2]
+    assert encoded['large'] == {'__dtype__': 'ndarray', 'dtype': 'float64',
+                                'shape': [2, 5], 'min': 0.0, 'max': 9.0,
+                                'mean': 4.5}
+    assert encoded['waveform'] == {'__dtype__': 'ndarray',
+                                   'dtype': 'complex128', 'shape': [20]}
+
+    elided = json.loads(json.dumps(snapshot, cls=SnapshotJSONEncoder,
+                                   max_array_size=5,
+                                   elide_large_arrays=True))
+    assert elided['large'] == {'__dtype__': 'ndarray', 'dtype': 'float64',
+                               'shape': [2, 5]}
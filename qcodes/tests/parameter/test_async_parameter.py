@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from qcodes.instrument.base import Instrument
+from qcodes.instrument.parameter import Parameter
+from qcodes.tests.instrument_mocks import DummyInstrument
+
+
+@pytest.fixture(name='dacs')
+def _make_dacs():
+    dacs = [DummyInstrument(f'async_dac{i}', gates=['ch1', 'ch2'])
+            for i in range(4)]
+    try:
+        yield dacs
+    finally:
+        for dac in dacs:
+            dac.close()
+
+
+def test_aset_delays_overlap(dacs):
+    params = [getattr(dac, ch) for dac in dacs for ch in ('ch1', 'ch2')]
+    for param in params:
+        param.post_delay = 0.2
+
+    async def set_all():
+        await asyncio.gather(*(param.aset(i)
+                               for i, param in enumerate(params)))
+
+    t_start = time.perf_counter()
+    asyncio.run(set_all())
+    duration = time.perf_counter() - t_start
+
+    # 8 post delays of 0.2 s each overlap
+    assert duration < 0.8
+    assert [param.cache.get(get_if_invalid=False) for param in params] == \
+        list(range(len(params)))
+
+
+def test_aget_runs_in_io_executor_of_root_instrument(dacs):
+    dac = dacs[0]
+    threads = []
+
+    def get_thread():
+        threads.append(threading.current_thread().name)
+        return 3
+
+    dac.add_parameter('probe', get_cmd=get_thread, get_parser=float)
+
+    assert asyncio.run(dac.probe.aget()) == 3.0
+    assert dac.probe.cache.raw_value == 3
+    assert threads == [f'{dac.name}_io_0']
+
+
+def test_aset_validates_and_annotates_errors(dacs):
+    dac = dacs[0]
+    dac.ch1.vals = dac.ch1.vals.__class__(-1, 1)
+
+    with pytest.raises(ValueError, match='setting async_dac0_ch1 to 5'):
+        asyncio.run(dac.ch1.aset(5))
+
+
+def test_aget_aset_without_instrument():
+    param = Parameter('param', set_cmd=None, get_cmd=None, inter_delay=0.1)
+
+    async def set_and_get():
+        await param.aset(1)
+        await param.aset(2)
+        return await param.aget()
+
+    t_start = time.perf_counter()
+    assert asyncio.run(set_and_get()) == 2
+    assert time.perf_counter() - t_start >= 0.1
+
+
+def test_aset_steps_like_set():
+    set_values = []
+    param = Parameter('param', set_cmd=set_values.append, get_cmd=None,
+                      step=1, inter_delay=0.01, initial_cache_value=0)
+
+    asyncio.run(param.aset(3))
+    async_values = list(set_values)
+    set_values.clear()
+    param.cache.set(0)
+    param.set(3)
+
+    assert async_values == set_values == [1, 2, 3]
+    assert param.cache.get() == 3
+
+
+def test_aask_awrite():
+    class EchoInstrument(Instrument):
+        def __init__(self, name):
+            super().__init__(name)
+            self.written = []
+
+        def write_raw(self, cmd):
+            self.written.append(cmd)
+
+        def ask_raw(self, cmd):
+            return cmd.lower()
+
+    instrument = EchoInstrument('echo')
+    try:
+        async def communicate():
+            await instrument.awrite('OUTP ON')
+            return await instrument.aask('VOLT?')
+
+        assert asyncio.run(communicate()) == 'volt?'
+        assert instrument.written == ['OUTP ON']
+    finally:
+        instrument.close()
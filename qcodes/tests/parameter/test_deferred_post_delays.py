@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+import pytest
+
+from qcodes.instrument.parameter import (Parameter, combine,
+                                         deferred_post_delays)
+
+
+def make_params(n, post_delay):
+    writes = []
+
+    def make_set(name):
+        def set_value(value):
+            writes.append((name, value, time.perf_counter()))
+        return set_value
+
+    params = [Parameter(f'p{i}', set_cmd=make_set(f'p{i}'),
+                        post_delay=post_delay)
+              for i in range(n)]
+    return params, writes
+
+
+def test_post_delays_overlap():
+    params, writes = make_params(5, 0.1)
+
+    t_start = time.perf_counter()
+    with deferred_post_delays() as group:
+        for i, param in enumerate(params):
+            param.set(i)
+        # all writes are issued before any delay is waited for
+        assert time.perf_counter() - t_start < 0.1
+        assert len(writes) == 5
+    t_stop = time.perf_counter()
+
+    assert 0.1 <= t_stop - t_start < 0.3
+    assert group.ready_at <= t_stop
+    assert [param.cache.get(get_if_invalid=False) for param in params] == \
+        list(range(5))
+
+
+def test_repeated_set_waits_for_own_delay():
+    params, writes = make_params(1, 0.1)
+    param = params[0]
+
+    with deferred_post_delays():
+        param.set(1)
+        param.set(2)
+
+    assert writes[1][2] - writes[0][2] >= 0.1
+
+
+def test_nested_groups_join_outer_group():
+    params, _ = make_params(2, 0.2)
+
+    t_start = time.perf_counter()
+    with deferred_post_delays() as outer:
+        params[0].set(1)
+        with deferred_post_delays() as inner:
+            params[1].set(1)
+        assert inner is outer
+        # the inner context does not wait
+        assert time.perf_counter() - t_start < 0.2
+    assert time.perf_counter() - t_start >= 0.2
+
+
+def test_delays_are_not_waited_for_after_exception():
+    params, _ = make_params(1, 0.1)
+
+    t_start = time.perf_counter()
+    with pytest.raises(RuntimeError):
+        with deferred_post_delays():
+            params[0].set(1)
+            raise RuntimeError
+    assert time.perf_counter() - t_start < 0.1
+
+
+def test_combined_parameter_set_overlaps_delays():
+    params, _ = make_params(4, 0.1)
+    sweep = combine(*params, name='combined').sweep(
+        np.array([[1, 2, 3, 4], [5, 6, 7, 8]]))
+
+    t_start = time.perf_counter()
+    sweep.set(1)
+    assert time.perf_counter() - t_start < 0.3
+    assert [param.cache.get(get_if_invalid=False) for param in params] == \
+        [5, 6, 7, 8]
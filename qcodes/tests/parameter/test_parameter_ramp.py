@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 
 import pytest
 import hypothesis.strategies as hst
@@ -177,3 +179,76 @@ def test_stepping_from_invalid_starting_point():
         a.set(10)
     # afterwards the value should still be the same
     assert a.get() == -10
+
+
+def test_ramp_cmd_receives_whole_ramp():
+    ramps = []
+    set_values = []
+
+    def ramp(raw_values, step_time):
+        ramps.append((raw_values, step_time))
+
+    p = Parameter('p', set_cmd=set_values.append, get_cmd=None,
+                  ramp_cmd=ramp, step=0.5, inter_delay=0.01, scale=2,
+                  initial_cache_value=0)
+
+    t_start = time.perf_counter()
+    p.set(2)
+    # the parameter waits until the ramp is finished
+    assert time.perf_counter() - t_start >= 4 * 0.01
+    assert ramps == [([1.0, 2.0, 3.0, 4], 0.01)]
+    assert set_values == []
+    assert p.get() == 2
+    assert p.cache.raw_value == 4
+
+    # a single step is set as usual
+    p.set(2.5)
+    assert len(ramps) == 1
+    assert set_values == [5]
+
+
+def test_ramp_cmd_validates_all_steps():
+    ramps = []
+    p = Parameter('p', set_cmd=None, get_cmd=lambda: -10,
+                  vals=Numbers(0, 100),
+                  ramp_cmd=lambda values, step_time: ramps.append(values),
+                  step=5)
+
+    # the first step to -5 is invalid
+    with pytest.raises(ValueError):
+        p.set(10)
+    assert ramps == []
+    assert p.get_latest() == -10
+
+
+def test_software_ramp_steps_are_timed_from_their_start():
+    inter_delay = 0.05
+    io_time = 0.04
+
+    def slow_set(value):
+        time.sleep(io_time)
+
+    p = Parameter('p', set_cmd=slow_set, get_cmd=None, step=1,
+                  inter_delay=inter_delay, initial_value=0)
+    time.sleep(inter_delay)
+
+    t_start = time.perf_counter()
+    p.set(10)
+    duration = time.perf_counter() - t_start
+
+    # the time of the writes is not added to the delay between the steps,
+    # which would take 9 * (inter_delay + io_time) + io_time
+    assert 9 * inter_delay <= duration < 9 * inter_delay + 2 * io_time
+
+
+def test_aset_passes_ramp_to_ramp_cmd():
+    ramps = []
+    set_values = []
+    p = Parameter('p', set_cmd=set_values.append, get_cmd=None,
+                  ramp_cmd=lambda values, step_time: ramps.append(values),
+                  step=0.5, inter_delay=0.01, initial_cache_value=0)
+
+    asyncio.run(p.aset(2))
+    assert ramps == [[0.5, 1.0, 1.5, 2]]
+    assert set_values == []
+    assert p.cache.get() == 2
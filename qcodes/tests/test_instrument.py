@@ -8,6 +8,7 @@ import contextlib
 import re
 
 from qcodes.instrument.base import Instrument, InstrumentBase, find_or_create_instrument
+from qcodes.instrument.channel import ChannelList, InstrumentChannel
 from qcodes.instrument.parameter import Parameter
 from qcodes.instrument.function import Function
 
@@ -290,3 +291,98 @@ def test_snapshot_and_meta_attrs():
 
     assert '__class__' in snapshot
     assert 'InstrumentBase' in snapshot['__class__']
+
+
+class _BatchingInstrument(Instrument):
+    """
+    Answers SCPI style queries, combined ones included, and records the
+    queries it receives
+    """
+    batch_query_separator = ';'
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.queries = []
+        self.answers = {'VOLT?': '1.5', 'CURR?': '0.25', 'OUTP?': 'ON',
+                        'CH1:VOLT?': '1', 'CH2:VOLT?': '2', 'CH3:VOLT?': '3'}
+        self.add_parameter('voltage', get_cmd='VOLT?', get_parser=float)
+        self.add_parameter('current', get_cmd='CURR?', get_parser=float,
+                           scale=0.5)
+        self.add_parameter('output', get_cmd='OUTP?',
+                           val_mapping={True: 'ON', False: 'OFF'})
+        self.add_parameter('counter', get_cmd=lambda: 42)
+        channels = ChannelList(self, 'channels', InstrumentChannel)
+        for i in range(1, 4):
+            channel = InstrumentChannel(self, f'ch{i}')
+            channel.add_parameter('voltage', get_cmd=f'CH{i}:VOLT?',
+                                  get_parser=int)
+            channels.append(channel)
+        self.add_submodule('channels', channels)
+
+    def ask_raw(self, cmd):
+        self.queries.append(cmd)
+        return ';'.join(self.answers[part] for part in cmd.split(';'))
+
+
+@pytest.fixture(name='batching_instrument')
+def _make_batching_instrument():
+    instrument = _BatchingInstrument('batching_instrument')
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_batched_get(batching_instrument):
+    instr = batching_instrument
+
+    with instr.batched_get() as batch:
+        batch.add(instr.voltage)
+        batch.add(instr.counter)
+        batch.add(instr.current)
+        batch.add(instr.output)
+        with pytest.raises(RuntimeError, match='not been executed'):
+            batch.values
+
+    assert batch.values == [1.5, 42, 0.5, True]
+    assert instr.queries == ['VOLT?;CURR?;OUTP?']
+    assert instr.voltage.cache.get(get_if_invalid=False) == 1.5
+    assert instr.current.cache.raw_value == '0.25'
+    assert instr.output.cache.get(get_if_invalid=False) is True
+
+    with pytest.raises(RuntimeError, match='already been executed'):
+        batch.add(instr.voltage)
+
+
+def test_batched_get_of_channels(batching_instrument):
+    instr = batching_instrument
+
+    assert instr.channels.voltage() == (1, 2, 3)
+    assert instr.queries == ['CH1:VOLT?;CH2:VOLT?;CH3:VOLT?']
+
+
+def test_batched_get_without_separator(batching_instrument):
+    instr = batching_instrument
+    instr.batch_query_separator = None
+
+    with instr.batched_get() as batch:
+        batch.add(instr.voltage)
+        batch.add(instr.current)
+    assert batch.values == [1.5, 0.5]
+    assert instr.queries == ['VOLT?', 'CURR?']
+    assert instr.channels.voltage() == (1, 2, 3)
+    assert instr.queries[2:] == ['CH1:VOLT?', 'CH2:VOLT?', 'CH3:VOLT?']
+
+
+def test_batched_get_errors(batching_instrument, testdummy):
+    instr = batching_instrument
+
+    with pytest.raises(ValueError, match='does not belong'):
+        with instr.batched_get() as batch:
+            batch.add(testdummy.dac1)
+
+    instr.answers['CURR?'] = '0.25;1'
+    with pytest.raises(ValueError, match='Expected 2 responses'):
+        with instr.batched_get() as batch:
+            batch.add(instr.voltage)
+            batch.add(instr.current)
@@ -0,0 +1,162 @@
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from qcodes.instrument.ip import IPConnectionPool, IPInstrument
+
+
+class _QueryHandler(socketserver.BaseRequestHandler):
+    """
+    Answers every line ending in ``\\n`` with ``<line>_reply;`` and records
+    the connections and commands.
+    """
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        buffer = b''
+        while True:
+            data = self.request.recv(1024)
+            if not data:
+                return
+            buffer += data
+            while b'\n' in buffer:
+                line, buffer = buffer.split(b'\n', 1)
+                command = line.decode()
+                server.commands.append(command)
+                if command == 'SPLIT?':
+                    # a response arriving in several packets
+                    for part in (b'sp', b'li', b't_re', b'ply;'):
+                        self.request.sendall(part)
+                elif command == 'TWO?':
+                    self.request.sendall(b'first;second;')
+                elif command == 'CLOSE':
+                    return
+                else:
+                    self.request.sendall(line + b'_reply;')
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _QueryHandler)
+        self.connections = 0
+        self.commands = []
+
+
+@pytest.fixture(name='server')
+def _make_server():
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(name='pool')
+def _make_pool():
+    pool = IPConnectionPool(keep_alive=10, reconnect_backoff=0.01)
+    try:
+        yield pool
+    finally:
+        pool.close_idle()
+
+
+def make_instrument(server, name, **kwargs):
+    kwargs.setdefault('read_terminator', ';')
+    return IPInstrument(name, address='127.0.0.1',
+                        port=server.server_address[1], timeout=2,
+                        write_confirmation=False, **kwargs)
+
+
+def test_read_terminator(server):
+    instrument = make_instrument(server, 'ip_read_terminator')
+    try:
+        assert instrument.ask('IDN?') == 'IDN?_reply'
+        # the response is assembled from several packets
+        assert instrument.ask('SPLIT?') == 'split_reply'
+        # data after the terminator is kept for the next read
+        assert instrument.ask('TWO?') == 'first'
+        assert instrument._recv() == 'second'
+    finally:
+        instrument.close()
+
+
+def test_non_persistent_instrument_reuses_pooled_connection(server, pool):
+    instrument = make_instrument(server, 'ip_pooled', persistent=False,
+                                 connection_pool=pool)
+    try:
+        for i in range(5):
+            assert instrument.ask(f'Q{i}?') == f'Q{i}?_reply'
+        assert server.connections == 1
+        assert instrument._socket is None
+    finally:
+        instrument.close()
+
+
+def test_non_persistent_instrument_without_pool_reconnects(server):
+    instrument = make_instrument(server, 'ip_unpooled', persistent=False)
+    try:
+        for i in range(3):
+            assert instrument.ask(f'Q{i}?') == f'Q{i}?_reply'
+        assert server.connections == 3
+    finally:
+        instrument.close()
+
+
+def test_pool_discards_connections_closed_by_instrument(server, pool):
+    instrument = make_instrument(server, 'ip_closed', persistent=False,
+                                 connection_pool=pool)
+    try:
+        instrument.write('CLOSE')
+        # give the server time to close the connection
+        time.sleep(0.2)
+        assert instrument.ask('IDN?') == 'IDN?_reply'
+        assert server.connections == 2
+    finally:
+        instrument.close()
+
+
+def test_persistent_instrument_reconnects_broken_connection(server, pool):
+    instrument = make_instrument(server, 'ip_reconnect',
+                                 connection_pool=pool)
+    try:
+        instrument._socket.shutdown(socket.SHUT_RDWR)
+        assert instrument.ask('IDN?') == 'IDN?_reply'
+        assert server.connections == 2
+    finally:
+        instrument.close()
+
+
+def test_connection_is_not_pooled_after_error(server, pool):
+    instrument = make_instrument(server, 'ip_error', persistent=False,
+                                 connection_pool=pool)
+    try:
+        with pytest.raises(ValueError):
+            with instrument._ensure_connection:
+                instrument._send('IDN?')
+                raise ValueError
+        # the pending response of the failed query does not leak
+        assert instrument.ask('Q?') == 'Q?_reply'
+        assert server.connections == 2
+    finally:
+        instrument.close()
+
+
+def test_pool_retries_with_backoff():
+    # find a port nobody listens on
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+
+    pool = IPConnectionPool(reconnect_attempts=2, reconnect_backoff=0.01)
+    with pytest.raises(ConnectionRefusedError):
+        pool.acquire('127.0.0.1', port, timeout=1)
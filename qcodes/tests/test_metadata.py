@@ -1,6 +1,7 @@
 import pytest
 
-from qcodes.utils.metadata import Metadatable, diff_param_values
+from qcodes.utils.metadata import (Metadatable, apply_snapshot_diff,
+                                   diff_param_values, diff_snapshots)
 
 
 class HasSnapshotBase(Metadatable):
@@ -151,3 +152,28 @@ def test_instrument_diff():
     assert diff.right_only == {
              "pi": 3.1
         }
+
+
+def test_snapshot_diff_roundtrip():
+    delta = diff_snapshots(DATASETLEFT, DATASETRIGHT)
+    assert apply_snapshot_diff(DATASETLEFT, delta) == DATASETRIGHT
+    assert diff_snapshots(DATASETLEFT, DATASETLEFT) == {}
+
+    instruments = delta["station"][1]["instruments"][1]
+    assert instruments["another"] == \
+        ["diff", {"parameters": ["diff", {"pi": ["set", {"value": 3.1}]}]}]
+
+
+def test_snapshot_diff_distinguishes_types():
+    delta = diff_snapshots({"a": 1, "b": [1], "c": 2}, {"a": 1.0, "b": [1]})
+    assert delta == {"a": ["set", 1.0], "c": ["del"]}
+
+
+def test_apply_snapshot_diff_does_not_modify_base():
+    base = {"a": {"b": 1, "c": {"d": 2}}}
+    result = apply_snapshot_diff(base, {"a": ["diff", {"b": ["set", 3]}]})
+    assert result == {"a": {"b": 3, "c": {"d": 2}}}
+    assert base == {"a": {"b": 1, "c": {"d": 2}}}
+
+    with pytest.raises(ValueError, match="Unknown snapshot delta operation"):
+        apply_snapshot_diff(base, {"a": ["move", "b"]})
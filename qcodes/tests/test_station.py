@@ -4,6 +4,7 @@ import tempfile
 import warnings
 from pathlib import Path
 import os
+import time
 from typing import Optional
 import json
 from io import StringIO
@@ -203,6 +204,74 @@ def test_snapshot():
     assert component_snapshot == snapshot['components']['component']
 
 
+def _add_slow_parameter(instrument, delay):
+    def get_slowly():
+        time.sleep(delay)
+        return delay
+
+    instrument.add_parameter('slow', get_cmd=get_slowly)
+
+
+def test_concurrent_snapshot():
+    instruments = [DummyInstrument(f'instrument{i}', gates=['one'])
+                   for i in range(3)]
+    for instrument in instruments:
+        _add_slow_parameter(instrument, 0.2)
+    parameter = Parameter('parameter', set_cmd=None, initial_value=1)
+    station = Station(*instruments, parameter, instruments[0].one,
+                      update_snapshot=False)
+
+    t_start = time.perf_counter()
+    snapshot = station.snapshot_base(update=True, concurrent=True)
+    duration = time.perf_counter() - t_start
+
+    # the instruments are queried at the same time
+    assert duration < 0.5
+    sequential_snapshot = station.snapshot_base(update=False,
+                                                concurrent=False)
+    assert list(snapshot['instruments']) == \
+        list(sequential_snapshot['instruments'])
+    assert list(snapshot['parameters']) == \
+        list(sequential_snapshot['parameters'])
+
+    timing = snapshot['snapshot_timing']
+    assert timing['timed_out'] == []
+    assert set(timing['components']) == set(station.components)
+    for instrument in instruments:
+        param_snaps = snapshot['instruments'][instrument.name]['parameters']
+        assert param_snaps['slow']['value'] == 0.2
+        assert param_snaps['slow']['snapshot_duration'] >= 0.2
+        assert 'snapshot_duration' in param_snaps['one']
+        assert 'snapshot_duration' not in \
+            sequential_snapshot['instruments'][instrument.name][
+                'parameters']['slow']
+
+
+def test_concurrent_snapshot_timeout():
+    fast = DummyInstrument('fast', gates=['one'])
+    slow = DummyInstrument('slow', gates=['one'])
+    _add_slow_parameter(slow, 0.5)
+    gets = []
+    slow.add_parameter('counted', get_cmd=lambda: gets.append(1))
+    station = Station(fast, slow, slow.counted, update_snapshot=False)
+
+    qcodes.config['station']['snapshot_concurrently'] = True
+    qcodes.config['station']['snapshot_timeout'] = 0.1
+    snapshot = station.snapshot(update=True)
+
+    timing = snapshot['snapshot_timing']
+    # the snapshot running at the timeout is waited for, the components
+    # not started by then are not queried
+    assert timing['duration'] >= 0.5
+    assert timing['timed_out'] == ['counted']
+    assert set(timing['components']) == {'fast', 'slow'}
+    assert snapshot['instruments']['slow']['parameters']['slow'][
+        'value'] == 0.5
+    assert len(gets) == 1
+    assert 'snapshot_duration' in \
+        snapshot['instruments']['fast']['parameters']['one']
+
+
 def test_station_after_instrument_is_closed():
     """
     Test that station is aware of the fact that its components could be
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from qcodes.instrument.base import InstrumentBase
+from qcodes.instrument.parameter import Parameter
+from qcodes.utils.threading import ThreadPoolParamsCaller, thread_map
+
+
+def _make_param(name, calls, value=0, delay=0.0, instrument=None):
+    def get_value():
+        calls.append((name, threading.current_thread().name))
+        time.sleep(delay)
+        return value
+    return Parameter(name, get_cmd=get_value, set_cmd=False,
+                     instrument=instrument)
+
+
+def test_thread_map():
+    assert thread_map([lambda x: x + 1, lambda: 3], args=[(1,), ()]) == [2, 3]
+
+
+def test_params_caller_gets_independent_instruments_concurrently():
+    calls = []
+    params = [_make_param(f'param{i}', calls, value=i, delay=0.2)
+              for i in range(3)]
+
+    with ThreadPoolParamsCaller(*params) as caller:
+        t_start = time.perf_counter()
+        results = caller()
+        duration = time.perf_counter() - t_start
+
+    assert results == [(param, i) for i, param in enumerate(params)]
+    assert duration < 0.5
+    assert len({thread for _, thread in calls}) == 3
+
+
+def test_params_caller_keeps_order_per_instrument():
+    calls = []
+    instr = InstrumentBase('params_caller_instr')
+    param_a = _make_param('a', calls, delay=0.05, instrument=instr)
+    param_b = _make_param('b', calls, instrument=instr)
+    param_c = _make_param('c', calls, delay=0.1)
+
+    with ThreadPoolParamsCaller(param_b, param_c, param_a) as caller:
+        results = caller()
+
+    assert [param for param, _ in results] == [param_b, param_c, param_a]
+    instr_calls = [(name, thread) for name, thread in calls
+                   if name in ('a', 'b')]
+    assert [name for name, _ in instr_calls] == ['b', 'a']
+    assert instr_calls[0][1] == instr_calls[1][1]
+
+
+def test_params_caller_calls_functions_in_between():
+    calls = []
+    param_1 = _make_param('param_1', calls, delay=0.05)
+    param_2 = _make_param('param_2', calls)
+
+    def action():
+        calls.append(('action', threading.current_thread().name))
+
+    with ThreadPoolParamsCaller(param_1, action, param_2) as caller:
+        results = caller()
+
+    assert [param for param, _ in results] == [param_1, param_2]
+    assert [name for name, _ in calls] == ['param_1', 'action', 'param_2']
+    assert calls[1][1] == threading.current_thread().name
+
+
+def test_params_caller_raises_errors_of_the_threads():
+    def fail():
+        raise RuntimeError('get failed')
+
+    failing = Parameter('failing', get_cmd=fail, set_cmd=False)
+    calls = []
+    other = _make_param('other', calls)
+
+    with ThreadPoolParamsCaller(failing, other) as caller:
+        with pytest.raises(RuntimeError, match='get failed'):
+            caller()
+    assert [name for name, _ in calls] == ['other']
@@ -1,5 +1,6 @@
 import warnings
 
+import numpy as np
 import pytest
 import pyvisa as visa
 
@@ -192,3 +193,94 @@ def test_visa_instr_metadata(request):
     mv = MockVisa('Joe', 'none_adress', metadata=metadatadict)
     request.addfinalizer(mv.close)
     assert mv.metadata == metadatadict
+
+
+class MockBlockVisaHandle(MockVisaHandle):
+    """
+    Returns the bytes of its ``response`` attribute to reads.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.response = b''
+        self.written = []
+
+    def write(self, cmd):
+        self.written.append(cmd)
+
+    def read_bytes(self, count, chunk_size=None, break_on_termchar=False):
+        data, self.response = self.response[:count], self.response[count:]
+        return data
+
+    def read_raw(self, size=None):
+        data, self.response = self.response, b''
+        return data
+
+
+class MockBlockVisa(VisaInstrument):
+    def set_address(self, address):
+        self.visa_handle = MockBlockVisaHandle()
+        self.visabackend = self.visalib
+
+
+@pytest.fixture(name='block_visa')
+def _make_block_visa():
+    instrument = MockBlockVisa('block_visa', 'none_address',
+                               terminator='\n')
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def make_block(data, termination=b'\n'):
+    length = str(len(data)).encode()
+    return b'#' + str(len(length)).encode() + length + data + termination
+
+
+@pytest.mark.parametrize('datatype,is_big_endian',
+                         [('f', False), ('f', True), ('h', False),
+                          ('u2', True), (np.float64, False)])
+def test_ask_binary_block(block_visa, datatype, is_big_endian):
+    dtype = np.dtype(datatype).newbyteorder('>' if is_big_endian else '<')
+    # the data contains the read termination
+    values = np.array([1, 10, 2, 3], dtype=dtype)
+    handle = block_visa.visa_handle
+    handle.response = make_block(values.tobytes())
+
+    data = block_visa.ask_binary_block('CURV?', datatype=datatype,
+                                       is_big_endian=is_big_endian)
+
+    assert handle.written == ['CURV?']
+    assert handle.response == b''
+    assert data.dtype.isnative
+    np.testing.assert_array_equal(data, values)
+
+
+def test_ask_binary_block_into_buffer(block_visa):
+    handle = block_visa.visa_handle
+    buffer = np.zeros(10)
+
+    handle.response = make_block(np.arange(5, dtype='<i2').tobytes())
+    data = block_visa.ask_binary_block('CURV?', datatype='h', out=buffer)
+    assert data.base is buffer
+    np.testing.assert_array_equal(data, np.arange(5))
+
+    handle.response = make_block(np.arange(20, dtype='<i2').tobytes())
+    with pytest.raises(ValueError, match='Cannot read 20 values'):
+        block_visa.ask_binary_block('CURV?', datatype='h', out=buffer)
+
+
+def test_ask_binary_block_header_and_termination(block_visa):
+    handle = block_visa.visa_handle
+    values = np.arange(3, dtype='<f4')
+
+    # a header before the block and no termination after it
+    handle.response = b':CURV ' + make_block(values.tobytes(), b'')
+    data = block_visa.ask_binary_block('CURV?', expect_termination=False)
+    np.testing.assert_array_equal(data, values)
+
+    # a block of indefinite length
+    handle.response = b'#0' + values.tobytes() + b'\n'
+    data = block_visa.ask_binary_block('CURV?')
+    np.testing.assert_array_equal(data, values)
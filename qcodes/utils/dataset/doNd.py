@@ -11,9 +11,12 @@ from qcodes.dataset.data_set import DataSet
 from qcodes.dataset.descriptions.detect_shapes import \
     detect_shape_of_measurement
 from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
-from qcodes.dataset.measurements import Measurement, res_type
+from qcodes.dataset.measurements import DataSaver, Measurement, res_type
 from qcodes.dataset.plotting import plot_dataset
 from qcodes.instrument.base import _BaseParameter
+from qcodes.instrument.buffered_sweep import BufferedSweep, get_buffered_sweep
+from qcodes.instrument.parameter import deferred_post_delays
+from qcodes.utils.threading import ThreadPoolParamsCaller
 
 ActionsT = Sequence[Callable[[], None]]
 
@@ -40,6 +43,93 @@ def _process_params_meas(param_meas: Sequence[ParamMeasT]) -> OutType:
     return output
 
 
+@contextmanager
+def _param_meas_caller(
+        param_meas: Sequence[ParamMeasT],
+        use_threads: bool
+) -> Iterator[Callable[[], OutType]]:
+    """
+    Yield a function that gets the parameters and calls the functions of
+    ``param_meas``, concurrently for independent instruments if
+    ``use_threads`` is True, see
+    :class:`qcodes.utils.threading.ThreadPoolParamsCaller`.
+    """
+    if use_threads:
+        with ThreadPoolParamsCaller(*param_meas) as caller:
+            yield caller
+    else:
+        yield lambda: _process_params_meas(param_meas)
+
+
+def _get_buffered_sweeps(
+        param_set: _BaseParameter,
+        setpoints: np.ndarray,
+        param_meas: Sequence[ParamMeasT],
+        use_buffered_sweep: bool
+        ) -> Optional[List[Tuple[_BaseParameter, BufferedSweep]]]:
+    """
+    Return the buffered sweeps of the measured parameters if
+    ``use_buffered_sweep`` is True, else None. Raise a ValueError if a line
+    of ``param_set`` through ``setpoints`` can not be measured as one
+    buffered sweep. That requires that all of ``param_meas`` are parameters
+    supporting a buffered sweep of ``param_set``, and that a hardware timed
+    sweep is the only measured parameter.
+    """
+    if not use_buffered_sweep:
+        return None
+    sweeps: List[Tuple[_BaseParameter, BufferedSweep]] = []
+    for parameter in param_meas:
+        sweep = None
+        if isinstance(parameter, _BaseParameter):
+            sweep = get_buffered_sweep(parameter, param_set, setpoints)
+        if sweep is None:
+            sweeps = []
+            break
+        sweeps.append((parameter, sweep))
+    if len(sweeps) > 1 and any(sweep.hardware_timed for _, sweep in sweeps):
+        sweeps = []
+
+    if not sweeps:
+        raise ValueError(f"The measured parameters do not support a "
+                         f"buffered sweep of {param_set.full_name}.")
+    LOG.debug(f"Measuring sweep of {param_set.full_name} with buffered "
+              f"sweeps of {[p.full_name for p, _ in sweeps]}")
+    return sweeps
+
+
+def _measure_buffered_line(
+        datasaver: DataSaver,
+        param_set: _BaseParameter,
+        setpoints: np.ndarray,
+        sweeps: Sequence[Tuple[_BaseParameter, BufferedSweep]],
+        fixed_results: OutType,
+        skip_first_set: bool = False) -> None:
+    """
+    Measure a line of ``param_set`` through ``setpoints`` with buffered
+    sweeps and add it to ``datasaver`` as one block, together with the
+    ``fixed_results`` that are the same for all points of the line.
+    """
+    hardware_timed = any(sweep.hardware_timed for _, sweep in sweeps)
+    for _, sweep in sweeps:
+        sweep.arm(param_set, setpoints, param_set.post_delay)
+    try:
+        if not hardware_timed:
+            for i, set_point in enumerate(setpoints):
+                if i > 0 or not skip_first_set:
+                    param_set.set(set_point)
+                for _, sweep in sweeps:
+                    sweep.trigger()
+        results = [(parameter, sweep.fetch()) for parameter, sweep in sweeps]
+    except BaseException:
+        for _, sweep in sweeps:
+            sweep.disarm()
+        raise
+    if hardware_timed:
+        param_set.cache.set(setpoints[-1])
+    datasaver.add_results_block((param_set, setpoints), *results,
+                                *fixed_results)
+
+
 def _register_parameters(
         meas: Measurement,
         param_meas: Sequence[ParamMeasT],
@@ -90,7 +180,8 @@ def _catch_keyboard_interrupts() -> Iterator[Callable[[], bool]]:
 def do0d(
         *param_meas: ParamMeasT,
         write_period: Optional[float] = None,
-        do_plot: bool = True
+        do_plot: bool = True,
+        use_threads: bool = False
         ) -> AxesTupleListWithDataSet:
     """
     Perform a measurement of a single parameter. This is probably most
@@ -105,6 +196,9 @@ def do0d(
             database.
         do_plot: should png and pdf versions of the images be saved after the
             run.
+        use_threads: If True, the parameters of different root instruments
+            are measured concurrently in separate threads at each step,
+            see :class:`qcodes.utils.threading.ThreadPoolParamsCaller`.
 
     Returns:
         The QCoDeS dataset.
@@ -127,8 +221,9 @@ def do0d(
     _register_parameters(meas, param_meas, shapes=shapes)
     _set_write_period(meas, write_period)
 
-    with meas.run() as datasaver:
-        datasaver.add_result(*_process_params_meas(param_meas))
+    with _param_meas_caller(param_meas, use_threads) as call_param_meas, \
+            meas.run() as datasaver:
+        datasaver.add_result(*call_param_meas())
         dataset = datasaver.dataset
 
     return _handle_plotting(dataset, do_plot)
@@ -143,12 +238,21 @@ def do1d(
         write_period: Optional[float] = None,
         do_plot: bool = True,
         additional_setpoints: Sequence[ParamMeasT] = tuple(),
+        use_buffered_sweep: bool = False,
+        use_threads: bool = False,
         ) -> AxesTupleListWithDataSet:
     """
     Perform a 1D scan of ``param_set`` from ``start`` to ``stop`` in
     ``num_points`` measuring param_meas at each step. In case param_meas is
     an ArrayParameter this is effectively a 2d scan.
 
+    With ``use_buffered_sweep``, the measured parameters are acquired in a
+    buffered sweep of ``param_set``
+    (see :class:`qcodes.instrument.buffered_sweep.BufferedSweep`): their
+    instruments are armed once, the sweep is driven and the whole line is
+    fetched and saved as one block instead of getting the parameters at
+    each step.
+
     Args:
         param_set: The QCoDeS parameter to sweep over
         start: Starting point of sweep
@@ -169,6 +273,13 @@ def do1d(
             the measurement but not scanned.
         do_plot: should png and pdf versions of the images be saved after the
             run.
+        use_buffered_sweep: Whether to measure the sweep as a buffered sweep.
+            A ValueError is raised if the measured parameters do not
+            support it. Since the line is only saved once it is fetched,
+            the points of a line interrupted with Ctrl-C are not saved.
+        use_threads: If True, the parameters of different root instruments
+            are measured concurrently in separate threads at each step,
+            see :class:`qcodes.utils.threading.ThreadPoolParamsCaller`.
 
     Returns:
         The QCoDeS dataset.
@@ -199,16 +310,26 @@ def do1d(
     _register_actions(meas, enter_actions, exit_actions)
     param_set.post_delay = delay
 
+    setpoints = np.linspace(start, stop, num_points)
+    buffered_sweeps = _get_buffered_sweeps(param_set, setpoints, param_meas,
+                                           use_buffered_sweep)
+
     # do1D enforces a simple relationship between measured parameters
     # and set parameters. For anything more complicated this should be
     # reimplemented from scratch
-    with _catch_keyboard_interrupts() as interrupted, meas.run() as datasaver:
+    with _catch_keyboard_interrupts() as interrupted, \
+            _param_meas_caller(param_meas, use_threads) as call_param_meas, \
+            meas.run() as datasaver:
         additional_setpoints_data = _process_params_meas(additional_setpoints)
-        for set_point in np.linspace(start, stop, num_points):
-            param_set.set(set_point)
-            datasaver.add_result((param_set, set_point),
-                                 *_process_params_meas(param_meas),
-                                 *additional_setpoints_data)
+        if buffered_sweeps is not None:
+            _measure_buffered_line(datasaver, param_set, setpoints,
+                                   buffered_sweeps, additional_setpoints_data)
+        else:
+            for set_point in setpoints:
+                param_set.set(set_point)
+                datasaver.add_result((param_set, set_point),
+                                     *call_param_meas(),
+                                     *additional_setpoints_data)
         dataset = datasaver.dataset
     return _handle_plotting(dataset, do_plot, interrupted())
 
@@ -228,12 +349,19 @@ def do2d(
         flush_columns: bool = False,
         do_plot: bool = True,
         additional_setpoints: Sequence[ParamMeasT] = tuple(),
+        use_buffered_sweep: bool = False,
+        use_threads: bool = False,
         ) -> AxesTupleListWithDataSet:
     """
     Perform a 1D scan of ``param_set1`` from ``start1`` to ``stop1`` in
     ``num_points1`` and ``param_set2`` from ``start2`` to ``stop2`` in
     ``num_points2`` measuring param_meas at each step.
 
+    With ``use_buffered_sweep``, each run of the inner loop is measured as
+    one buffered sweep of ``param_set2``
+    (see :class:`qcodes.instrument.buffered_sweep.BufferedSweep`) and saved
+    as one block.
+
     Args:
         param_set1: The QCoDeS parameter to sweep over in the outer loop
         start1: Starting point of sweep in outer loop
@@ -265,6 +393,13 @@ def do2d(
             the measurement but not scanned.
         do_plot: should png and pdf versions of the images be saved after the
             run.
+        use_buffered_sweep: Whether to measure the inner loop as a buffered
+            sweep. A ValueError is raised if the measured parameters do not
+            support it. Since each line is only saved once it is fetched,
+            the points of a line interrupted with Ctrl-C are not saved.
+        use_threads: If True, the parameters of different root instruments
+            are measured concurrently in separate threads at each step,
+            see :class:`qcodes.utils.threading.ThreadPoolParamsCaller`.
 
     Returns:
         The QCoDeS dataset.
@@ -301,26 +436,40 @@ def do2d(
     param_set1.post_delay = delay1
     param_set2.post_delay = delay2
 
-    with _catch_keyboard_interrupts() as interrupted, meas.run() as datasaver:
+    setpoints2 = np.linspace(start2, stop2, num_points2)
+    buffered_sweeps = _get_buffered_sweeps(param_set2, setpoints2, param_meas,
+                                           use_buffered_sweep)
+
+    with _catch_keyboard_interrupts() as interrupted, \
+            _param_meas_caller(param_meas, use_threads) as call_param_meas, \
+            meas.run() as datasaver:
         additional_setpoints_data = _process_params_meas(additional_setpoints)
         for set_point1 in np.linspace(start1, stop1, num_points1):
-            if set_before_sweep:
-                param_set2.set(start2)
+            # let the outer and the inner parameter settle at the same time
+            with deferred_post_delays():
+                if set_before_sweep:
+                    param_set2.set(start2)
 
-            param_set1.set(set_point1)
+                param_set1.set(set_point1)
             for action in before_inner_actions:
                 action()
-            for set_point2 in np.linspace(start2, stop2, num_points2):
-                # skip first inner set point if `set_before_sweep`
-                if set_point2 == start2 and set_before_sweep:
-                    pass
-                else:
-                    param_set2.set(set_point2)
-
-                datasaver.add_result((param_set1, set_point1),
-                                     (param_set2, set_point2),
-                                     *_process_params_meas(param_meas),
-                                     *additional_setpoints_data)
+            if buffered_sweeps is not None:
+                _measure_buffered_line(
+                    datasaver, param_set2, setpoints2, buffered_sweeps,
+                    [(param_set1, set_point1), *additional_setpoints_data],
+                    skip_first_set=bool(set_before_sweep))
+            else:
+                for set_point2 in setpoints2:
+                    # skip first inner set point if `set_before_sweep`
+                    if set_point2 == start2 and set_before_sweep:
+                        pass
+                    else:
+                        param_set2.set(set_point2)
+
+                    datasaver.add_result((param_set1, set_point1),
+                                         (param_set2, set_point2),
+                                         *call_param_meas(),
+                                         *additional_setpoints_data)
             for action in after_inner_actions:
                 action()
             if flush_columns:
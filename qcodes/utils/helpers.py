@@ -98,6 +98,81 @@ class NumpyJSONEncoder(json.JSONEncoder):
             return s
 
 
+class SnapshotJSONEncoder(NumpyJSONEncoder):
+    """
+    A faster drop-in replacement of :class:`NumpyJSONEncoder` for snapshots,
+    which may contain large array-valued parameters (e.g. AWG waveforms or
+    VNA traces). It produces the same JSON as :class:`NumpyJSONEncoder`,
+    except that arrays larger than ``max_array_size`` can be replaced by a
+    summary.
+
+    The conversions are dispatched on the exact type of the object and the
+    elements of numpy arrays are converted in bulk, in particular complex
+    arrays are not converted element by element.
+
+    Use it like ``json.dumps(snapshot, cls=SnapshotJSONEncoder,
+    max_array_size=1000)``.
+
+    Args:
+        max_array_size: Numpy arrays with more elements than this are
+            serialized as a dictionary with the fields ``__dtype__``
+            (``ndarray``), ``dtype``, ``shape`` and, for real-valued numeric
+            arrays, ``min``, ``max`` and ``mean`` instead of the values. If
+            None, all arrays are serialized in full.
+        elide_large_arrays: If True, the summary of large arrays only
+            contains their ``dtype`` and ``shape``.
+        **kwargs: Passed on to :class:`json.JSONEncoder`.
+    """
+
+    def __init__(self, *args: Any, max_array_size: Optional[int] = None,
+                 elide_large_arrays: bool = False, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.max_array_size = max_array_size
+        self.elide_large_arrays = elide_large_arrays
+
+    def default(self, obj: Any) -> Any:
+        obj_type = type(obj)
+        if obj_type is np.ndarray:
+            return self._encode_array(obj)
+        if issubclass(obj_type, np.generic) \
+                and not issubclass(obj_type, np.complexfloating):
+            return obj.item()
+        return super().default(obj)
+
+    def _encode_array(self, array: np.ndarray) -> Any:
+        if self.max_array_size is not None \
+                and array.size > self.max_array_size:
+            return self._summarize_array(array)
+        if array.dtype.kind == 'c':
+            return _complex_array_to_list(array)
+        return array.tolist()
+
+    def _summarize_array(self, array: np.ndarray) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {
+            '__dtype__': 'ndarray',
+            'dtype': str(array.dtype),
+            'shape': list(array.shape)
+        }
+        if not self.elide_large_arrays and array.dtype.kind in 'biuf':
+            summary['min'] = array.min().item()
+            summary['max'] = array.max().item()
+            summary['mean'] = array.mean().item()
+        return summary
+
+
+def _complex_array_to_list(array: np.ndarray) -> Any:
+    """
+    Convert a complex array to nested lists of the dictionaries that
+    :class:`NumpyJSONEncoder` uses for complex numbers.
+    """
+    if array.ndim == 0:
+        return NumpyJSONEncoder().default(array.item())
+    if array.ndim > 1:
+        return [_complex_array_to_list(sub_array) for sub_array in array]
+    return [{'__dtype__': 'complex', 're': re, 'im': im}
+            for re, im in zip(array.real.tolist(), array.imag.tolist())]
+
+
 def tprint(string: str, dt: int = 1, tag: str = 'default') -> None:
     """Print progress of a loop every ``dt`` seconds."""
     ptime = _tprint_times.get(tag, 0)
@@ -261,6 +336,25 @@ def permissive_range(start: float, stop: float, step: SupportsAbs[float]
     return [start + i * signed_step for i in range(step_count)]
 
 
+def is_linear_ramp(start: float, steps: Sequence[float]) -> bool:
+    """
+    Are ``steps`` the steps of a linear ramp from ``start``? That is, are
+    they equally spaced from ``start`` on, except for the last step which
+    may be shorter, as the ramps of a stepped parameter are.
+
+    Args:
+        start: The value the ramp starts from.
+        steps: The values of the steps of the ramp, excluding ``start``.
+    """
+    diffs = np.diff([start, *steps])
+    if len(diffs) == 0 or diffs[0] == 0:
+        return False
+    if not np.allclose(diffs[:-1], diffs[0], rtol=1e-6, atol=0):
+        return False
+    last_fraction = diffs[-1] / diffs[0]
+    return 0 < last_fraction <= 1 + 1e-6
+
+
 # This is very much related to the permissive_range but more
 # strict on the input, start and endpoints are always included,
 # and a sweep is only created if the step matches an integer
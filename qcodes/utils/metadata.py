@@ -123,6 +123,59 @@ def diff_param_values(left_snapshot: Snapshot,
     )
 
 
+# A delta between two snapshots maps the keys of a dictionary that have
+# changed onto one of the operations ["set", new_value], ["del"] or
+# ["diff", delta] for nested dictionaries that have changed
+SnapshotDelta = Dict[str, Any]
+
+
+def diff_snapshots(base: Snapshot, new: Snapshot) -> SnapshotDelta:
+    """
+    Given two snapshots, returns the delta that turns the ``base`` snapshot
+    into the ``new`` one when passed to :func:`apply_snapshot_diff`. Nested
+    dictionaries are compared recursively, all other values (including
+    lists) are replaced as a whole if they differ.
+    """
+    delta: SnapshotDelta = {}
+    for key, value in new.items():
+        if key not in base:
+            delta[key] = ["set", value]
+            continue
+        base_value = base[key]
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            sub_delta = diff_snapshots(base_value, value)
+            if sub_delta:
+                delta[key] = ["diff", sub_delta]
+        elif type(value) is not type(base_value) or value != base_value:
+            delta[key] = ["set", value]
+    for key in base:
+        if key not in new:
+            delta[key] = ["del"]
+    return delta
+
+
+def apply_snapshot_diff(base: Snapshot, delta: SnapshotDelta) -> Snapshot:
+    """
+    Apply a delta created by :func:`diff_snapshots` to a snapshot and return
+    the resulting snapshot. The ``base`` snapshot is not modified, but the
+    returned snapshot shares the nested dictionaries that have not changed
+    with it.
+    """
+    result = dict(base)
+    for key, operation in delta.items():
+        kind = operation[0]
+        if kind == "set":
+            result[key] = operation[1]
+        elif kind == "del":
+            del result[key]
+        elif kind == "diff":
+            result[key] = apply_snapshot_diff(base[key], operation[1])
+        else:
+            raise ValueError(f"Unknown snapshot delta operation {kind!r} "
+                             f"for key {key!r}")
+    return result
+
+
 def diff_param_values_by_id(left_id: RunId, right_id: RunId) -> ParameterDiff:
     """
     Given the IDs of two datasets, returns the differences between
@@ -4,6 +4,15 @@
 # That way the things we call need not be rewritten explicitly async.
 
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional,
+                    Sequence, Tuple, Type, Union, cast)
+
+if TYPE_CHECKING:
+    from qcodes.instrument.parameter import _BaseParameter
+
+ParamMeasT = Union['_BaseParameter', Callable[[], None]]
 
 
 class RespondingThread(threading.Thread):
@@ -72,3 +81,113 @@ def thread_map(callables, args=None, kwargs=None):
         t.start()
 
     return [t.output() for t in threads]
+
+
+def _is_parameter(item: ParamMeasT) -> bool:
+    # duck typed, since importing the parameter module here would make the
+    # utils depend on the instrument package. Parameters are callable as
+    # well, hence they are told apart from functions by their get method.
+    return hasattr(item, 'get')
+
+
+class ThreadPoolParamsCaller:
+    """
+    Gets parameters concurrently with a pool of threads, with one thread per
+    root instrument, such that the per call time approaches the time of
+    the slowest instrument rather than the sum over all instruments. The
+    parameters that share a root instrument are got one after the other in
+    the same thread in the order they are given, such that the commands
+    sent to each instrument stay in order.
+
+    Functions taking no arguments may be given in between the parameters.
+    They are called in the main thread after all the parameters before them
+    have been got and before any of the parameters after them are got.
+
+    The pool of threads is kept between calls and is shut down when the
+    caller is used as a context manager and the context exits, or when
+    :meth:`shutdown` is called:
+
+    >>> with ThreadPoolParamsCaller(dmm1.volt, dmm2.volt) as caller:
+    ...     for _ in range(10):
+    ...         results = caller()  # [(dmm1.volt, ...), (dmm2.volt, ...)]
+
+    Args:
+        *param_meas: The parameters to get and the functions to call.
+        max_workers: The maximum number of threads. By default one thread
+            per root instrument.
+    """
+
+    def __init__(self, *param_meas: ParamMeasT,
+                 max_workers: Optional[int] = None):
+        # runs of parameters between the functions, each split into the
+        # groups of parameters sharing a root instrument
+        self._steps: List[Union[Callable[[], None],
+                                List[List['_BaseParameter']]]] = []
+        groups: Dict[int, List['_BaseParameter']] = {}
+        for item in param_meas:
+            if _is_parameter(item):
+                param = cast('_BaseParameter', item)
+                root = param.root_instrument
+                key = id(root) if root is not None else id(param)
+                groups.setdefault(key, []).append(param)
+            elif callable(item):
+                if groups:
+                    self._steps.append(list(groups.values()))
+                    groups = {}
+                self._steps.append(item)
+        if groups:
+            self._steps.append(list(groups.values()))
+
+        if max_workers is None:
+            max_workers = max((len(step) for step in self._steps
+                               if isinstance(step, list)), default=1)
+        self._param_meas = tuple(param_meas)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='params_call')
+
+    def __call__(self) -> List[Tuple['_BaseParameter', Any]]:
+        """
+        Get the parameters and call the functions.
+
+        Returns:
+            A list of the parameters and their values in the order the
+            parameters were given.
+        """
+        values: Dict[int, List[Any]] = {}
+
+        def get_group(group: Sequence['_BaseParameter']) -> None:
+            for param in group:
+                values.setdefault(id(param), []).append(param.get())
+
+        for step in self._steps:
+            if not isinstance(step, list):
+                step()
+                continue
+            futures = [self._executor.submit(get_group, group)
+                       for group in step]
+            # let all the instruments finish before raising an error
+            wait(futures)
+            for future in futures:
+                future.result()
+
+        output: List[Tuple['_BaseParameter', Any]] = []
+        for item in self._param_meas:
+            if _is_parameter(item):
+                output.append((cast('_BaseParameter', item),
+                               values[id(item)].pop(0)))
+        return output
+
+    def shutdown(self) -> None:
+        """
+        Shut down the pool of threads.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ThreadPoolParamsCaller':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None:
+        self.shutdown()